@@ -6,17 +6,23 @@ handled downstream by lorchestra.
 """
 
 import uuid
+from collections.abc import Iterable
 from datetime import datetime, timezone
-from typing import Literal
+from typing import Any, Literal
 
 from pydantic import BaseModel, ConfigDict, Field
 
 from finalform import __version__
 from finalform.interpretation.interpreter import InterpretationResult
 from finalform.recoding.recoder import RecodedSection
-from finalform.registry.models import FormBindingSpec
+from finalform.registry.models import FormBindingSpec, MeasureSpec
 from finalform.scoring.engine import ScoringResult
 
+# (item_id, value, raw_answer, position, missing)
+ItemRow = tuple[str, int | float | None, Any, int | None, bool]
+# (scale_id, value, interpretation label)
+ScaleRow = tuple[str, float | None, str | None]
+
 
 class Source(BaseModel):
     """Source information for a measurement event."""
@@ -35,6 +41,8 @@ class Telemetry(BaseModel):
     final_form_version: str
     measure_spec: str
     form_binding_spec: str
+    measure_spec_fingerprint: str | None = None
+    form_binding_spec_fingerprint: str | None = None
     warnings: list[str] = Field(default_factory=list)
 
 
@@ -111,6 +119,7 @@ class MeasurementEventBuilder:
         timestamp: str,
         form_correlation_id: str | None = None,
         warnings: list[str] | None = None,
+        measure: MeasureSpec | None = None,
     ) -> MeasurementEvent:
         """Build a MeasurementEvent from processed data.
 
@@ -125,23 +134,101 @@ class MeasurementEventBuilder:
             timestamp: The measurement timestamp.
             form_correlation_id: Optional correlation ID.
             warnings: Optional list of processing warnings.
+            measure: Optional measure spec used for processing, recorded in
+                telemetry by fingerprint.
 
         Returns:
             A complete MeasurementEvent ready for JSON serialization.
         """
-        seed = f"{form_submission_id}:{recoded_section.measure_id}"
+        # Interpretation labels by scale (first interpretation wins)
+        labels: dict[str, str | None] = {}
+        for score in interpretation_result.scores:
+            labels.setdefault(score.scale_id, score.label)
+
+        return self.build_from_values(
+            measure_id=recoded_section.measure_id,
+            measure_version=recoded_section.measure_version,
+            items=[
+                (item.item_id, item.value, item.raw_answer, item.position, item.missing)
+                for item in recoded_section.items
+            ],
+            scales=[
+                (scale.scale_id, scale.value, labels.get(scale.scale_id))
+                for scale in scoring_result.scales
+            ],
+            binding_spec=binding_spec,
+            form_id=form_id,
+            form_submission_id=form_submission_id,
+            subject_id=subject_id,
+            timestamp=timestamp,
+            form_correlation_id=form_correlation_id,
+            warnings=warnings,
+            measure=measure,
+        )
+
+    def build_from_values(
+        self,
+        measure_id: str,
+        measure_version: str,
+        items: Iterable[ItemRow],
+        scales: Iterable[ScaleRow],
+        binding_spec: FormBindingSpec,
+        form_id: str,
+        form_submission_id: str,
+        subject_id: str,
+        timestamp: str,
+        form_correlation_id: str | None = None,
+        warnings: list[str] | None = None,
+        measure: MeasureSpec | None = None,
+    ) -> MeasurementEvent:
+        """Build a MeasurementEvent from plain item and scale rows.
+
+        Used by the fast processing path, which never builds the
+        intermediate stage results. See build() for the other arguments.
+
+        Args:
+            measure_id: The measure ID.
+            measure_version: The measure version.
+            items: (item_id, value, raw_answer, position, missing) per item.
+            scales: (scale_id, value, label) per scale.
+
+        Returns:
+            A complete MeasurementEvent ready for JSON serialization.
+        """
+        seed = f"{form_submission_id}:{measure_id}"
 
         # Build observations for items
-        item_observations = self._build_item_observations(recoded_section, seed)
+        observations = [
+            Observation(
+                schema="com.lifeos.observation.v1",
+                observation_id=self._generate_id(f"{seed}:item:{item_id}"),
+                measure_id=measure_id,
+                code=item_id,
+                kind="item",
+                value=value,
+                value_type=self._get_value_type(value),
+                raw_answer=str(raw_answer) if raw_answer is not None else None,
+                position=position,
+                missing=missing,
+            )
+            for item_id, value, raw_answer, position, missing in items
+        ]
 
         # Build observations for scales
-        scale_observations = self._build_scale_observations(
-            scoring_result, interpretation_result, seed
+        observations.extend(
+            Observation(
+                schema="com.lifeos.observation.v1",
+                observation_id=self._generate_id(f"{seed}:scale:{scale_id}"),
+                measure_id=measure_id,
+                code=scale_id,
+                kind="scale",
+                value=value,
+                value_type=self._get_value_type(value),
+                label=label,
+            )
+            for scale_id, value, label in scales
         )
 
-        # Combine all observations
-        observations = item_observations + scale_observations
-
         # Build source
         source = Source(
             form_id=form_id,
@@ -155,8 +242,10 @@ class MeasurementEventBuilder:
         telemetry = Telemetry(
             processed_at=datetime.now(timezone.utc).isoformat(),
             final_form_version=__version__,
-            measure_spec=f"{recoded_section.measure_id}@{recoded_section.measure_version}",
+            measure_spec=f"{measure_id}@{measure_version}",
             form_binding_spec=f"{binding_spec.binding_id}@{binding_spec.version}",
+            measure_spec_fingerprint=measure.fingerprint if measure is not None else None,
+            form_binding_spec_fingerprint=binding_spec.fingerprint,
             warnings=warnings or [],
         )
 
@@ -164,8 +253,8 @@ class MeasurementEventBuilder:
         return MeasurementEvent(
             schema="com.lifeos.measurement_event.v1",
             measurement_event_id=self._generate_id(seed),
-            measure_id=recoded_section.measure_id,
-            measure_version=recoded_section.measure_version,
+            measure_id=measure_id,
+            measure_version=measure_version,
             subject_id=subject_id,
             timestamp=timestamp,
             source=source,
@@ -173,63 +262,6 @@ class MeasurementEventBuilder:
             telemetry=telemetry,
         )
 
-    def _build_item_observations(
-        self,
-        recoded_section: RecodedSection,
-        seed: str,
-    ) -> list[Observation]:
-        """Build observations for recoded items."""
-        observations: list[Observation] = []
-
-        for item in recoded_section.items:
-            value_type = self._get_value_type(item.value)
-
-            obs = Observation(
-                schema="com.lifeos.observation.v1",
-                observation_id=self._generate_id(f"{seed}:item:{item.item_id}"),
-                measure_id=item.measure_id,
-                code=item.item_id,
-                kind="item",
-                value=item.value,
-                value_type=value_type,
-                raw_answer=str(item.raw_answer) if item.raw_answer is not None else None,
-                position=item.position,
-                missing=item.missing,
-            )
-            observations.append(obs)
-
-        return observations
-
-    def _build_scale_observations(
-        self,
-        scoring_result: ScoringResult,
-        interpretation_result: InterpretationResult,
-        seed: str,
-    ) -> list[Observation]:
-        """Build observations for scale scores."""
-        observations: list[Observation] = []
-
-        for scale_score in scoring_result.scales:
-            # Get interpretation label
-            interpreted = interpretation_result.get_score(scale_score.scale_id)
-            label = interpreted.label if interpreted else None
-
-            value_type = self._get_value_type(scale_score.value)
-
-            obs = Observation(
-                schema="com.lifeos.observation.v1",
-                observation_id=self._generate_id(f"{seed}:scale:{scale_score.scale_id}"),
-                measure_id=scoring_result.measure_id,
-                code=scale_score.scale_id,
-                kind="scale",
-                value=scale_score.value,
-                value_type=value_type,
-                label=label,
-            )
-            observations.append(obs)
-
-        return observations
-
     def _get_value_type(
         self,
         value: int | float | str | None,
@@ -45,6 +45,50 @@ def main(
     pass
 
 
+def _resolve_registry_paths(
+    measure_registry: Path | None,
+    form_binding_registry: Path | None,
+) -> tuple[Path, Path]:
+    """Resolve registry paths from options, environment and global config."""
+    if measure_registry is None:
+        env_path = os.environ.get("FINAL_FORM_MEASURE_REGISTRY")
+        if env_path:
+            measure_registry = Path(env_path)
+        else:
+            measure_registry = Path("measure-registry")
+
+    if form_binding_registry is None:
+        env_path = os.environ.get("FINAL_FORM_BINDING_REGISTRY")
+        if env_path:
+            form_binding_registry = Path(env_path)
+        else:
+            # Check global config
+            global_config = load_global_config()
+            if global_config.default_form_binding_registry_path:
+                form_binding_registry = Path(global_config.default_form_binding_registry_path)
+            else:
+                form_binding_registry = Path("form-binding-registry")
+
+    # Resolve measure registry from config if still default
+    if str(measure_registry) == "measure-registry":
+        global_config = load_global_config()
+        if global_config.default_measure_registry_path:
+            measure_registry = Path(global_config.default_measure_registry_path)
+
+    return measure_registry, form_binding_registry
+
+
+def _default_schema_paths() -> tuple[Path | None, Path | None]:
+    """Return the measure and binding schema paths if they exist."""
+    schema_dir = Path("schemas")
+    measure_schema = schema_dir / "measure_spec.schema.json"
+    binding_schema = schema_dir / "form_binding_spec.schema.json"
+    return (
+        measure_schema if measure_schema.exists() else None,
+        binding_schema if binding_schema.exists() else None,
+    )
+
+
 @app.command()
 def init(
     source: Annotated[
@@ -180,6 +224,14 @@ def run(
         Path | None,
         typer.Option("--diagnostics", "-d", help="Diagnostics output JSONL path"),
     ] = None,
+    snapshot: Annotated[
+        Path | None,
+        typer.Option(
+            "--snapshot",
+            envvar="FINAL_FORM_REGISTRY_SNAPSHOT",
+            help="Precompiled registry snapshot (see 'finalform registry compile')",
+        ),
+    ] = None,
 ) -> None:
     """Process form responses and emit MeasurementEvents.
 
@@ -189,32 +241,9 @@ def run(
     - Binding spec ID (required, no auto-detection)
     """
     # Resolve registry paths
-    if measure_registry is None:
-        env_path = os.environ.get("FINAL_FORM_MEASURE_REGISTRY")
-        if env_path:
-            measure_registry = Path(env_path)
-        else:
-            measure_registry = Path("measure-registry")
-
-
-
-    if form_binding_registry is None:
-        env_path = os.environ.get("FINAL_FORM_BINDING_REGISTRY")
-        if env_path:
-            form_binding_registry = Path(env_path)
-        else:
-             # Check global config
-            global_config = load_global_config()
-            if global_config.default_form_binding_registry_path:
-                form_binding_registry = Path(global_config.default_form_binding_registry_path)
-            else:
-                form_binding_registry = Path("form-binding-registry")
-
-    # Resolve measure registry from config if still default
-    if str(measure_registry) == "measure-registry":
-         global_config = load_global_config()
-         if global_config.default_measure_registry_path:
-             measure_registry = Path(global_config.default_measure_registry_path)
+    measure_registry, form_binding_registry = _resolve_registry_paths(
+        measure_registry, form_binding_registry
+    )
 
     # Validate paths exist
     if not input_path.exists():
@@ -237,11 +266,11 @@ def run(
     console.print(f"  Binding Registry: {form_binding_registry}")
     if diagnostics:
         console.print(f"  Diagnostics: {diagnostics}")
+    if snapshot:
+        console.print(f"  Snapshot: {snapshot}")
 
     # Resolve schema paths
-    schema_dir = Path("schemas")
-    measure_schema = schema_dir / "measure_spec.schema.json"
-    binding_schema = schema_dir / "form_binding_spec.schema.json"
+    measure_schema, binding_schema = _default_schema_paths()
 
     # Initialize pipeline
     try:
@@ -250,8 +279,9 @@ def run(
             binding_registry_path=form_binding_registry,
             binding_id=binding,
             binding_version=binding_version,
-            measure_schema_path=measure_schema if measure_schema.exists() else None,
-            binding_schema_path=binding_schema if binding_schema.exists() else None,
+            measure_schema_path=measure_schema,
+            binding_schema_path=binding_schema,
+            snapshot_path=snapshot,
         )
         pipeline = Pipeline(config)
     except Exception as e:
@@ -349,7 +379,7 @@ def validate(
     """Validate a spec file against its schema."""
     import json
 
-    import jsonschema
+    from finalform.registry.schema import get_validator, schema_errors
 
     if not spec_path.exists():
         console.print(f"[red]Error:[/red] Spec file not found: {spec_path}")
@@ -373,14 +403,153 @@ def validate(
     with open(spec_path) as f:
         spec = json.load(f)
 
-    with open(schema_path) as f:
-        schema = json.load(f)
+    errors = schema_errors(get_validator(schema_path), spec)
+    if errors:
+        for error in errors:
+            console.print(f"[red]Invalid:[/red] {error}")
+        raise typer.Exit(1)
+    console.print(f"[green]Valid:[/green] {spec_path}")
+
+
+registry_app = typer.Typer(
+    help="Registry maintenance commands.",
+    no_args_is_help=True,
+)
+app.add_typer(registry_app, name="registry")
+
+
+@registry_app.command("compile")
+def registry_compile(
+    output_path: Annotated[
+        Path,
+        typer.Option("--out", "-o", help="Snapshot output path"),
+    ],
+    measure_registry: Annotated[
+        Path | None,
+        typer.Option(
+            "--measure-registry",
+            envvar="FINAL_FORM_MEASURE_REGISTRY",
+            help="Path to measure registry",
+        ),
+    ] = None,
+    form_binding_registry: Annotated[
+        Path | None,
+        typer.Option(
+            "--form-binding-registry",
+            envvar="FINAL_FORM_BINDING_REGISTRY",
+            help="Path to form binding registry",
+        ),
+    ] = None,
+) -> None:
+    """Compile both registries into a single precompiled snapshot file.
+
+    The snapshot holds every measure and binding spec already validated
+    and parsed. Pass it to 'finalform run --snapshot' to skip spec loading
+    at startup. Snapshots are rejected once any spec file changes.
+    """
+    from finalform.registry.snapshot import compile_snapshot, write_snapshot
+
+    measure_registry, form_binding_registry = _resolve_registry_paths(
+        measure_registry, form_binding_registry
+    )
+    if not measure_registry.exists():
+        console.print(f"[red]Error:[/red] Measure registry not found: {measure_registry}")
+        raise typer.Exit(1)
+    if not form_binding_registry.exists():
+        console.print(f"[red]Error:[/red] Form binding registry not found: {form_binding_registry}")
+        raise typer.Exit(1)
+
+    measure_schema, binding_schema = _default_schema_paths()
 
     try:
-        jsonschema.validate(spec, schema)
-        console.print(f"[green]Valid:[/green] {spec_path}")
-    except jsonschema.ValidationError as e:
-        console.print(f"[red]Invalid:[/red] {e.message}")
+        snapshot = compile_snapshot(
+            measure_registry,
+            form_binding_registry,
+            measure_schema_path=measure_schema,
+            binding_schema_path=binding_schema,
+        )
+        write_snapshot(snapshot, output_path)
+    except Exception as e:
+        console.print(f"[red]Error compiling registry:[/red] {e}")
+        raise typer.Exit(1)
+
+    console.print(f"[green]✓[/green] Compiled registry snapshot: {output_path}")
+    console.print(f"  Measures: {len(snapshot.measure_files)}")
+    console.print(f"  Bindings: {len(snapshot.binding_files)}")
+
+
+@registry_app.command("check")
+def registry_check(
+    measure_registry: Annotated[
+        Path | None,
+        typer.Option(
+            "--measure-registry",
+            envvar="FINAL_FORM_MEASURE_REGISTRY",
+            help="Path to measure registry",
+        ),
+    ] = None,
+    form_binding_registry: Annotated[
+        Path | None,
+        typer.Option(
+            "--form-binding-registry",
+            envvar="FINAL_FORM_BINDING_REGISTRY",
+            help="Path to form binding registry",
+        ),
+    ] = None,
+    workers: Annotated[
+        int | None,
+        typer.Option("--workers", "-w", help="Worker processes (default: CPU count)"),
+    ] = None,
+    json_output: Annotated[
+        bool,
+        typer.Option("--json", help="Print the report as JSON"),
+    ] = False,
+) -> None:
+    """Check every spec in both registries for consistency.
+
+    Validates each spec against its schema and the domain rules, and
+    checks that every binding references existing measures and items and
+    that interpretation bands have no gaps or overlaps. Exits with status 1
+    if any errors are found; warnings alone do not fail the check.
+    """
+    from finalform.registry.check import check_registry
+
+    measure_registry, form_binding_registry = _resolve_registry_paths(
+        measure_registry, form_binding_registry
+    )
+    if not measure_registry.exists():
+        console.print(f"[red]Error:[/red] Measure registry not found: {measure_registry}")
+        raise typer.Exit(1)
+    if not form_binding_registry.exists():
+        console.print(f"[red]Error:[/red] Form binding registry not found: {form_binding_registry}")
+        raise typer.Exit(1)
+
+    measure_schema, binding_schema = _default_schema_paths()
+    report = check_registry(
+        measure_registry,
+        form_binding_registry,
+        measure_schema_path=measure_schema,
+        binding_schema_path=binding_schema,
+        max_workers=workers,
+    )
+
+    if json_output:
+        typer.echo(report.model_dump_json(indent=2))
+    else:
+        for issue in report.issues:
+            color = "red" if issue.severity == "error" else "yellow"
+            console.print(
+                f"[{color}]{issue.severity}[/{color}] {issue.kind} "
+                f"{issue.spec_id}@{issue.version} ({issue.check}): {issue.message}"
+            )
+        status = "[green]✓[/green]" if report.ok else "[red]✗[/red]"
+        console.print(
+            f"{status} Checked {report.measures_checked} measures and "
+            f"{report.bindings_checked} bindings in {report.total_seconds:.2f}s: "
+            f"{len(report.errors)} errors, {len(report.warnings)} warnings"
+        )
+
+    if not report.ok:
         raise typer.Exit(1)
 
 
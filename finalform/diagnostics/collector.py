@@ -4,7 +4,8 @@ Collects errors, warnings, and quality metrics throughout the pipeline
 and produces a complete diagnostic report for each form submission.
 """
 
-from typing import Literal
+from collections.abc import Iterable
+from typing import Any, Literal
 
 from finalform.diagnostics.models import (
     DiagnosticError,
@@ -16,7 +17,7 @@ from finalform.diagnostics.models import (
 )
 from finalform.mapping.mapper import MappingResult
 from finalform.recoding.recoder import RecodingResult
-from finalform.scoring.engine import ScoringResult
+from finalform.scoring.engine import ScaleOutcome, ScaleScore, ScoringResult
 from finalform.validation.checks import ValidationResult
 
 
@@ -145,13 +146,29 @@ class DiagnosticsCollector:
         Args:
             mapping_result: The result from the mapping stage.
         """
-        for section in mapping_result.sections:
-            self._ensure_measure(section.measure_id, section.measure_version)
-            inst = self._measures[section.measure_id]
-            inst.measure_version = section.measure_version
+        self.collect_mapped(
+            [(section.measure_id, section.measure_version) for section in mapping_result.sections],
+            mapping_result.unmapped_fields,
+        )
+
+    def collect_mapped(
+        self,
+        sections: Iterable[tuple[str, str]],
+        unmapped_fields: Iterable[Any],
+    ) -> None:
+        """Collect mapping diagnostics from plain values.
+
+        Args:
+            sections: (measure_id, measure_version) of each mapped section.
+            unmapped_fields: Form field keys not mapped to any item.
+        """
+        for measure_id, measure_version in sections:
+            self._ensure_measure(measure_id, measure_version)
+            inst = self._measures[measure_id]
+            inst.measure_version = measure_version
 
         # Collect warnings for unmapped fields
-        for field_key in mapping_result.unmapped_fields:
+        for field_key in unmapped_fields:
             self.add_warning(
                 stage="mapping",
                 code="UNMAPPED_FIELD",
@@ -169,17 +186,59 @@ class DiagnosticsCollector:
             recoding_result: The result from the recoding stage.
         """
         for section in recoding_result.sections:
-            self._ensure_measure(section.measure_id, section.measure_version)
-
-            for item in section.items:
-                if item.missing:
-                    self.add_warning(
-                        stage="recoding",
-                        code="MISSING_VALUE",
-                        message=f"Item {item.item_id} has missing value",
-                        measure_id=section.measure_id,
-                        item_id=item.item_id,
-                    )
+            self.collect_missing_values(
+                section.measure_id,
+                section.measure_version,
+                [item.item_id for item in section.items if item.missing],
+            )
+
+    def collect_missing_values(
+        self,
+        measure_id: str,
+        measure_version: str,
+        missing_item_ids: Iterable[str],
+    ) -> None:
+        """Collect recoding diagnostics for one section from plain values.
+
+        Args:
+            measure_id: The measure ID.
+            measure_version: The measure version.
+            missing_item_ids: Items whose recoded value is missing.
+        """
+        self._ensure_measure(measure_id, measure_version)
+
+        for item_id in missing_item_ids:
+            self.add_warning(
+                stage="recoding",
+                code="MISSING_VALUE",
+                message=f"Item {item_id} has missing value",
+                measure_id=measure_id,
+                item_id=item_id,
+            )
+
+    def collect_recoding_failures(
+        self,
+        measure_id: str,
+        measure_version: str,
+        failures: Iterable[tuple[str, str]],
+    ) -> None:
+        """Collect errors for a section's answers that could not be recoded.
+
+        Args:
+            measure_id: The measure ID.
+            measure_version: The measure version.
+            failures: (item_id, error message) for each failed item.
+        """
+        self._ensure_measure(measure_id, measure_version)
+
+        for item_id, message in failures:
+            self.add_error(
+                stage="recoding",
+                code="RECODING_ERROR",
+                message=message,
+                measure_id=measure_id,
+                item_id=item_id,
+            )
 
     def collect_from_validation(
         self,
@@ -192,10 +251,32 @@ class DiagnosticsCollector:
             validation_result: The result from the validation stage.
             measure_id: The measure ID being validated.
         """
+        self.collect_validation(
+            measure_id,
+            validation_result.errors,
+            validation_result.missing_items,
+            validation_result.out_of_range_items,
+        )
+
+    def collect_validation(
+        self,
+        measure_id: str,
+        errors: list[str],
+        missing_items: list[str],
+        out_of_range_items: list[str],
+    ) -> None:
+        """Collect validation diagnostics from plain values.
+
+        Args:
+            measure_id: The measure ID being validated.
+            errors: Validation error messages.
+            missing_items: Missing item IDs.
+            out_of_range_items: Out-of-range item IDs.
+        """
         self._ensure_measure(measure_id)
 
         # Collect errors from the errors list
-        for error_msg in validation_result.errors:
+        for error_msg in errors:
             self.add_error(
                 stage="validation",
                 code="VALIDATION_ERROR",
@@ -204,7 +285,7 @@ class DiagnosticsCollector:
             )
 
         # Collect warnings for missing items
-        for item_id in validation_result.missing_items:
+        for item_id in missing_items:
             self.add_warning(
                 stage="validation",
                 code="VALIDATION_MISSING",
@@ -214,9 +295,9 @@ class DiagnosticsCollector:
             )
 
         # Collect errors for out-of-range items (if not already in errors)
-        for item_id in validation_result.out_of_range_items:
+        for item_id in out_of_range_items:
             # Check if there's already an error message for this item
-            has_error = any(item_id in e for e in validation_result.errors)
+            has_error = any(item_id in e for e in errors)
             if not has_error:
                 self.add_error(
                     stage="validation",
@@ -235,15 +316,32 @@ class DiagnosticsCollector:
         Args:
             scoring_result: The result from the scoring stage.
         """
-        self._ensure_measure(scoring_result.measure_id, scoring_result.measure_version)
+        self.collect_scales(
+            scoring_result.measure_id, scoring_result.measure_version, scoring_result.scales
+        )
+
+    def collect_scales(
+        self,
+        measure_id: str,
+        measure_version: str,
+        scales: Iterable[ScaleScore | ScaleOutcome],
+    ) -> None:
+        """Collect scoring diagnostics from scale scores or outcomes.
+
+        Args:
+            measure_id: The measure ID.
+            measure_version: The measure version.
+            scales: The scored scales.
+        """
+        self._ensure_measure(measure_id, measure_version)
 
-        for scale in scoring_result.scales:
+        for scale in scales:
             if scale.error:
                 self.add_error(
                     stage="scoring",
                     code="SCORING_ERROR",
                     message=scale.error,
-                    measure_id=scoring_result.measure_id,
+                    measure_id=measure_id,
                     details={"scale_id": scale.scale_id},
                 )
             if scale.prorated:
@@ -251,7 +349,7 @@ class DiagnosticsCollector:
                     stage="scoring",
                     code="PRORATED_SCORE",
                     message=f"Scale {scale.scale_id} was prorated due to missing items",
-                    measure_id=scoring_result.measure_id,
+                    measure_id=measure_id,
                     details={
                         "scale_id": scale.scale_id,
                         "missing_items": scale.missing_items,
@@ -5,31 +5,92 @@ and checklists through the mapping, recoding, validation, scoring,
 interpretation, and event building pipeline.
 """
 
-from typing import Any
+from collections.abc import Collection
+from dataclasses import dataclass
+from typing import Any, Literal
 
 from finalform.builders import MeasurementEvent, MeasurementEventBuilder
 from finalform.core.diagnostics import ProcessingStatus
 from finalform.core.models import ProcessingResult
 from finalform.diagnostics import DiagnosticsCollector
 from finalform.interpretation import Interpreter
+from finalform.interpretation.interpreter import find_band
 from finalform.mapping import Mapper
-from finalform.recoding import Recoder
+from finalform.recoding import RecodedSection, Recoder, RecodingError, RecodingResult
+from finalform.recoding.recoder import unknown_item_error
 from finalform.registry.models import FormBindingSpec, MeasureSpec
 from finalform.scoring import ScoringEngine
 from finalform.validation import Validator
 
+ProcessingMode = Literal["fast", "fused", "staged"]
+
+
+@dataclass(slots=True)
+class _FormContext:
+    """Inputs and outputs shared by the stages for one form response."""
+
+    form_response: dict[str, Any]
+    binding_spec: FormBindingSpec
+    measures: dict[str, MeasureSpec]
+    measure_ids: Collection[str] | None
+    form_id: str
+    form_submission_id: str
+    subject_id: str
+    timestamp: str
+    builder: MeasurementEventBuilder
+    collector: DiagnosticsCollector
+    events: list[MeasurementEvent]
+    warnings: list[str]
+
+
+@dataclass(slots=True)
+class _SectionValues:
+    """One measure's mapped and recoded answers on the fast path."""
+
+    measure: MeasureSpec
+    measure_id: str
+    measure_version: str
+    item_ids: list[str]
+    raw_answers: list[Any]
+    positions: list[Any]
+    values: list[int | float | None]  # None if missing
+    # (missing items, out-of-range items, errors) once validated
+    validation: tuple[list[str], list[str], list[str]] | None = None
+
 
 class QuestionnaireProcessor:
     """Processor for questionnaire-type measures.
 
     Handles clinical questionnaires, scales, inventories, and checklists.
     Implements the DomainProcessor protocol.
+
+    Measures fail independently: answers that cannot be recoded become
+    RECODING_ERROR diagnostics on their measure, and an unexpected error
+    while scoring or building one measure becomes a PIPELINE_ERROR on that
+    measure. A failed measure produces no event; the form's other measures
+    are processed as usual, and the failed one can be re-run on its own
+    with process(..., measure_ids=[...]).
     """
 
     SUPPORTED_KINDS = ("questionnaire", "scale", "inventory", "checklist")
+    MODES: tuple[ProcessingMode, ...] = ("fast", "fused", "staged")
+
+    def __init__(self, mode: ProcessingMode = "fast") -> None:
+        """Initialize the questionnaire processor.
 
-    def __init__(self) -> None:
-        """Initialize the questionnaire processor."""
+        Args:
+            mode: "fast" passes plain values between stages and only builds
+                the public output models; "fused" also maps, recodes and
+                validates each answer in one step; "staged" runs each
+                stage's public API (MappingResult, RecodingResult, ...).
+                All modes produce the same events and diagnostics.
+
+        Raises:
+            ValueError: If mode is unknown.
+        """
+        if mode not in self.MODES:
+            raise ValueError(f"Unknown processing mode: {mode!r} (expected one of {self.MODES})")
+        self.mode = mode
         self.mapper = Mapper()
         self.recoder = Recoder()
         self.validator = Validator()
@@ -47,6 +108,7 @@ class QuestionnaireProcessor:
         binding_spec: FormBindingSpec,
         measures: dict[str, MeasureSpec],
         deterministic_ids: bool = False,
+        measure_ids: Collection[str] | None = None,
     ) -> ProcessingResult:
         """Process a questionnaire form response.
 
@@ -60,6 +122,8 @@ class QuestionnaireProcessor:
             binding_spec: The form binding specification.
             measures: Dict mapping measure_id to MeasureSpec.
             deterministic_ids: If True, generate deterministic UUIDs (for testing).
+            measure_ids: Optional measure IDs to process. Only their binding
+                sections are mapped; other measures produce no events.
 
         Returns:
             ProcessingResult containing MeasurementEvents and diagnostics.
@@ -83,91 +147,27 @@ class QuestionnaireProcessor:
         events: list[MeasurementEvent] = []
         warnings: list[str] = []
 
+        context = _FormContext(
+            form_response=form_response,
+            binding_spec=binding_spec,
+            measures=measures,
+            measure_ids=measure_ids,
+            form_id=form_id,
+            form_submission_id=form_submission_id,
+            subject_id=subject_id,
+            timestamp=timestamp,
+            builder=builder,
+            collector=collector,
+            events=events,
+            warnings=warnings,
+        )
         try:
-            # 1. Map form items to measure items
-            mapping_result = self.mapper.map(
-                form_response=form_response,
-                binding_spec=binding_spec,
-            )
-            collector.collect_from_mapping(mapping_result)
-
-            # 2. Recode values for each measure section
-            recoding_result = self.recoder.recode(
-                mapping_result=mapping_result,
-                measures=measures,
-            )
-            collector.collect_from_recoding(recoding_result)
-
-            # 3. Process each measure section
-            for section in recoding_result.sections:
-                measure = measures[section.measure_id]
-
-                # 3a. Validate
-                validation_result = self.validator.validate(
-                    section=section,
-                    measure=measure,
-                )
-                collector.collect_from_validation(validation_result, section.measure_id)
-
-                # Set quality metrics
-                collector.set_measure_quality(
-                    measure_id=section.measure_id,
-                    items_total=len(measure.items),
-                    items_present=len([i for i in section.items if not i.missing]),
-                    missing_items=validation_result.missing_items,
-                    out_of_range_items=validation_result.out_of_range_items,
-                    prorated_scales=[],  # Will be filled from scoring
-                )
-
-                # 3b. Score
-                scoring_result = self.scoring_engine.score(
-                    section=section,
-                    measure=measure,
-                )
-                collector.collect_from_scoring(scoring_result)
-
-                # Update prorated scales
-                prorated = [s.scale_id for s in scoring_result.scales if s.prorated]
-                if prorated:
-                    collector.set_measure_quality(
-                        measure_id=section.measure_id,
-                        items_total=len(measure.items),
-                        items_present=len([i for i in section.items if not i.missing]),
-                        missing_items=validation_result.missing_items,
-                        out_of_range_items=validation_result.out_of_range_items,
-                        prorated_scales=prorated,
-                    )
-
-                # Collect warnings for prorated scores
-                section_warnings: list[str] = []
-                for scale in scoring_result.scales:
-                    if scale.prorated:
-                        section_warnings.append(
-                            f"Scale {scale.scale_id} was prorated "
-                            f"(missing: {scale.missing_items})"
-                        )
-
-                # 3c. Interpret
-                interpretation_result = self.interpreter.interpret(
-                    scoring_result=scoring_result,
-                    measure=measure,
-                )
-
-                # 3d. Build MeasurementEvent
-                event = builder.build(
-                    recoded_section=section,
-                    scoring_result=scoring_result,
-                    interpretation_result=interpretation_result,
-                    binding_spec=binding_spec,
-                    form_id=form_id,
-                    form_submission_id=form_submission_id,
-                    subject_id=subject_id,
-                    timestamp=timestamp,
-                    warnings=section_warnings if section_warnings else None,
-                )
-                events.append(event)
-                warnings.extend(section_warnings)
-
+            if self.mode == "fused":
+                self._process_fused(context)
+            elif self.mode == "staged":
+                self._process_staged(context)
+            else:
+                self._process_fast(context)
         except Exception as e:
             collector.add_error(
                 stage="building",
@@ -188,6 +188,408 @@ class QuestionnaireProcessor:
             success=diagnostics.status in (ProcessingStatus.SUCCESS, ProcessingStatus.PARTIAL),
         )
 
+    def _process_fast(self, context: _FormContext) -> None:
+        """Run the stages on plain values, building only the output models.
+
+        Mirrors _process_staged step for step, so events, diagnostics and
+        the measures that fail are the same.
+        """
+        collector = context.collector
+
+        # 1. Map form items to binding slots
+        plan, filled, unmapped_fields = self.mapper.route(
+            context.form_response, context.binding_spec, context.measure_ids
+        )
+        mapped: list[tuple[str, str, list[str], list[dict[str, Any]]]] = []
+        for section_plan in plan.sections:
+            item_ids: list[str] = []
+            form_items: list[dict[str, Any]] = []
+            for slot in section_plan.slots:
+                form_item = filled[slot]
+                if form_item is not None:
+                    item_ids.append(plan.slot_item_ids[slot])
+                    form_items.append(form_item)
+            # Only sections with at least some mapped items
+            if form_items:
+                mapped.append(
+                    (section_plan.measure_id, section_plan.measure_version, item_ids, form_items)
+                )
+        collector.collect_mapped(
+            [(measure_id, measure_version) for measure_id, measure_version, _, _ in mapped],
+            unmapped_fields,
+        )
+
+        # 2. Recode every section before processing any of them
+        sections: list[_SectionValues] = []
+        for measure_id, measure_version, item_ids, form_items in mapped:
+            measure = context.measures.get(measure_id)
+            if measure is None:
+                self._measure_not_found(collector, measure_id)
+                continue
+            raw_answers = [
+                item["answer"] if "answer" in item else item.get("value") for item in form_items
+            ]
+            values, failures = self.recoder.recode_outcomes(item_ids, raw_answers, measure)
+            if failures:
+                collector.collect_recoding_failures(measure_id, measure_version, failures)
+                continue
+            sections.append(
+                _SectionValues(
+                    measure=measure,
+                    measure_id=measure_id,
+                    measure_version=measure_version,
+                    item_ids=item_ids,
+                    raw_answers=raw_answers,
+                    positions=[item.get("position") for item in form_items],
+                    values=values,
+                )
+            )
+        self._finish_sections(context, sections)
+
+    def _process_fused(self, context: _FormContext) -> None:
+        """Map, recode and validate each mapped answer in a single visit.
+
+        After routing, every filled binding slot is recoded (the recoder
+        range-checks numeric answers) and recorded as missing or present in
+        one step, so validation needs no separate pass. Diagnostics match
+        _process_staged.
+        """
+        collector = context.collector
+        recoder = self.recoder
+
+        # 1. Map form items to binding slots
+        plan, filled, unmapped_fields = self.mapper.route(
+            context.form_response, context.binding_spec, context.measure_ids
+        )
+        slot_item_ids = plan.slot_item_ids
+        # Only sections with at least some mapped items
+        section_plans = [
+            section_plan
+            for section_plan in plan.sections
+            if any(filled[slot] is not None for slot in section_plan.slots)
+        ]
+        collector.collect_mapped(
+            [(sp.measure_id, sp.measure_version) for sp in section_plans], unmapped_fields
+        )
+
+        # 2. Recode and validate every section before processing any of them
+        sections: list[_SectionValues] = []
+        for section_plan in section_plans:
+            measure = context.measures.get(section_plan.measure_id)
+            if measure is None:
+                self._measure_not_found(collector, section_plan.measure_id)
+                continue
+            measure_plan = measure.plan
+            items_by_id = measure_plan.items_by_id
+            fingerprint = measure.fingerprint if recoder.memo is not None else ""
+
+            item_ids: list[str] = []
+            raw_answers: list[Any] = []
+            positions: list[Any] = []
+            values: list[int | float | None] = []
+            missing_items: set[str] = set()
+            failures: list[tuple[str, str]] = []
+            for slot in section_plan.slots:
+                form_item = filled[slot]
+                if form_item is None:
+                    continue
+                item_id = slot_item_ids[slot]
+                if "answer" in form_item:
+                    raw_answer = form_item["answer"]
+                else:
+                    raw_answer = form_item.get("value")
+                item_plan = items_by_id.get(item_id)
+                if item_plan is None:
+                    failures.append((item_id, unknown_item_error(measure_plan, item_id)))
+                    continue
+                value, error = recoder.recode_outcome(raw_answer, item_plan, fingerprint)
+
+                if error is not None:
+                    failures.append((item_id, error))
+                    continue
+                # recode_outcome() already rejects numbers outside the
+                # item's range, and response values lie within it, so a
+                # recoded value is never out of range
+                if value is None:
+                    missing_items.add(item_id)
+                item_ids.append(item_id)
+                raw_answers.append(raw_answer)
+                positions.append(form_item.get("position"))
+                values.append(value)
+
+            if failures:
+                collector.collect_recoding_failures(
+                    section_plan.measure_id, section_plan.measure_version, failures
+                )
+                continue
+
+            # Expected items that no slot filled are missing too
+            missing_items.update(measure_plan.item_ids.difference(item_ids))
+            sections.append(
+                _SectionValues(
+                    measure=measure,
+                    measure_id=section_plan.measure_id,
+                    measure_version=section_plan.measure_version,
+                    item_ids=item_ids,
+                    raw_answers=raw_answers,
+                    positions=positions,
+                    values=values,
+                    validation=(sorted(missing_items), [], []),
+                )
+            )
+        self._finish_sections(context, sections)
+
+    def _finish_sections(self, context: _FormContext, sections: list[_SectionValues]) -> None:
+        """Validate (unless already done), score, interpret and build each section."""
+        collector = context.collector
+        for section in sections:
+            collector.collect_missing_values(
+                section.measure_id,
+                section.measure_version,
+                [
+                    item_id
+                    for item_id, value in zip(section.item_ids, section.values)
+                    if value is None
+                ],
+            )
+
+        # 3. Process each measure section; one failing leaves the others
+        for section in sections:
+            try:
+                self._finish_section(context, section)
+            except Exception as e:
+                self._measure_failed(collector, section.measure_id, e)
+
+    def _finish_section(self, context: _FormContext, section: _SectionValues) -> None:
+        """Validate (unless already done), score, interpret and build one section."""
+        collector = context.collector
+        measure = section.measure
+        missing = [value is None for value in section.values]
+        items_present = missing.count(False)
+
+        # 3a. Validate
+        if section.validation is None:
+            section.validation = self.validator.check_values(
+                measure.plan, section.item_ids, section.values, missing
+            )
+        missing_items, out_of_range_items, errors = section.validation
+        collector.collect_validation(
+            section.measure_id, errors, missing_items, out_of_range_items
+        )
+        collector.set_measure_quality(
+            measure_id=section.measure_id,
+            items_total=len(measure.items),
+            items_present=items_present,
+            missing_items=missing_items,
+            out_of_range_items=out_of_range_items,
+            prorated_scales=[],
+        )
+
+        # 3b. Score
+        scales = self.scoring_engine.score_values(
+            dict(zip(section.item_ids, section.values)), measure
+        )
+        collector.collect_scales(section.measure_id, section.measure_version, scales)
+
+        prorated = [scale.scale_id for scale in scales if scale.prorated]
+        if prorated:
+            collector.set_measure_quality(
+                measure_id=section.measure_id,
+                items_total=len(measure.items),
+                items_present=items_present,
+                missing_items=missing_items,
+                out_of_range_items=out_of_range_items,
+                prorated_scales=prorated,
+            )
+        section_warnings = [
+            f"Scale {scale.scale_id} was prorated (missing: {scale.missing_items})"
+            for scale in scales
+            if scale.prorated
+        ]
+
+        # 3c. Interpret (the first score for a scale ID labels it)
+        labels: dict[str, str | None] = {}
+        for scale in scales:
+            if scale.scale_id in labels:
+                continue
+            scale_plan = measure.plan.scales_by_id.get(scale.scale_id)
+            band = (
+                find_band(scale_plan, scale.value)
+                if scale.value is not None and scale_plan is not None
+                else None
+            )
+            labels[scale.scale_id] = band.label if band is not None else None
+
+        # 3d. Build MeasurementEvent
+        event = context.builder.build_from_values(
+            measure_id=section.measure_id,
+            measure_version=section.measure_version,
+            items=zip(
+                section.item_ids,
+                section.values,
+                section.raw_answers,
+                section.positions,
+                missing,
+            ),
+            scales=[(scale.scale_id, scale.value, labels[scale.scale_id]) for scale in scales],
+            binding_spec=context.binding_spec,
+            form_id=context.form_id,
+            form_submission_id=context.form_submission_id,
+            subject_id=context.subject_id,
+            timestamp=context.timestamp,
+            warnings=section_warnings if section_warnings else None,
+            measure=measure,
+        )
+        context.events.append(event)
+        context.warnings.extend(section_warnings)
+
+    def _process_staged(self, context: _FormContext) -> None:
+        """Run each stage through its public API."""
+        collector = context.collector
+
+        # 1. Map form items to measure items
+        mapping_result = self.mapper.map(
+            form_response=context.form_response,
+            binding_spec=context.binding_spec,
+            measure_ids=context.measure_ids,
+        )
+        collector.collect_from_mapping(mapping_result)
+
+        # 2. Recode values for each measure section
+        sections: list[tuple[RecodedSection, MeasureSpec]] = []
+        for mapped_section in mapping_result.sections:
+            measure = context.measures.get(mapped_section.measure_id)
+            if measure is None:
+                self._measure_not_found(collector, mapped_section.measure_id)
+                continue
+            try:
+                section = self.recoder.recode_section(mapped_section, measure)
+            except RecodingError:
+                # Report every answer that failed, not just the first
+                _, failures = self.recoder.recode_outcomes(
+                    [item.item_id for item in mapped_section.items],
+                    [item.raw_answer for item in mapped_section.items],
+                    measure,
+                )
+                collector.collect_recoding_failures(
+                    mapped_section.measure_id, mapped_section.measure_version, failures
+                )
+                continue
+            sections.append((section, measure))
+        collector.collect_from_recoding(
+            RecodingResult(
+                form_id=mapping_result.form_id,
+                form_submission_id=mapping_result.form_submission_id,
+                subject_id=mapping_result.subject_id,
+                timestamp=mapping_result.timestamp,
+                sections=[section for section, _ in sections],
+            )
+        )
+
+        # 3. Process each measure section; one failing leaves the others
+        for section, measure in sections:
+            try:
+                self._process_staged_section(context, section, measure)
+            except Exception as e:
+                self._measure_failed(collector, section.measure_id, e)
+
+    def _process_staged_section(
+        self,
+        context: _FormContext,
+        section: RecodedSection,
+        measure: MeasureSpec,
+    ) -> None:
+        """Validate, score, interpret and build one recoded section."""
+        # 3a. Validate
+        validation_result = self.validator.validate(
+            section=section,
+            measure=measure,
+        )
+        context.collector.collect_from_validation(validation_result, section.measure_id)
+
+        # Set quality metrics
+        context.collector.set_measure_quality(
+            measure_id=section.measure_id,
+            items_total=len(measure.items),
+            items_present=len([i for i in section.items if not i.missing]),
+            missing_items=validation_result.missing_items,
+            out_of_range_items=validation_result.out_of_range_items,
+            prorated_scales=[],  # Will be filled from scoring
+        )
+
+        # 3b. Score
+        scoring_result = self.scoring_engine.score(
+            section=section,
+            measure=measure,
+        )
+        context.collector.collect_from_scoring(scoring_result)
+
+        # Update prorated scales
+        prorated = [s.scale_id for s in scoring_result.scales if s.prorated]
+        if prorated:
+            context.collector.set_measure_quality(
+                measure_id=section.measure_id,
+                items_total=len(measure.items),
+                items_present=len([i for i in section.items if not i.missing]),
+                missing_items=validation_result.missing_items,
+                out_of_range_items=validation_result.out_of_range_items,
+                prorated_scales=prorated,
+            )
+
+        # Collect warnings for prorated scores
+        section_warnings: list[str] = []
+        for scale in scoring_result.scales:
+            if scale.prorated:
+                section_warnings.append(
+                    f"Scale {scale.scale_id} was prorated "
+                    f"(missing: {scale.missing_items})"
+                )
+
+        # 3c. Interpret
+        interpretation_result = self.interpreter.interpret(
+            scoring_result=scoring_result,
+            measure=measure,
+        )
+
+        # 3d. Build MeasurementEvent
+        event = context.builder.build(
+            recoded_section=section,
+            scoring_result=scoring_result,
+            interpretation_result=interpretation_result,
+            binding_spec=context.binding_spec,
+            form_id=context.form_id,
+            form_submission_id=context.form_submission_id,
+            subject_id=context.subject_id,
+            timestamp=context.timestamp,
+            warnings=section_warnings if section_warnings else None,
+            measure=measure,
+        )
+        context.events.append(event)
+        context.warnings.extend(section_warnings)
+
+    def _measure_not_found(self, collector: DiagnosticsCollector, measure_id: str) -> None:
+        """Record that a mapped section's measure spec was not supplied."""
+        collector.add_error(
+            stage="recoding",
+            code="MEASURE_NOT_FOUND",
+            message=f"Measure spec not found: {measure_id}",
+            measure_id=measure_id,
+        )
+
+    def _measure_failed(
+        self,
+        collector: DiagnosticsCollector,
+        measure_id: str,
+        error: Exception,
+    ) -> None:
+        """Record an unexpected error that stopped one measure's processing."""
+        collector.add_error(
+            stage="building",
+            code="PIPELINE_ERROR",
+            message=str(error),
+            measure_id=measure_id,
+        )
+
     def validate_measure(self, measure: MeasureSpec) -> list[str]:
         """Validate that a measure spec is compatible with questionnaire domain.
 
@@ -1,8 +1,8 @@
 """Form input handling for finalform.
 
 Provides the FormInputClient for managing field_id -> item_id mappings,
-and the high-level process_form_submission API for processing canonical
-form submissions.
+and the high-level process_form_submission API (process_form_submissions
+for many at once) for processing canonical form submissions.
 """
 
 from finalform.input.client import FormInputClient
@@ -11,6 +11,7 @@ from finalform.input.process import (
     MissingItemMapError,
     UnmappedFieldError,
     process_form_submission,
+    process_form_submissions,
 )
 
 __all__ = [
@@ -19,4 +20,5 @@ __all__ = [
     "MissingItemMapError",
     "UnmappedFieldError",
     "process_form_submission",
+    "process_form_submissions",
 ]
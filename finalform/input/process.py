@@ -5,13 +5,23 @@ from canonizer. It handles the mapping from canonical form shape to
 finalform's internal processing.
 """
 
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
 from typing import Any
 
 from finalform.core.models import ProcessingResult
 from finalform.domains.questionnaire import QuestionnaireProcessor
 from finalform.input.client import FormInputClient
 from finalform.registry import MeasureRegistry
-from finalform.registry.models import Binding, BindingSection, FormBindingSpec
+from finalform.registry.models import Binding, BindingSection, FormBindingSpec, MeasureSpec
+
+# (form_id, measure_id, measure_version, item map entries)
+_BindingKey = tuple[str, str, str, tuple[tuple[str, str], ...]]
+# Synthetic binding specs kept for repeat submissions (oldest evicted first)
+_BINDING_CACHE_SIZE = 256
+_binding_specs: dict[_BindingKey, FormBindingSpec] = {}
+# Shared by process_form_submission() calls so the recode memo carries over
+_processor = QuestionnaireProcessor()
 
 
 class MissingItemMapError(Exception):
@@ -83,32 +93,200 @@ def process_form_submission(
         UnmappedFieldError: If strict=True and form contains fields not in item_map.
     """
     # 1. Determine form_id
+    resolved_form_id = _resolve_form_id(form_submission, form_id)
+
+    # 2-3. Resolve item map, load measure spec and build the binding spec
+    plan = _plan_submission(
+        resolved_form_id,
+        measure_id,
+        form_input_client=form_input_client,
+        measure_registry=measure_registry,
+        measure_version=measure_version,
+        item_map_override=item_map_override,
+    )
+
+    # 4-7. Adapt the submission and process it
+    return _process_planned(form_submission, plan, _processor, strict)
+
+
+def process_form_submissions(
+    form_submissions: Iterable[dict[str, Any]],
+    *,
+    measure_id: str,
+    form_input_client: FormInputClient,
+    measure_registry: MeasureRegistry,
+    measure_version: str | None = None,
+    form_id: str | None = None,
+    item_map_override: dict[str, str] | None = None,
+    strict: bool = True,
+) -> Iterator[ProcessingResult]:
+    """Process many canonical form submissions for a single measure.
+
+    Equivalent to calling process_form_submission() for each submission,
+    but the item map, measure spec and binding spec are resolved once per
+    (form_id, measure_id) and one processor is reused. Results are yielded
+    as each submission is processed, so the input can be a stream.
+
+    Item maps and measure specs are resolved when a form_id is first seen;
+    mappings saved or registry changes made while iterating are not picked
+    up for form_ids already seen.
+
+    Args:
+        form_submissions: Canonical form submission dicts (see
+            process_form_submission() for the shape).
+        measure_id: The measure to process (e.g., "phq9", "gad7").
+        form_input_client: Client for retrieving field_id -> item_id mappings.
+        measure_registry: Registry for loading measure specs.
+        measure_version: Specific measure version to use (default: latest).
+        form_id: Override form_id for every submission (default: use each
+            submission's "form_id").
+        item_map_override: Override the item map entirely (bypasses FormInputClient).
+        strict: If True, fail on unmapped fields. If False, skip and warn.
+
+    Yields:
+        ProcessingResult for each submission, in input order.
+
+    Raises:
+        MissingFormIdError: If a submission's form_id cannot be determined.
+        MissingItemMapError: If no mapping is configured for a submission's
+            form and no override is provided.
+        UnmappedFieldError: If strict=True and a submission contains fields
+            not in its item_map.
+    """
+    processor = QuestionnaireProcessor()
+    plans: dict[tuple[str, str], _SubmissionPlan] = {}
+
+    for form_submission in form_submissions:
+        resolved_form_id = _resolve_form_id(form_submission, form_id)
+        plan = plans.get((resolved_form_id, measure_id))
+        if plan is None:
+            plan = _plan_submission(
+                resolved_form_id,
+                measure_id,
+                form_input_client=form_input_client,
+                measure_registry=measure_registry,
+                measure_version=measure_version,
+                item_map_override=item_map_override,
+            )
+            plans[(resolved_form_id, measure_id)] = plan
+        yield _process_planned(form_submission, plan, processor, strict)
+
+
+@dataclass(frozen=True, slots=True)
+class _SubmissionPlan:
+    """Everything resolved once per (form_id, measure_id)."""
+
+    form_id: str
+    measure_id: str
+    item_map: dict[str, str]
+    measure_spec: MeasureSpec
+    binding_spec: FormBindingSpec
+
+
+def _resolve_form_id(form_submission: dict[str, Any], form_id: str | None) -> str:
+    """Determine a submission's form_id, failing if there is none."""
     resolved_form_id = form_id or form_submission.get("form_id")
     if not resolved_form_id:
         raise MissingFormIdError(
             "form_id not provided and not found in form_submission. "
             "Either pass form_id argument or ensure form_submission contains 'form_id'."
         )
+    return resolved_form_id
 
-    # 2. Resolve item map
+
+def _plan_submission(
+    form_id: str,
+    measure_id: str,
+    *,
+    form_input_client: FormInputClient,
+    measure_registry: MeasureRegistry,
+    measure_version: str | None,
+    item_map_override: dict[str, str] | None,
+) -> _SubmissionPlan:
+    """Resolve the item map and measure spec, and build the binding spec."""
+    # Resolve item map
     if item_map_override is not None:
         item_map = item_map_override
     else:
-        item_map = form_input_client.get_item_map(resolved_form_id, measure_id)
+        item_map = form_input_client.get_item_map(form_id, measure_id)
 
     if item_map is None:
         raise MissingItemMapError(
-            f"No item mapping configured for (form_id={resolved_form_id!r}, measure_id={measure_id!r}). "
+            f"No item mapping configured for (form_id={form_id!r}, measure_id={measure_id!r}). "
             f"Either provide item_map_override or configure a mapping via FormInputClient.save_item_map()."
         )
 
-    # 3. Load measure spec
+    # Load measure spec
     if measure_version:
         measure_spec = measure_registry.get(measure_id, measure_version)
     else:
         measure_spec = measure_registry.get_latest(measure_id)
 
-    # 4. Build internal form response from canonical shape
+    return _SubmissionPlan(
+        form_id=form_id,
+        measure_id=measure_id,
+        item_map=item_map,
+        measure_spec=measure_spec,
+        binding_spec=_binding_spec(form_id, measure_id, measure_spec.version, item_map),
+    )
+
+
+def _binding_spec(
+    form_id: str,
+    measure_id: str,
+    measure_version: str,
+    item_map: dict[str, str],
+) -> FormBindingSpec:
+    """Get the binding spec for a single measure, built once per item map.
+
+    The spec is compiled and fingerprinted when built, as the registries
+    do at load time, so repeat submissions skip both.
+    """
+    key = (form_id, measure_id, measure_version, tuple(item_map.items()))
+    binding_spec = _binding_specs.get(key)
+    if binding_spec is not None:
+        return binding_spec
+
+    binding_spec = FormBindingSpec(
+        type="form_binding_spec",
+        form_id=form_id,
+        binding_id=f"_auto_{form_id}_{measure_id}",
+        version="1.0.0",
+        sections=[
+            BindingSection(
+                measure_id=measure_id,
+                measure_version=measure_version,
+                bindings=[
+                    Binding(item_id=item_id, by="field_key", value=field_id)
+                    for field_id, item_id in item_map.items()
+                ],
+            )
+        ],
+    )
+    binding_spec.plan
+    binding_spec.fingerprint
+
+    if key not in _binding_specs and len(_binding_specs) >= _BINDING_CACHE_SIZE:
+        try:
+            del _binding_specs[next(iter(_binding_specs))]
+        except (StopIteration, KeyError, RuntimeError):
+            # Another thread changed the cache; it may briefly overfill
+            pass
+    _binding_specs[key] = binding_spec
+    return binding_spec
+
+
+def _process_planned(
+    form_submission: dict[str, Any],
+    plan: _SubmissionPlan,
+    processor: QuestionnaireProcessor,
+    strict: bool,
+) -> ProcessingResult:
+    """Adapt a canonical submission to finalform's shape and process it."""
+    item_map = plan.item_map
+    measure_id = plan.measure_id
+
+    # Build internal form response from canonical shape
     # Adapt canonical -> finalform internal format
     internal_items = []
     unmapped_fields = []
@@ -137,40 +315,21 @@ def process_form_submission(
 
     # Build internal form response
     internal_form_response = {
-        "form_id": resolved_form_id,
+        "form_id": plan.form_id,
         "form_submission_id": form_submission.get("submission_id", "unknown"),
         "subject_id": form_submission.get("respondent", {}).get("id", "unknown"),
         "timestamp": form_submission.get("submitted_at", ""),
         "items": internal_items,
     }
 
-    # 5. Build binding spec for this single measure
-    binding_spec = FormBindingSpec(
-        type="form_binding_spec",
-        form_id=resolved_form_id,
-        binding_id=f"_auto_{resolved_form_id}_{measure_id}",
-        version="1.0.0",
-        sections=[
-            BindingSection(
-                measure_id=measure_id,
-                measure_version=measure_spec.version,
-                bindings=[
-                    Binding(item_id=item_id, by="field_key", value=field_id)
-                    for field_id, item_id in item_map.items()
-                ],
-            )
-        ],
-    )
-
-    # 6. Process via questionnaire processor
-    processor = QuestionnaireProcessor()
+    # Process via questionnaire processor
     result = processor.process(
         form_response=internal_form_response,
-        binding_spec=binding_spec,
-        measures={measure_id: measure_spec},
+        binding_spec=plan.binding_spec,
+        measures={measure_id: plan.measure_spec},
     )
 
-    # 7. Add unmapped fields to diagnostics if any
+    # Add unmapped fields to diagnostics if any
     if unmapped_fields and result.diagnostics:
         # Record as warning in diagnostics
         for field_id in unmapped_fields:
@@ -0,0 +1,78 @@
+"""Vectorized batch interpretation.
+
+Labels a whole column of scores for one scale at once, using the
+scale's compiled BandTable with numpy.searchsorted instead of looking
+up each score in turn. Bands match Interpreter and find_band exactly.
+
+Requires numpy (pip install 'finalform[batch]').
+"""
+
+try:
+    import numpy as np
+except ImportError as e:  # pragma: no cover - depends on the environment
+    raise ImportError(
+        "Batch interpretation requires numpy. Install it with: pip install 'finalform[batch]'"
+    ) from e
+
+from finalform.registry.models import MeasureSpec
+from finalform.registry.plan import ScalePlan
+
+
+def band_indexes(scale_plan: ScalePlan, values: np.ndarray) -> np.ndarray:
+    """Find the first interpretation band containing each score.
+
+    Args:
+        scale_plan: The compiled scale.
+        values: Scores (int or float). NaN scores get no band.
+
+    Returns:
+        Array of indexes into the scale's interpretations, -1 for scores
+        no band contains.
+    """
+    table = scale_plan.bands
+    values = np.asarray(values)
+    if not table.bounds:
+        return np.full(values.shape, -1, dtype=np.intp)
+
+    if values.dtype.kind == "i" and table.dense:
+        # Integer scores in the bands' range index the dense table directly
+        inside = (values >= table.dense_min) & (values <= table.dense_max)
+        dense = np.asarray(table.dense, dtype=np.intp)
+        return np.where(inside, dense[np.where(inside, values - table.dense_min, 0)], -1)
+
+    bounds = np.asarray(table.bounds)
+    position = np.searchsorted(bounds, values)
+    at_position = np.minimum(position, len(bounds) - 1)
+    on_bound = bounds[at_position] == values
+    # Band before position p is between[p - 1], with no band below the
+    # first bound or above the last
+    between = np.asarray((-1, *table.between, -1), dtype=np.intp)
+    at_bound = np.asarray(table.at_bound, dtype=np.intp)
+    return np.where(on_bound, at_bound[at_position], between[position])
+
+
+def label_column(values: np.ndarray, measure: MeasureSpec, scale_id: str) -> np.ndarray:
+    """Get the interpretation label of each score of a scale.
+
+    Args:
+        values: Scores of the scale, e.g. ScaleScoreColumn.values.
+        measure: The measure specification.
+        scale_id: The scale the scores belong to.
+
+    Returns:
+        Object array of labels aligned with values, None where no band
+        contains the score (including NaN scores).
+
+    Raises:
+        ValueError: If the scale is not in the measure.
+    """
+    scale_plan = measure.plan.scales_by_id.get(scale_id)
+    if scale_plan is None:
+        raise ValueError(
+            f"Scale not found in measure spec: {scale_id} in measure {measure.measure_id}"
+        )
+    labels = np.array(
+        [band.label for band in scale_plan.spec.interpretations] + [None], dtype=object
+    )
+    # Index -1 picks the trailing None
+    return labels[band_indexes(scale_plan, values)]
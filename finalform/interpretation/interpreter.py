@@ -5,10 +5,17 @@ Looks up interpretation labels from the measure spec based on score ranges.
 
 from pydantic import BaseModel
 
-from finalform.registry.models import MeasureSpec
+from finalform.registry.models import Interpretation, MeasureSpec
+from finalform.registry.plan import ScalePlan
 from finalform.scoring.engine import ScaleScore, ScoringResult
 
 
+def find_band(scale_plan: ScalePlan, value: float) -> Interpretation | None:
+    """Find the first interpretation band containing a score value."""
+    index = scale_plan.bands.find(value)
+    return scale_plan.spec.interpretations[index] if index >= 0 else None
+
+
 class InterpretedScore(BaseModel):
     """A scale score with interpretation label."""
 
@@ -85,9 +92,9 @@ class Interpreter:
                 error=scale_score.error or "No score available",
             )
 
-        # Get scale spec
-        scale_spec = measure.get_scale(scale_score.scale_id)
-        if scale_spec is None:
+        # Get scale spec from the compiled plan
+        scale_plan = measure.plan.scales_by_id.get(scale_score.scale_id)
+        if scale_plan is None:
             return InterpretedScore(
                 scale_id=scale_score.scale_id,
                 name=scale_score.name,
@@ -98,17 +105,17 @@ class Interpreter:
 
         # Find matching interpretation range
         score_value = scale_score.value
-        for interp in scale_spec.interpretations:
-            if interp.min <= score_value <= interp.max:
-                return InterpretedScore(
-                    scale_id=scale_score.scale_id,
-                    name=scale_score.name,
-                    value=score_value,
-                    label=interp.label,
-                    interpretation_min=interp.min,
-                    interpretation_max=interp.max,
-                    error=None,
-                )
+        interp = find_band(scale_plan, score_value)
+        if interp is not None:
+            return InterpretedScore(
+                scale_id=scale_score.scale_id,
+                name=scale_score.name,
+                value=score_value,
+                label=interp.label,
+                interpretation_min=interp.min,
+                interpretation_max=interp.max,
+                error=None,
+            )
 
         # No matching range found
         return InterpretedScore(
@@ -151,12 +158,9 @@ class Interpreter:
         Returns:
             The interpretation label, or None if not found.
         """
-        scale_spec = measure.get_scale(scale_id)
-        if scale_spec is None:
+        scale_plan = measure.plan.scales_by_id.get(scale_id)
+        if scale_plan is None:
             return None
 
-        for interp in scale_spec.interpretations:
-            if interp.min <= value <= interp.max:
-                return interp.label
-
-        return None
+        interp = find_band(scale_plan, value)
+        return interp.label if interp is not None else None
@@ -4,11 +4,13 @@ The mapper is purely mechanical - it does not interpret question text or guess m
 It requires explicit binding specifications and errors on missing fields.
 """
 
+from collections.abc import Collection, Iterator
 from typing import Any
 
 from pydantic import BaseModel
 
 from finalform.registry.models import FormBindingSpec
+from finalform.registry.plan import BindingPlan, BindingSectionPlan
 
 
 class MappingError(Exception):
@@ -60,12 +62,17 @@ class Mapper:
         self,
         form_response: dict[str, Any],
         binding_spec: FormBindingSpec,
+        measure_ids: Collection[str] | None = None,
     ) -> MappingResult:
         """Map a form response to measure items.
 
         Args:
             form_response: Canonical form response with items array.
             binding_spec: Binding specification defining the mappings.
+            measure_ids: Optional measure IDs to map. Only the bindings of
+                their sections are applied; other sections are skipped.
+                Fields bound by skipped sections are not reported as
+                unmapped.
 
         Returns:
             MappingResult with mapped items organized by measure section.
@@ -73,87 +80,146 @@ class Mapper:
         Raises:
             MappingError: If a required form field is not found.
         """
-        # Extract form metadata
-        form_id = form_response.get("form_id", "")
-        form_submission_id = form_response.get("form_submission_id", "")
-        subject_id = form_response.get("subject_id", "")
-        timestamp = form_response.get("timestamp", "")
+        plan, filled, unmapped_fields = self.route(form_response, binding_spec, measure_ids)
+        sections = [
+            section
+            for section_plan in plan.sections
+            if (section := self._build_section(section_plan, plan, filled)) is not None
+        ]
 
-        # Build lookup structures for form items
-        items_by_field_key: dict[str, dict[str, Any]] = {}
-        items_by_position: dict[int, dict[str, Any]] = {}
+        return MappingResult(
+            form_id=form_response.get("form_id", ""),
+            form_submission_id=form_response.get("form_submission_id", ""),
+            subject_id=form_response.get("subject_id", ""),
+            timestamp=form_response.get("timestamp", ""),
+            sections=sections,
+            unmapped_fields=unmapped_fields,
+        )
+
+    def iter_sections(
+        self,
+        form_response: dict[str, Any],
+        binding_spec: FormBindingSpec,
+        measure_ids: Collection[str] | None = None,
+    ) -> Iterator[MappedSection]:
+        """Map a form response lazily, one section at a time.
+
+        The form items are routed up front, but each section's MappedItems
+        are only built when the section is reached, so a caller that stops
+        early pays nothing for the remaining sections.
+
+        Args:
+            form_response: Canonical form response with items array.
+            binding_spec: Binding specification defining the mappings.
+            measure_ids: Optional measure IDs to map (default: all).
+
+        Yields:
+            MappedSection for each section with at least one mapped item,
+            in binding order.
+        """
+        plan, filled, _ = self.route(form_response, binding_spec, measure_ids)
+        for section_plan in plan.sections:
+            section = self._build_section(section_plan, plan, filled)
+            if section is not None:
+                yield section
+
+    def route(
+        self,
+        form_response: dict[str, Any],
+        binding_spec: FormBindingSpec,
+        measure_ids: Collection[str] | None,
+    ) -> tuple[BindingPlan, list[dict[str, Any] | None], list[Any]]:
+        """Route form items to binding slots in one pass.
+
+        This is the mapping step without result models; map() and the
+        processor's fast path build on it.
+
+        Args:
+            form_response: Canonical form response with items array.
+            binding_spec: Binding specification defining the mappings.
+            measure_ids: Optional measure IDs to map (None for all).
+
+        Returns:
+            The (possibly restricted) plan, the form item filling each of
+            its slots (None if missing), and the unmapped field keys.
+        """
+        full_plan = binding_spec.plan
+        plan = full_plan if measure_ids is None else full_plan.select(measure_ids)
+        by_field_key = plan.by_field_key
+        by_position = plan.by_position
+        bound_field_keys = full_plan.by_field_key
+        bound_positions = full_plan.by_position
+
+        # Later items with the same field_key or position replace earlier ones
+        filled: list[dict[str, Any] | None] = [None] * len(plan.slot_item_ids)
+        # Form field keys in first-seen order, True once the binding uses them
+        field_keys: dict[Any, bool] = {}
+        # Last form item at each position the full binding binds
+        position_items: dict[Any, dict[str, Any]] = {}
 
         for item in form_response.get("items", []):
             if "field_key" in item:
-                items_by_field_key[item["field_key"]] = item
+                field_key = item["field_key"]
+                for slot in by_field_key.get(field_key, ()):
+                    filled[slot] = item
+                if field_key in bound_field_keys:
+                    field_keys[field_key] = True
+                else:
+                    field_keys.setdefault(field_key, False)
             if "position" in item:
-                items_by_position[item["position"]] = item
-
-        # Map each section
-        sections: list[MappedSection] = []
-        used_field_keys: set[str] = set()
-
-        for section in binding_spec.sections:
-            mapped_items: list[MappedItem] = []
-            section_incomplete = False
-
-            for binding in section.bindings:
-                form_item: dict[str, Any] | None = None
-
-                if binding.by == "field_key":
-                    field_key = str(binding.value)
-                    form_item = items_by_field_key.get(field_key)
-                    if form_item is None:
-                        # Mark section as incomplete but continue processing
-                        section_incomplete = True
-                        continue
-                    used_field_keys.add(field_key)
-
-                elif binding.by == "position":
-                    position = int(binding.value)
-                    form_item = items_by_position.get(position)
-                    if form_item is None:
-                        # Mark section as incomplete but continue processing
-                        section_incomplete = True
-                        continue
-                    if "field_key" in form_item:
-                        used_field_keys.add(form_item["field_key"])
-
-                # Extract raw answer - the actual response value
-                raw_answer = form_item.get("answer", form_item.get("value"))
-
-                mapped_items.append(
-                    MappedItem(
-                        measure_id=section.measure_id,
-                        measure_version=section.measure_version,
-                        item_id=binding.item_id,
-                        raw_answer=raw_answer,
-                        field_key=form_item.get("field_key"),
-                        position=form_item.get("position"),
-                    )
-                )
+                position = item["position"]
+                for slot in by_position.get(position, ()):
+                    filled[slot] = item
+                if position in bound_positions:
+                    position_items[position] = item
 
-            # Only include sections that have at least some mapped items
-            if mapped_items:
-                sections.append(
-                    MappedSection(
-                        measure_id=section.measure_id,
-                        measure_version=section.measure_version,
-                        items=mapped_items,
-                    )
-                )
+        # A field bound by position is used if its item won the position
+        for form_item in position_items.values():
+            if "field_key" in form_item:
+                field_keys[form_item["field_key"]] = True
 
-        # Track unmapped fields
-        all_field_keys = set(items_by_field_key.keys())
-        unmapped_fields = list(all_field_keys - used_field_keys)
+        unmapped_fields = [field_key for field_key, used in field_keys.items() if not used]
+        return plan, filled, unmapped_fields
 
-        return MappingResult(
-            form_id=form_id,
-            form_submission_id=form_submission_id,
-            subject_id=subject_id,
-            timestamp=timestamp,
-            sections=sections,
-            unmapped_fields=unmapped_fields,
+    def _build_section(
+        self,
+        section_plan: BindingSectionPlan,
+        plan: BindingPlan,
+        filled: list[dict[str, Any] | None],
+    ) -> MappedSection | None:
+        """Build a section from its filled slots, in binding order."""
+        slot_item_ids = plan.slot_item_ids
+        mapped_items: list[MappedItem] = []
+        for slot in section_plan.slots:
+            form_item = filled[slot]
+            if form_item is None:
+                # Missing field: the section is incomplete, keep going
+                continue
+
+            # Extract raw answer - the actual response value
+            if "answer" in form_item:
+                raw_answer = form_item["answer"]
+            else:
+                raw_answer = form_item.get("value")
+
+            mapped_items.append(
+                MappedItem(
+                    measure_id=section_plan.measure_id,
+                    measure_version=section_plan.measure_version,
+                    item_id=slot_item_ids[slot],
+                    raw_answer=raw_answer,
+                    field_key=form_item.get("field_key"),
+                    position=form_item.get("position"),
+                )
+            )
+
+        # Only include sections that have at least some mapped items
+        if not mapped_items:
+            return None
+        return MappedSection(
+            measure_id=section_plan.measure_id,
+            measure_version=section_plan.measure_version,
+            items=mapped_items,
         )
 
     def map_section(
@@ -164,6 +230,8 @@ class Mapper:
     ) -> MappedSection | None:
         """Map a single section of a form response.
 
+        Only the bindings for the requested measure are applied.
+
         Args:
             form_response: Canonical form response.
             binding_spec: Binding specification.
@@ -172,8 +240,4 @@ class Mapper:
         Returns:
             MappedSection for the measure, or None if not found in binding.
         """
-        result = self.map(form_response, binding_spec)
-        for section in result.sections:
-            if section.measure_id == measure_id:
-                return section
-        return None
+        return next(self.iter_sections(form_response, binding_spec, (measure_id,)), None)
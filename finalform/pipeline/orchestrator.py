@@ -4,6 +4,10 @@ Loads registries, resolves specs, and routes to the appropriate
 domain processor based on measure kind.
 """
 
+import gc
+import logging
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from typing import Any
 
@@ -13,7 +17,19 @@ from finalform.core.factory import create_router
 from finalform.core.models import ProcessingResult
 from finalform.core.router import DomainRouter
 from finalform.registry import BindingRegistry, MeasureRegistry
-from finalform.registry.models import MeasureSpec
+from finalform.registry.bindings import BindingNotFoundError, BindingValidationError
+from finalform.registry.measures import MeasureNotFoundError, MeasureValidationError
+from finalform.registry.models import FormBindingSpec, MeasureSpec
+from finalform.registry.preload import PreloadReport
+from finalform.registry.snapshot import load_snapshot
+from finalform.registry.watch import RegistryWatcher, ReloadEvent
+
+logger = logging.getLogger(__name__)
+
+# Pipeline used by process_parallel() workers. With the fork start method it
+# is set in the parent just before forking, so workers inherit the loaded
+# specs instead of rebuilding them.
+_worker_pipeline: "Pipeline | None" = None
 
 
 class PipelineConfig(BaseModel):
@@ -25,6 +41,10 @@ class PipelineConfig(BaseModel):
     binding_version: str | None = None
     measure_schema_path: Path | None = None
     binding_schema_path: Path | None = None
+    snapshot_path: Path | None = None
+    preload: bool = False
+    preload_workers: int | None = None
+    reload_interval: float | None = None
     deterministic_ids: bool = False
 
 
@@ -44,45 +64,218 @@ class Pipeline:
         """
         self.config = config
 
+        # Load the precompiled snapshot once and share it between registries
+        snapshot = load_snapshot(config.snapshot_path) if config.snapshot_path else None
+
         # Load registries
         self.measure_registry = MeasureRegistry(
             config.measure_registry_path,
             schema_path=config.measure_schema_path,
+            snapshot=snapshot,
         )
         self.binding_registry = BindingRegistry(
             config.binding_registry_path,
             schema_path=config.binding_schema_path,
+            snapshot=snapshot,
         )
 
+        # Optionally pay all registry I/O and validation up front
+        self.preload_reports: dict[str, PreloadReport] = {}
+        if config.preload:
+            self.preload_reports["measures"] = self.measure_registry.preload(
+                max_workers=config.preload_workers
+            )
+            self.preload_reports["bindings"] = self.binding_registry.preload(
+                max_workers=config.preload_workers
+            )
+
+        # Resolved (binding_spec, measures), replaced as a unit on reload
+        self._resolved = self._resolve()
+
+        # Router
+        self.router = router if router is not None else create_router()
+
+        # Optionally hot-reload specs edited on disk
+        self.watcher: RegistryWatcher | None = None
+        if config.reload_interval is not None:
+            self.watch(interval=config.reload_interval)
+
+    def _resolve(self) -> tuple[FormBindingSpec, dict[str, MeasureSpec]]:
+        """Resolve the configured binding spec and the measures it uses."""
         # Load binding spec
-        if config.binding_version:
-            self.binding_spec = self.binding_registry.get(
-                config.binding_id,
-                config.binding_version,
+        if self.config.binding_version:
+            binding_spec = self.binding_registry.get(
+                self.config.binding_id,
+                self.config.binding_version,
             )
         else:
-            self.binding_spec = self.binding_registry.get_latest(config.binding_id)
+            binding_spec = self.binding_registry.get_latest(self.config.binding_id)
 
         # Load measure specs
-        self.measures: dict[str, MeasureSpec] = {}
-        for section in self.binding_spec.sections:
-            self.measures[section.measure_id] = self.measure_registry.get(
+        measures: dict[str, MeasureSpec] = {}
+        for section in binding_spec.sections:
+            measures[section.measure_id] = self.measure_registry.get(
                 section.measure_id,
                 section.measure_version,
             )
+        return binding_spec, measures
 
-        # Router
-        self.router = router if router is not None else create_router()
+    @property
+    def binding_spec(self) -> FormBindingSpec:
+        """The resolved form binding spec."""
+        return self._resolved[0]
+
+    @property
+    def measures(self) -> dict[str, MeasureSpec]:
+        """The resolved measure specs, by measure ID."""
+        return self._resolved[1]
+
+    def watch(self, interval: float = 2.0) -> RegistryWatcher:
+        """Start hot-reloading the registries in a background thread.
+
+        Edited, added and removed spec files are picked up every interval
+        seconds. The pipeline re-resolves its binding and measures after
+        each reload and swaps them in atomically, so a process() call in
+        flight finishes with the specs it started with. If the new specs
+        cannot be resolved, the pipeline keeps the previous ones.
+
+        Args:
+            interval: Seconds between polls of the registry directories.
+
+        Returns:
+            The running watcher; subscribe() to it to log reload events.
+        """
+        if self.watcher is None:
+            self.watcher = RegistryWatcher(
+                self.measure_registry, self.binding_registry, interval=interval
+            )
+            self.watcher.subscribe(self._on_reload)
+            self.watcher.start()
+        return self.watcher
+
+    def _on_reload(self, events: list[ReloadEvent]) -> None:
+        """Re-resolve specs after the watcher applied registry changes."""
+        try:
+            self._resolved = self._resolve()
+        except (
+            BindingNotFoundError,
+            BindingValidationError,
+            MeasureNotFoundError,
+            MeasureValidationError,
+            ValueError,
+        ) as e:
+            logger.warning("Keeping previous specs after registry reload: %s", e)
+
+    def close(self) -> None:
+        """Stop hot-reloading, if it was started."""
+        if self.watcher is not None:
+            self.watcher.stop()
+            self.watcher = None
 
     def process(self, form_response: dict[str, Any]) -> ProcessingResult:
         """Process a form response by routing to the appropriate domain processor."""
+        # Read the resolved specs once so a concurrent reload cannot mix versions
+        binding_spec, measures = self._resolved
         return self.router.process(
             form_response=form_response,
-            binding_spec=self.binding_spec,
-            measures=self.measures,
+            binding_spec=binding_spec,
+            measures=measures,
             deterministic_ids=self.config.deterministic_ids,
         )
 
     def process_batch(self, form_responses: list[dict[str, Any]]) -> list[ProcessingResult]:
         """Process a batch of form responses."""
         return [self.process(r) for r in form_responses]
+
+    def freeze(self) -> None:
+        """Prepare the loaded specs to be shared with forked workers.
+
+        Collects garbage and then moves every live object, including the
+        resolved specs and their compiled plans, into the garbage
+        collector's permanent generation (gc.freeze()). Collections in
+        forked children then never write to those objects' pages, so they
+        stay shared copy-on-write instead of being duplicated per worker.
+
+        Call this last thing before forking worker processes (e.g. in a
+        pre-fork server hook); process_parallel() does it automatically.
+        """
+        gc.collect()
+        gc.freeze()
+
+    def process_parallel(
+        self,
+        form_responses: list[dict[str, Any]],
+        workers: int | None = None,
+        chunksize: int = 16,
+    ) -> list[ProcessingResult]:
+        """Process a batch of form responses across worker processes.
+
+        Workers are started with multiprocessing's default start method.
+        When that is fork, the specs loaded by this pipeline are frozen and
+        inherited by the workers, so workers start without reading,
+        validating or compiling any spec. Otherwise (spawn, forkserver)
+        each worker builds its own Pipeline from the config (a custom
+        router is not carried over in that case).
+
+        Objects the caller already froze (e.g. with freeze() in a pre-fork
+        hook) stay frozen; only a freeze done by this call is undone.
+
+        Args:
+            form_responses: The form responses to process.
+            workers: Number of worker processes (default: CPU count).
+            chunksize: Form responses sent to a worker per task.
+
+        Returns:
+            Processing results, in input order.
+
+        Raises:
+            RuntimeError: If workers would be forked while hot reloading is
+                running (call close() first): forking a process with a live
+                watcher thread is unsafe.
+        """
+        global _worker_pipeline
+
+        context = multiprocessing.get_context()
+        forked = context.get_start_method() == "fork"
+        if forked and self.watcher is not None:
+            raise RuntimeError(
+                "Cannot process in parallel while hot reloading is running; call close() first"
+            )
+        config = None if forked else self.config.model_copy(update={"reload_interval": None})
+
+        _worker_pipeline = self
+        # Only forked workers share the parent's objects; leave a freeze
+        # done by the caller in place
+        froze = forked and gc.get_freeze_count() == 0
+        if froze:
+            self.freeze()
+        try:
+            with ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=context,
+                initializer=_init_worker,
+                initargs=(config,),
+            ) as executor:
+                return list(executor.map(_process_in_worker, form_responses, chunksize=chunksize))
+        finally:
+            _worker_pipeline = None
+            if froze:
+                gc.unfreeze()
+
+
+def _init_worker(config: PipelineConfig | None) -> None:
+    """Set up a process_parallel() worker.
+
+    Forked workers already hold the parent's pipeline; spawned workers
+    build their own from the config.
+    """
+    global _worker_pipeline
+    if config is not None:
+        _worker_pipeline = Pipeline(config)
+
+
+def _process_in_worker(form_response: dict[str, Any]) -> ProcessingResult:
+    """Process one form response in a process_parallel() worker."""
+    if _worker_pipeline is None:
+        raise RuntimeError("process_parallel() worker has no pipeline")
+    return _worker_pipeline.process(form_response)
@@ -1,5 +1,6 @@
 """Recoding engine for transforming raw answers to numeric values."""
 
+from finalform.recoding.memo import MemoStats, RecodeMemo
 from finalform.recoding.recoder import (
     RecodedItem,
     RecodedSection,
@@ -14,4 +15,6 @@ __all__ = [
     "RecodedSection",
     "RecodingResult",
     "RecodingError",
+    "RecodeMemo",
+    "MemoStats",
 ]
@@ -0,0 +1,117 @@
+"""Column-oriented batch recoding.
+
+Backfills recode the same item across many submissions. Instead of
+building a RecodedItem per answer, recode_column() takes the column of
+raw answers for one item, recodes each distinct answer once and scatters
+the results into NumPy arrays. Values and errors match Recoder exactly.
+
+Requires numpy (pip install 'finalform[batch]').
+"""
+
+from collections.abc import Sequence
+from dataclasses import dataclass
+from typing import Any
+
+try:
+    import numpy as np
+except ImportError as e:  # pragma: no cover - depends on the environment
+    raise ImportError(
+        "Batch recoding requires numpy. Install it with: pip install 'finalform[batch]'"
+    ) from e
+
+from finalform.recoding.recoder import Recoder
+from finalform.registry.models import MeasureSpec
+
+
+@dataclass(frozen=True, slots=True)
+class RecodedColumn:
+    """Recoded values of one item across many submissions.
+
+    values is int64 unless some answer recodes to a float, in which case
+    it is float64. Missing answers are 0 in values and True in missing.
+    """
+
+    measure_id: str
+    measure_version: str
+    item_id: str
+    values: np.ndarray
+    missing: np.ndarray  # bool, aligned with values
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+
+def factorize(answers: Sequence[Any]) -> tuple[list[Any], np.ndarray]:
+    """Split a column of raw answers into distinct answers and row codes.
+
+    Answers are distinct by type as well as value, so 1 and 1.0 (which
+    recode differently) stay apart. Unhashable answers each get their
+    own code.
+
+    Args:
+        answers: Raw answers, one per submission.
+
+    Returns:
+        Tuple of (distinct answers in first-seen order, code per row).
+    """
+    uniques: list[Any] = []
+    index: dict[tuple[type, Any], int] = {}
+    codes = np.empty(len(answers), dtype=np.intp)
+    for row, answer in enumerate(answers):
+        try:
+            code = index.setdefault((type(answer), answer), len(uniques))
+        except TypeError:
+            code = len(uniques)
+        if code == len(uniques):
+            uniques.append(answer)
+        codes[row] = code
+    return uniques, codes
+
+
+def recode_column(
+    answers: Sequence[Any],
+    measure: MeasureSpec,
+    item_id: str,
+    recoder: Recoder | None = None,
+) -> RecodedColumn:
+    """Recode one item's answers across many submissions.
+
+    Args:
+        answers: Raw answers for the item, one per submission.
+        measure: The measure specification.
+        item_id: The item the answers belong to.
+        recoder: Recoder whose memo to use (default: a new Recoder).
+
+    Returns:
+        RecodedColumn aligned with answers.
+
+    Raises:
+        RecodingError: If the item is unknown, or for the first answer (in
+            row order) that cannot be recoded, with the same message
+            Recoder would give.
+    """
+    if recoder is None:
+        recoder = Recoder()
+    plan = measure.plan
+    item_plan = recoder.lookup_item(plan, item_id)
+    fingerprint = measure.fingerprint if recoder.memo is not None else ""
+
+    uniques, codes = factorize(answers)
+    # Distinct answers are in first-seen order, so the first one that
+    # fails is also the first failing row
+    recoded = [recoder.recode_answer(answer, item_plan, fingerprint) for answer in uniques]
+
+    is_float = any(isinstance(value, float) for value in recoded)
+    unique_values = np.array(
+        [0 if value is None else value for value in recoded],
+        dtype=np.float64 if is_float else np.int64,
+    )
+    unique_missing = np.array([value is None for value in recoded], dtype=bool)
+
+    return RecodedColumn(
+        measure_id=plan.measure_id,
+        measure_version=plan.version,
+        item_id=item_id,
+        values=unique_values[codes],
+        missing=unique_missing[codes],
+    )
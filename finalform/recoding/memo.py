@@ -0,0 +1,97 @@
+"""Bounded memo of raw answer -> recoded value.
+
+Answer vocabularies are small but repeat across every submission, so the
+recoder remembers the outcome of each (measure spec fingerprint, item_id,
+raw answer) it has seen: either the recoded value or the error message.
+Keying by the spec's content fingerprint keeps entries valid across spec
+reloads and lets different versions of a measure share one memo.
+"""
+
+from typing import Any
+
+from pydantic import BaseModel
+
+# (measure fingerprint, item_id, answer type, raw answer). The type keeps
+# answers that compare equal but recode differently (1, 1.0) apart.
+MemoKey = tuple[str, str, type, Any]
+# (value, None) for a recoded value, (None, message) for a recoding error
+MemoOutcome = tuple[int | float | None, str | None]
+
+
+class MemoStats(BaseModel):
+    """Counters and current size of a RecodeMemo."""
+
+    hits: int
+    misses: int
+    evictions: int
+    entries: int
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups served from the memo."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class RecodeMemo:
+    """Bounded memo of recoding outcomes.
+
+    When full, the oldest entry is evicted. Lookups take no lock: under
+    concurrent use the memo stays consistent but the counters are
+    approximate.
+    """
+
+    def __init__(self, max_entries: int = 65536) -> None:
+        """Initialize the memo.
+
+        Args:
+            max_entries: Maximum number of remembered outcomes.
+
+        Raises:
+            ValueError: If max_entries is less than 1.
+        """
+        if max_entries < 1:
+            raise ValueError(f"max_entries must be at least 1, got {max_entries}")
+
+        self.max_entries = max_entries
+        self._entries: dict[MemoKey, MemoOutcome] = {}
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: MemoKey) -> MemoOutcome | None:
+        """Get the remembered outcome for a key."""
+        outcome = self._entries.get(key)
+        if outcome is None:
+            self._misses += 1
+        else:
+            self._hits += 1
+        return outcome
+
+    def put(self, key: MemoKey, outcome: MemoOutcome) -> None:
+        """Remember an outcome, evicting the oldest entry if full."""
+        entries = self._entries
+        if key not in entries and len(entries) >= self.max_entries:
+            try:
+                del entries[next(iter(entries))]
+                self._evictions += 1
+            except (StopIteration, KeyError, RuntimeError):
+                # Another thread changed the memo; it may briefly overfill
+                pass
+        entries[key] = outcome
+
+    def clear(self) -> None:
+        """Forget every outcome (counters are kept)."""
+        self._entries.clear()
+
+    def stats(self) -> MemoStats:
+        """Snapshot of the memo counters."""
+        return MemoStats(
+            hits=self._hits,
+            misses=self._misses,
+            evictions=self._evictions,
+            entries=len(self._entries),
+        )
@@ -10,7 +10,28 @@ from typing import Any
 from pydantic import BaseModel
 
 from finalform.mapping.mapper import MappedItem, MappedSection, MappingResult
+from finalform.recoding.memo import MemoOutcome, RecodeMemo
 from finalform.registry.models import MeasureSpec
+from finalform.registry.plan import ItemPlan, MeasurePlan, normalize_response
+
+# Answer types whose outcomes are memoized (hashable, and recoded by value)
+_MEMO_TYPES = (str, int, float)
+
+
+def _parse_number(text: str) -> int | float | None:
+    """Parse numeric answer text, as an int if whole; None if not a number."""
+    try:
+        numeric = float(text)
+    except ValueError:
+        return None
+    if numeric.is_integer():
+        return int(numeric)
+    return numeric
+
+
+def unknown_item_error(plan: MeasurePlan, item_id: str) -> str:
+    """Error message for a mapped item that the measure does not define."""
+    return f"Item not found in measure spec: {item_id} in measure {plan.measure_id}"
 
 
 class RecodingError(Exception):
@@ -57,8 +78,23 @@ class Recoder:
     - Text must match response_map exactly (after normalization)
     - Aliases are resolved to canonical text before lookup
     - No fuzzy matching or guessing
+
+    Outcomes are memoized per (measure fingerprint, item_id, raw answer),
+    so repeated answers skip parsing and normalization. See memo.stats()
+    for hit rates. Failures are carried as error messages and only raised
+    as RecodingError at the public entry points; recode_outcomes() reports
+    them per item instead.
     """
 
+    def __init__(self, memo_size: int | None = 65536) -> None:
+        """Initialize the recoder.
+
+        Args:
+            memo_size: Maximum number of memoized outcomes (None disables
+                the memo).
+        """
+        self.memo = RecodeMemo(memo_size) if memo_size is not None else None
+
     def recode(
         self,
         mapping_result: MappingResult,
@@ -109,9 +145,11 @@ class Recoder:
     ) -> list[RecodedItem]:
         """Recode all items in a section."""
         recoded_items: list[RecodedItem] = []
+        plan = measure.plan
+        fingerprint = measure.fingerprint if self.memo is not None else ""
 
         for mapped_item in section.items:
-            recoded_item = self._recode_item(mapped_item, measure)
+            recoded_item = self._recode_item(mapped_item, plan, fingerprint)
             recoded_items.append(recoded_item)
 
         return recoded_items
@@ -119,35 +157,14 @@ class Recoder:
     def _recode_item(
         self,
         mapped_item: MappedItem,
-        measure: MeasureSpec,
+        plan: MeasurePlan,
+        fingerprint: str,
     ) -> RecodedItem:
         """Recode a single mapped item."""
-        item_spec = measure.get_item(mapped_item.item_id)
-        if item_spec is None:
-            raise RecodingError(
-                f"Item not found in measure spec: {mapped_item.item_id} "
-                f"in measure {measure.measure_id}"
-            )
-
+        item_plan = self.lookup_item(plan, mapped_item.item_id)
         raw_answer = mapped_item.raw_answer
-        value: int | float | None = None
-        missing = False
-
-        # Handle missing/null values
-        if raw_answer is None or raw_answer == "":
-            missing = True
-            value = None
-        # Handle numeric values (int or float)
-        elif isinstance(raw_answer, (int, float)) and not isinstance(raw_answer, bool):
-            value = self._validate_numeric(raw_answer, item_spec, mapped_item.item_id)
-        # Handle string values
-        elif isinstance(raw_answer, str):
-            value = self._recode_string(raw_answer, item_spec, mapped_item.item_id)
-        else:
-            raise RecodingError(
-                f"Unsupported answer type for item {mapped_item.item_id}: "
-                f"{type(raw_answer).__name__}"
-            )
+        value = self.recode_answer(raw_answer, item_plan, fingerprint)
+        missing = value is None
 
         return RecodedItem(
             measure_id=mapped_item.measure_id,
@@ -160,63 +177,221 @@ class Recoder:
             position=mapped_item.position,
         )
 
+    def recode_values(
+        self,
+        item_ids: list[str],
+        raw_answers: list[Any],
+        measure: MeasureSpec,
+    ) -> list[int | float | None]:
+        """Recode a section's raw answers, without result models.
+
+        Args:
+            item_ids: Mapped item IDs, in section order.
+            raw_answers: Raw answers aligned with item_ids.
+            measure: The measure specification.
+
+        Returns:
+            Recoded values aligned with item_ids (None if missing).
+
+        Raises:
+            RecodingError: If an item is unknown or an answer cannot be recoded.
+        """
+        plan = measure.plan
+        fingerprint = measure.fingerprint if self.memo is not None else ""
+        return [
+            self.recode_answer(raw_answer, self.lookup_item(plan, item_id), fingerprint)
+            for item_id, raw_answer in zip(item_ids, raw_answers)
+        ]
+
+    def recode_outcomes(
+        self,
+        item_ids: list[str],
+        raw_answers: list[Any],
+        measure: MeasureSpec,
+    ) -> tuple[list[int | float | None], list[tuple[str, str]]]:
+        """Recode a section's raw answers, reporting failures instead of raising.
+
+        Args:
+            item_ids: Mapped item IDs, in section order.
+            raw_answers: Raw answers aligned with item_ids.
+            measure: The measure specification.
+
+        Returns:
+            Tuple of (recoded values aligned with item_ids, (item_id, error
+            message) for each item that could not be recoded). Items that
+            could not be recoded have the value None.
+        """
+        plan = measure.plan
+        items_by_id = plan.items_by_id
+        fingerprint = measure.fingerprint if self.memo is not None else ""
+        values: list[int | float | None] = []
+        failures: list[tuple[str, str]] = []
+        for item_id, raw_answer in zip(item_ids, raw_answers):
+            item_plan = items_by_id.get(item_id)
+            if item_plan is None:
+                value, error = None, unknown_item_error(plan, item_id)
+            else:
+                value, error = self.recode_outcome(raw_answer, item_plan, fingerprint)
+            if error is not None:
+                failures.append((item_id, error))
+            values.append(value)
+        return values, failures
+
+    def lookup_item(self, plan: MeasurePlan, item_id: str) -> ItemPlan:
+        """Look up an item's plan, failing if the measure lacks the item.
+
+        Args:
+            plan: The compiled measure plan.
+            item_id: The item to look up.
+
+        Returns:
+            The item's plan.
+
+        Raises:
+            RecodingError: If the measure has no such item.
+        """
+        item_plan = plan.items_by_id.get(item_id)
+        if item_plan is None:
+            raise RecodingError(unknown_item_error(plan, item_id))
+        return item_plan
+
+    def recode_answer(
+        self,
+        raw_answer: Any,
+        item_plan: ItemPlan,
+        fingerprint: str,
+    ) -> int | float | None:
+        """Recode one raw answer, without result models.
+
+        Args:
+            raw_answer: The raw answer.
+            item_plan: The item's plan (see lookup_item()).
+            fingerprint: The measure spec's fingerprint, keying the memo.
+
+        Returns:
+            The recoded value, or None if the answer is missing.
+
+        Raises:
+            RecodingError: If the answer cannot be recoded.
+        """
+        value, error = self.recode_outcome(raw_answer, item_plan, fingerprint)
+        if error is not None:
+            raise RecodingError(error)
+        return value
+
+    def recode_outcome(
+        self,
+        raw_answer: Any,
+        item_plan: ItemPlan,
+        fingerprint: str,
+    ) -> MemoOutcome:
+        """Recode one raw answer, returning the error instead of raising.
+
+        Args:
+            raw_answer: The raw answer.
+            item_plan: The item's plan.
+            fingerprint: The measure spec's fingerprint, keying the memo.
+
+        Returns:
+            (value, None) if recoded, with value None if the answer is
+            missing; (None, message) if the answer cannot be recoded.
+        """
+        # Handle missing/null values
+        if raw_answer is None or raw_answer == "":
+            return None, None
+        memo = self.memo
+        # NaN never equals itself, so it could only miss the memo and evict
+        # useful entries
+        if memo is not None and type(raw_answer) in _MEMO_TYPES and raw_answer == raw_answer:
+            key = (fingerprint, item_plan.item_id, type(raw_answer), raw_answer)
+            outcome = memo.get(key)
+            if outcome is None:
+                outcome = self._recode_value(raw_answer, item_plan, item_plan.item_id)
+                memo.put(key, outcome)
+            return outcome
+        return self._recode_value(raw_answer, item_plan, item_plan.item_id)
+
+    def _recode_value(
+        self,
+        raw_answer: Any,
+        item_plan: ItemPlan,
+        item_id: str,
+    ) -> MemoOutcome:
+        """Recode a non-missing answer."""
+        # Handle numeric values (int or float)
+        if isinstance(raw_answer, (int, float)) and not isinstance(raw_answer, bool):
+            return self._validate_numeric(raw_answer, item_plan, item_id)
+        # Handle string values
+        if isinstance(raw_answer, str):
+            return self._recode_string(raw_answer, item_plan, item_id)
+        return None, (
+            f"Unsupported answer type for item {item_id}: {type(raw_answer).__name__}"
+        )
+
     def _validate_numeric(
         self,
         value: int | float,
-        item_spec: Any,
+        item_plan: ItemPlan,
         item_id: str,
-    ) -> int | float:
+    ) -> MemoOutcome:
         """Validate a numeric value against the response map range."""
-        # Get valid range from response_map values
-        valid_values = list(item_spec.response_map.values())
-        min_val = min(valid_values)
-        max_val = max(valid_values)
+        # Valid range is precomputed from the response_map values
+        min_val = item_plan.min_value
+        max_val = item_plan.max_value
+        if min_val is None or max_val is None:
+            return None, f"Item {item_id} has an empty response_map"
 
         if not (min_val <= value <= max_val):
-            raise RecodingError(
-                f"Value {value} out of range [{min_val}, {max_val}] for item {item_id}"
-            )
+            return None, f"Value {value} out of range [{min_val}, {max_val}] for item {item_id}"
 
-        return value
+        return value, None
 
     def _recode_string(
         self,
         raw_answer: str,
-        item_spec: Any,
+        item_plan: ItemPlan,
         item_id: str,
-    ) -> int:
-        """Recode a string answer to a numeric value."""
-        # Try to parse as numeric first
-        try:
-            numeric = float(raw_answer)
-            if numeric.is_integer():
-                numeric = int(numeric)
-            return self._validate_numeric(numeric, item_spec, item_id)
-        except ValueError:
-            pass
-
-        # Normalize: lowercase and strip whitespace
-        normalized = raw_answer.lower().strip()
-
-        # Check aliases first to resolve to canonical text (case-insensitive)
-        if item_spec.aliases:
-            # Build lowercase alias map for case-insensitive lookup
-            aliases_lower = {k.lower().strip(): v for k, v in item_spec.aliases.items()}
-            if normalized in aliases_lower:
-                canonical = aliases_lower[normalized]
-                normalized = canonical.lower().strip()
-
-        # Build lowercase response map for lookup
-        response_map_lower = {k.lower().strip(): v for k, v in item_spec.response_map.items()}
-
-        if normalized not in response_map_lower:
-            valid_responses = list(item_spec.response_map.keys())
-            raise RecodingError(
-                f"Unknown response '{raw_answer}' for item {item_id}. "
-                f"Valid responses: {valid_responses}"
-            )
+    ) -> MemoOutcome:
+        """Recode a string answer to a numeric value.
 
-        return response_map_lower[normalized]
+        Dispatches on the item's precompiled strategy so the usual answer
+        needs one check: a table lookup for text-anchored items, a number
+        parse for numeric-coded ones.
+        """
+        strategy = item_plan.strategy
+        if strategy == "text":
+            # Answers are usually response text; numbers only on a miss
+            value = item_plan.responses.get(normalize_response(raw_answer))
+            if value is not None:
+                return value, None
+            numeric = _parse_number(raw_answer)
+            if numeric is not None:
+                return self._validate_numeric(numeric, item_plan, item_id)
+        elif strategy == "numeric":
+            # Answers are usually numbers; text (e.g. aliases) on failure
+            numeric = _parse_number(raw_answer)
+            if numeric is not None:
+                return self._validate_numeric(numeric, item_plan, item_id)
+            value = item_plan.responses.get(normalize_response(raw_answer))
+            if value is not None:
+                return value, None
+        else:
+            # A lookup hit stands unless the text also parses as a number
+            normalized = normalize_response(raw_answer)
+            value = item_plan.responses.get(normalized)
+            if value is not None and normalized not in item_plan.numeric_responses:
+                return value, None
+            numeric = _parse_number(raw_answer)
+            if numeric is not None:
+                return self._validate_numeric(numeric, item_plan, item_id)
+            if value is not None:
+                return value, None
+
+        valid_responses = list(item_plan.spec.response_map.keys())
+        return None, (
+            f"Unknown response '{raw_answer}' for item {item_id}. "
+            f"Valid responses: {valid_responses}"
+        )
 
     def recode_section(
         self,
@@ -11,6 +11,16 @@ from finalform.registry.models import (
     MeasureScale,
     MeasureSpec,
 )
+from finalform.registry.plan import (
+    BindingPlan,
+    BindingSectionPlan,
+    ItemPlan,
+    MeasurePlan,
+    ScalePlan,
+    compile_binding,
+    compile_measure,
+)
+from finalform.registry.watch import RegistryWatcher, ReloadEvent
 
 __all__ = [
     "MeasureRegistry",
@@ -22,4 +32,13 @@ __all__ = [
     "FormBindingSpec",
     "BindingSection",
     "Binding",
+    "MeasurePlan",
+    "ItemPlan",
+    "ScalePlan",
+    "compile_measure",
+    "BindingPlan",
+    "BindingSectionPlan",
+    "compile_binding",
+    "RegistryWatcher",
+    "ReloadEvent",
 ]
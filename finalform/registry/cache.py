@@ -0,0 +1,202 @@
+"""Bounded LRU cache for loaded specs.
+
+Registries keep every spec they load in a SpecCache. By default it is
+unbounded; with a capacity (in entries and/or estimated bytes) the least
+recently used specs are evicted once the capacity is exceeded, so memory
+stays bounded however large the registry is. Pinned specs are never
+evicted.
+"""
+
+import threading
+from collections import OrderedDict
+from collections.abc import Iterable, Mapping
+from typing import Generic, TypeVar
+
+from pydantic import BaseModel
+
+SpecKey = tuple[str, str]  # (spec_id, version)
+SpecT = TypeVar("SpecT", bound=BaseModel)
+
+
+class CacheStats(BaseModel):
+    """Counters and current size of a SpecCache."""
+
+    hits: int
+    misses: int
+    evictions: int
+    entries: int
+    pinned: int
+    estimated_bytes: int  # 0 unless the cache is bounded by bytes
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups served from the cache."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+def estimate_spec_bytes(spec: BaseModel) -> int:
+    """Estimate the memory held by a spec.
+
+    Uses the size of the spec's JSON form, which grows with the number
+    of items, response anchors, scales and bindings. It is a relative
+    measure for capacity planning, not an exact object size.
+    """
+    return len(spec.model_dump_json())
+
+
+class SpecCache(Generic[SpecT]):
+    """Thread-safe LRU cache of specs keyed by (spec_id, version)."""
+
+    def __init__(
+        self,
+        max_entries: int | None = None,
+        max_bytes: int | None = None,
+    ) -> None:
+        """Initialize the cache.
+
+        Args:
+            max_entries: Maximum number of cached specs (None for no limit).
+            max_bytes: Maximum estimated bytes of cached specs (None for no
+                limit). See estimate_spec_bytes().
+
+        Raises:
+            ValueError: If a limit is less than 1.
+        """
+        if max_entries is not None and max_entries < 1:
+            raise ValueError(f"max_entries must be at least 1, got {max_entries}")
+        if max_bytes is not None and max_bytes < 1:
+            raise ValueError(f"max_bytes must be at least 1, got {max_bytes}")
+
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries: OrderedDict[SpecKey, tuple[SpecT, int]] = OrderedDict()
+        self._pinned: set[SpecKey] = set()
+        self._bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        # Bumped by every update(); see put()
+        self._generation = 0
+        self._lock = threading.Lock()
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: SpecKey) -> SpecT | None:
+        """Get a cached spec and mark it most recently used."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return entry[0]
+
+    @property
+    def generation(self) -> int:
+        """Number of update() calls so far."""
+        return self._generation
+
+    def put(self, key: SpecKey, spec: SpecT, generation: int | None = None) -> bool:
+        """Cache a spec, evicting least recently used specs if over capacity.
+
+        Args:
+            key: The spec's key.
+            spec: The spec to cache.
+            generation: The generation read before the spec was loaded. If
+                update() has run since, the spec may predate it and is not
+                cached.
+
+        Returns:
+            Whether the spec was cached.
+        """
+        size = estimate_spec_bytes(spec) if self.max_bytes is not None else 0
+        with self._lock:
+            if generation is not None and generation != self._generation:
+                return False
+            self._insert(key, spec, size)
+            self._evict()
+            return True
+
+    def pin(self, key: SpecKey) -> None:
+        """Exempt a spec from eviction. It need not be cached yet."""
+        with self._lock:
+            self._pinned.add(key)
+
+    def unpin(self, key: SpecKey) -> None:
+        """Make a pinned spec evictable again."""
+        with self._lock:
+            self._pinned.discard(key)
+            self._evict()
+
+    def update(self, replace: Mapping[SpecKey, SpecT], discard: Iterable[SpecKey]) -> None:
+        """Replace and drop several entries as one atomic change.
+
+        Args:
+            replace: Specs to store, replacing any cached version.
+            discard: Keys to drop (applied before replace).
+        """
+        sizes = {
+            key: estimate_spec_bytes(spec) if self.max_bytes is not None else 0
+            for key, spec in replace.items()
+        }
+        with self._lock:
+            for key in discard:
+                entry = self._entries.pop(key, None)
+                if entry is not None:
+                    self._bytes -= entry[1]
+            for key, spec in replace.items():
+                self._insert(key, spec, sizes[key])
+            self._evict()
+            self._generation += 1
+
+    def clear(self) -> None:
+        """Drop every cached spec (pins are kept)."""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self) -> CacheStats:
+        """Snapshot of the cache counters."""
+        with self._lock:
+            return CacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                entries=len(self._entries),
+                pinned=len(self._pinned),
+                estimated_bytes=self._bytes,
+            )
+
+    def _insert(self, key: SpecKey, spec: SpecT, size: int) -> None:
+        """Store an entry as most recently used. Caller holds the lock."""
+        previous = self._entries.pop(key, None)
+        if previous is not None:
+            self._bytes -= previous[1]
+        self._entries[key] = (spec, size)
+        self._bytes += size
+
+    def _over_capacity(self) -> bool:
+        """Whether the cache exceeds a limit. Caller holds the lock."""
+        if self.max_entries is not None and len(self._entries) > self.max_entries:
+            return True
+        return self.max_bytes is not None and self._bytes > self.max_bytes
+
+    def _evict(self) -> None:
+        """Evict least recently used unpinned entries. Caller holds the lock."""
+        skipped = 0
+        while self._over_capacity() and skipped < len(self._entries):
+            key = next(iter(self._entries))
+            if key in self._pinned:
+                # Pinned specs need no LRU position; move them out of the way
+                self._entries.move_to_end(key)
+                skipped += 1
+                continue
+            _, size = self._entries.pop(key)
+            self._bytes -= size
+            self._evictions += 1
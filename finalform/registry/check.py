@@ -0,0 +1,365 @@
+"""Whole-registry consistency checks.
+
+check_registry() checks every measure and binding spec file in one pass:
+schema validity, parsing, file location, measure structure (domain rules,
+scale item references, interpretation bands) and binding cross-references
+against the measures they use. Files are checked in parallel worker
+processes that share one compiled schema validator each; cross-reference
+checks then run against an index of the measures that were found.
+"""
+
+import json
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Literal
+
+from jsonschema.protocols import Validator
+from pydantic import BaseModel, ValidationError, computed_field
+
+from finalform.registry.models import FormBindingSpec, MeasureSpec
+from finalform.registry.schema import get_validator, schema_errors
+
+SpecKind = Literal["measure", "binding"]
+CheckName = Literal[
+    "file", "schema", "model", "location", "measure", "interpretation", "reference"
+]
+
+
+class CheckIssue(BaseModel):
+    """A problem found in one spec file."""
+
+    kind: SpecKind
+    spec_id: str
+    version: str
+    path: str
+    check: CheckName
+    severity: Literal["error", "warning"] = "error"
+    message: str
+
+
+class CheckReport(BaseModel):
+    """Result of checking a measure registry and a binding registry."""
+
+    measures_checked: int
+    bindings_checked: int
+    issues: list[CheckIssue]
+    total_seconds: float
+
+    @property
+    def errors(self) -> list[CheckIssue]:
+        """Issues with error severity."""
+        return [issue for issue in self.issues if issue.severity == "error"]
+
+    @property
+    def warnings(self) -> list[CheckIssue]:
+        """Issues with warning severity."""
+        return [issue for issue in self.issues if issue.severity == "warning"]
+
+    @computed_field  # type: ignore[prop-decorator]
+    @property
+    def ok(self) -> bool:
+        """Whether no errors were found (warnings are allowed)."""
+        return not self.errors
+
+    @computed_field  # type: ignore[prop-decorator]
+    @property
+    def error_count(self) -> int:
+        """Number of issues with error severity."""
+        return len(self.errors)
+
+    @computed_field  # type: ignore[prop-decorator]
+    @property
+    def warning_count(self) -> int:
+        """Number of issues with warning severity."""
+        return len(self.warnings)
+
+
+class _FileResult(BaseModel):
+    """What a worker reports back for one spec file."""
+
+    kind: SpecKind
+    spec_id: str
+    version: str
+    path: str
+    issues: list[CheckIssue]
+    # measure files: the measure's item IDs
+    item_ids: list[str] | None = None
+    # binding files: (measure_id, measure_version, bound item IDs) per section
+    sections: list[tuple[str, str, list[str]]] | None = None
+
+
+class _IssueFactory:
+    """Builds CheckIssues for one spec file."""
+
+    def __init__(self, kind: SpecKind, spec_id: str, version: str, path: str) -> None:
+        self.kind = kind
+        self.spec_id = spec_id
+        self.version = version
+        self.path = path
+
+    def __call__(
+        self,
+        check: CheckName,
+        message: str,
+        severity: Literal["error", "warning"] = "error",
+    ) -> CheckIssue:
+        return CheckIssue(
+            kind=self.kind,
+            spec_id=self.spec_id,
+            version=self.version,
+            path=self.path,
+            check=check,
+            severity=severity,
+            message=message,
+        )
+
+
+def _measure_issues(spec: MeasureSpec, issue: _IssueFactory) -> list[CheckIssue]:
+    """Structural checks for a parsed measure spec."""
+    from finalform.domains.questionnaire import QuestionnaireProcessor
+
+    issues: list[CheckIssue] = []
+    item_ids = {item.item_id for item in spec.items}
+
+    if spec.kind in QuestionnaireProcessor.SUPPORTED_KINDS:
+        # Domain rules, including scale item references
+        for message in QuestionnaireProcessor().validate_measure(spec):
+            issues.append(issue("measure", message))
+    else:
+        for scale in spec.scales:
+            for item_id in scale.items:
+                if item_id not in item_ids:
+                    issues.append(
+                        issue(
+                            "measure",
+                            f"Scale {scale.scale_id} references unknown item: {item_id}",
+                        )
+                    )
+
+    for scale in spec.scales:
+        scale_items = set(scale.items)
+        for item_id in scale.reversed_items:
+            if item_id not in scale_items:
+                issues.append(
+                    issue(
+                        "measure",
+                        f"Scale {scale.scale_id} reverses item not in the scale: {item_id}",
+                    )
+                )
+
+        # Bands are inclusive integer ranges: report overlaps and gaps
+        # between consecutive bands, and any part of the declared scale
+        # range they leave uncovered
+        bands = sorted(scale.interpretations, key=lambda band: (band.min, band.max))
+        for band in bands:
+            if band.min > band.max:
+                issues.append(
+                    issue(
+                        "interpretation",
+                        f"Scale {scale.scale_id} band '{band.label}' has min > max "
+                        f"({band.min} > {band.max})",
+                    )
+                )
+        for prev, band in zip(bands, bands[1:]):
+            if band.min <= prev.max:
+                issues.append(
+                    issue(
+                        "interpretation",
+                        f"Scale {scale.scale_id} bands '{prev.label}' and '{band.label}' "
+                        f"overlap ({prev.min}-{prev.max}, {band.min}-{band.max})",
+                    )
+                )
+            elif band.min > prev.max + 1:
+                issues.append(
+                    issue(
+                        "interpretation",
+                        f"Scale {scale.scale_id} has no band for scores "
+                        f"{prev.max + 1}-{band.min - 1}",
+                    )
+                )
+        if bands and scale.min is not None and bands[0].min > scale.min:
+            issues.append(
+                issue(
+                    "interpretation",
+                    f"Scale {scale.scale_id} bands start at {bands[0].min}, "
+                    f"above the scale minimum {scale.min}",
+                    severity="warning",
+                )
+            )
+        if bands and scale.max is not None and bands[-1].max < scale.max:
+            issues.append(
+                issue(
+                    "interpretation",
+                    f"Scale {scale.scale_id} bands end at {bands[-1].max}, "
+                    f"below the scale maximum {scale.max}",
+                    severity="warning",
+                )
+            )
+
+    return issues
+
+
+def _check_file(kind: SpecKind, path: Path, validator: Validator | None) -> _FileResult:
+    """Check a single spec file in isolation (runs in a worker)."""
+    spec_id = path.parent.name
+    version = path.stem.replace("-", ".")
+    issue = _IssueFactory(kind, spec_id, version, str(path))
+    result = _FileResult(kind=kind, spec_id=spec_id, version=version, path=str(path), issues=[])
+
+    try:
+        data = json.loads(path.read_bytes())
+    except (OSError, ValueError) as e:
+        result.issues.append(issue("file", f"Cannot read spec file: {e}"))
+        return result
+
+    if validator is not None:
+        errors = schema_errors(validator, data)
+        result.issues.extend(issue("schema", error) for error in errors)
+        if errors:
+            return result
+
+    spec: MeasureSpec | FormBindingSpec
+    try:
+        if kind == "measure":
+            spec = MeasureSpec.model_validate(data)
+        else:
+            spec = FormBindingSpec.model_validate(data)
+    except ValidationError as e:
+        for error in e.errors():
+            location = ".".join(str(part) for part in error["loc"])
+            result.issues.append(issue("model", f"{location}: {error['msg']}"))
+        return result
+
+    declared_id = spec.measure_id if isinstance(spec, MeasureSpec) else spec.binding_id
+    if (declared_id, spec.version) != (spec_id, version):
+        result.issues.append(
+            issue(
+                "location",
+                f"File declares {declared_id}@{spec.version} but is stored as {spec_id}@{version}",
+            )
+        )
+
+    if isinstance(spec, MeasureSpec):
+        result.issues.extend(_measure_issues(spec, issue))
+        result.item_ids = [item.item_id for item in spec.items]
+    else:
+        result.sections = [
+            (section.measure_id, section.measure_version, [b.item_id for b in section.bindings])
+            for section in spec.sections
+        ]
+    return result
+
+
+def _check_chunk(task: tuple[SpecKind, list[Path], Path | None]) -> list[_FileResult]:
+    """Check a chunk of spec files (runs in a worker)."""
+    kind, paths, schema_path = task
+    # One validator lookup (schema read and hash) per chunk, not per file
+    validator = get_validator(schema_path) if schema_path is not None else None
+    return [_check_file(kind, path, validator) for path in paths]
+
+
+def _reference_issues(
+    binding: _FileResult,
+    measures: dict[tuple[str, str], set[str]],
+) -> list[CheckIssue]:
+    """Check a binding's sections against the measure index."""
+    issue = _IssueFactory("binding", binding.spec_id, binding.version, binding.path)
+    issues: list[CheckIssue] = []
+    for measure_id, measure_version, item_ids in binding.sections or []:
+        measure_ref = f"{measure_id}@{measure_version}"
+        measure_items = measures.get((measure_id, measure_version))
+        if measure_items is None:
+            issues.append(issue("reference", f"Section references unknown measure {measure_ref}"))
+            continue
+        seen: set[str] = set()
+        for item_id in item_ids:
+            if item_id not in measure_items:
+                issues.append(
+                    issue(
+                        "reference",
+                        f"Binding for {measure_ref} references unknown item: {item_id}",
+                    )
+                )
+            elif item_id in seen:
+                issues.append(
+                    issue(
+                        "reference",
+                        f"Item {item_id} of {measure_ref} is bound more than once",
+                        severity="warning",
+                    )
+                )
+            seen.add(item_id)
+    return issues
+
+
+def check_registry(
+    measure_registry_path: Path | str,
+    binding_registry_path: Path | str,
+    measure_schema_path: Path | str | None = None,
+    binding_schema_path: Path | str | None = None,
+    max_workers: int | None = None,
+    chunk_size: int = 64,
+) -> CheckReport:
+    """Check every spec in a measure registry and a binding registry.
+
+    Args:
+        measure_registry_path: Path to the measure registry directory.
+        binding_registry_path: Path to the form binding registry directory.
+        measure_schema_path: Optional measure_spec schema to validate against.
+        binding_schema_path: Optional form_binding_spec schema to validate against.
+        max_workers: Worker processes (default: CPU count). With 1, files
+            are checked in this process.
+        chunk_size: Spec files per worker task.
+
+    Returns:
+        CheckReport listing every issue found, ordered by file.
+    """
+    start = time.perf_counter()
+    measure_schema = Path(measure_schema_path) if measure_schema_path else None
+    binding_schema = Path(binding_schema_path) if binding_schema_path else None
+    measure_files = sorted((Path(measure_registry_path) / "measures").glob("*/*.json"))
+    binding_files = sorted((Path(binding_registry_path) / "bindings").glob("*/*.json"))
+
+    # Chunk files so each worker task amortizes its process round trip
+    tasks: list[tuple[SpecKind, list[Path], Path | None]] = [
+        ("measure", measure_files[i : i + chunk_size], measure_schema)
+        for i in range(0, len(measure_files), chunk_size)
+    ] + [
+        ("binding", binding_files[i : i + chunk_size], binding_schema)
+        for i in range(0, len(binding_files), chunk_size)
+    ]
+
+    # Compile validators up front so forked workers inherit them
+    for schema_path in (measure_schema, binding_schema):
+        if schema_path is not None:
+            get_validator(schema_path)
+
+    results: list[_FileResult] = []
+    if max_workers == 1 or len(tasks) <= 1:
+        for task in tasks:
+            results.extend(_check_chunk(task))
+    else:
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            for chunk in executor.map(_check_chunk, tasks):
+                results.extend(chunk)
+
+    # Cross-reference index of the measures that parsed
+    measures = {
+        (result.spec_id, result.version): set(result.item_ids)
+        for result in results
+        if result.kind == "measure" and result.item_ids is not None
+    }
+
+    issues: list[CheckIssue] = []
+    for result in results:
+        issues.extend(result.issues)
+        if result.kind == "binding" and result.sections is not None:
+            issues.extend(_reference_issues(result, measures))
+
+    return CheckReport(
+        measures_checked=len(measure_files),
+        bindings_checked=len(binding_files),
+        issues=issues,
+        total_seconds=time.perf_counter() - start,
+    )
@@ -0,0 +1,51 @@
+"""Content-addressed fingerprints for specs.
+
+A fingerprint is the SHA-256 of a spec's canonical JSON form (sorted
+keys, no insignificant whitespace, defaults filled in), so it changes
+whenever the spec's meaning changes and not when a file is merely
+reformatted or touched. Fingerprints are computed once per loaded spec
+and are meant to be used in result caches and provenance.
+"""
+
+import hashlib
+import json
+
+from pydantic import BaseModel
+
+
+def spec_fingerprint(spec: BaseModel) -> str:
+    """Compute the content fingerprint of a spec.
+
+    Args:
+        spec: A MeasureSpec or FormBindingSpec.
+
+    Returns:
+        Hex SHA-256 of the spec's canonical JSON.
+    """
+    canonical = json.dumps(
+        spec.model_dump(mode="json"),
+        sort_keys=True,
+        separators=(",", ":"),
+        ensure_ascii=False,
+    )
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def combine_fingerprints(*fingerprints: str) -> str:
+    """Combine fingerprints (or other key parts) into one composite key.
+
+    The combination is order-sensitive and unambiguous: ("ab", "c") and
+    ("a", "bc") produce different keys.
+
+    Args:
+        fingerprints: Fingerprints or other string key parts.
+
+    Returns:
+        Hex SHA-256 of the parts.
+    """
+    digest = hashlib.sha256()
+    for part in fingerprints:
+        encoded = part.encode("utf-8")
+        digest.update(len(encoded).to_bytes(8, "big"))
+        digest.update(encoded)
+    return digest.hexdigest()
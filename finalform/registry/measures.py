@@ -1,11 +1,17 @@
 """Measure registry for loading and caching measure specifications."""
 
 import json
+from collections.abc import Iterable
 from pathlib import Path
 
-import jsonschema
+from jsonschema.protocols import Validator
 
+from finalform.registry.cache import CacheStats, SpecCache
 from finalform.registry.models import MeasureSpec
+from finalform.registry.preload import PreloadReport, preload_specs
+from finalform.registry.schema import get_validator, schema_errors
+from finalform.registry.snapshot import RegistrySnapshot, SnapshotError, load_snapshot
+from finalform.registry.versions import VersionIndex
 
 
 class MeasureNotFoundError(Exception):
@@ -33,21 +39,48 @@ class MeasureRegistry:
         self,
         registry_path: Path | str,
         schema_path: Path | str | None = None,
+        snapshot: RegistrySnapshot | Path | str | None = None,
+        cache_size: int | None = None,
+        cache_bytes: int | None = None,
     ) -> None:
         """Initialize the measure registry.
 
         Args:
             registry_path: Path to the measure registry directory.
             schema_path: Optional path to the measure_spec schema for validation.
+            snapshot: Optional precompiled registry snapshot (or path to one).
+                Specs in the snapshot are served without re-reading or
+                re-validating their files. Only the snapshot's file index
+                stays in memory; specs are read from it on a cache miss,
+                so cache_size and cache_bytes bound them too.
+            cache_size: Maximum number of specs kept in memory (default: no
+                limit). Least recently used specs are evicted first.
+            cache_bytes: Maximum estimated bytes of specs kept in memory
+                (default: no limit).
+
+        Raises:
+            StaleSnapshotError: If the snapshot does not match the registry on disk.
         """
         self.registry_path = Path(registry_path)
         self.measures_path = self.registry_path / "measures"
-        self._cache: dict[tuple[str, str], MeasureSpec] = {}
-        self._schema: dict | None = None
+        self._cache: SpecCache[MeasureSpec] = SpecCache(
+            max_entries=cache_size, max_bytes=cache_bytes
+        )
+        self._validator: Validator | None = None
+        self._snapshot: RegistrySnapshot | None = None
+        # (spec_id, version) -> sha256 of the spec in the snapshot
+        self._snapshot_index: dict[tuple[str, str], str] = {}
+        self.version_index = VersionIndex(self.measures_path)
 
         if schema_path:
-            with open(schema_path) as f:
-                self._schema = json.load(f)
+            self._validator = get_validator(schema_path)
+
+        if snapshot is not None:
+            if not isinstance(snapshot, RegistrySnapshot):
+                snapshot = load_snapshot(snapshot)
+            snapshot.verify_measures(self.measures_path, schema_path)
+            self._snapshot = snapshot
+            self._snapshot_index = snapshot.measures()
 
     def _version_to_filename(self, version: str) -> str:
         """Convert version string to filename (1.0.0 -> 1-0-0.json)."""
@@ -73,9 +106,36 @@ class MeasureRegistry:
             MeasureValidationError: If the spec fails schema validation.
         """
         cache_key = (measure_id, version)
-        if cache_key in self._cache:
-            return self._cache[cache_key]
+        spec = self._cache.get(cache_key)
+        if spec is not None:
+            return spec
+
+        # A spec loaded across a concurrent reload_specs() may be stale, so
+        # it is only cached if no reload happened in between
+        generation = self._cache.generation
+        # Single lookup: reload_specs() may swap this dict concurrently
+        sha256 = self._snapshot_index.get(cache_key)
+        spec = self._load_snapshot_spec(sha256) if sha256 is not None else None
+        if spec is None:
+            spec = self._load(measure_id, version)
+        self._cache.put(cache_key, spec, generation)
+        return spec
+
+    def _load_snapshot_spec(self, sha256: str) -> MeasureSpec | None:
+        """Read a spec from the snapshot, or None if the snapshot file is gone.
 
+        The spec files were verified against the snapshot, so a spec that
+        cannot be read from it is loaded from its file instead.
+        """
+        if self._snapshot is None:
+            return None
+        try:
+            return self._snapshot.load_spec(sha256)  # type: ignore[return-value]
+        except SnapshotError:
+            return None
+
+    def _load(self, measure_id: str, version: str) -> MeasureSpec:
+        """Read, validate and parse a measure spec file."""
         spec_path = self._get_spec_path(measure_id, version)
         if not spec_path.exists():
             raise MeasureNotFoundError(
@@ -87,18 +147,104 @@ class MeasureRegistry:
             data = json.load(f)
 
         # Validate against schema if available
-        if self._schema:
-            try:
-                jsonschema.validate(data, self._schema)
-            except jsonschema.ValidationError as e:
+        if self._validator is not None:
+            errors = schema_errors(self._validator, data)
+            if errors:
                 raise MeasureValidationError(
-                    f"Measure spec validation failed for {measure_id}@{version}: {e.message}"
-                ) from e
+                    f"Measure spec validation failed for {measure_id}@{version}: "
+                    + "; ".join(errors)
+                )
 
         spec = MeasureSpec.model_validate(data)
-        self._cache[cache_key] = spec
+        # Compile the lookup plan and fingerprint once, at load time, off
+        # the per-form path
+        spec.plan
+        spec.fingerprint
         return spec
 
+    def reload_specs(
+        self,
+        changed: Iterable[tuple[str, str]],
+        removed: Iterable[tuple[str, str]] = (),
+    ) -> dict[tuple[str, str], str]:
+        """Apply on-disk changes to a running registry.
+
+        Changed specs that are already cached are rebuilt from disk before
+        anything is swapped, then the cache is updated in one atomic step,
+        so concurrent get() calls see either the old or the new spec, never
+        a partial update. Specs that fail to load
+        keep their previous cached version.
+
+        Args:
+            changed: (measure_id, version) pairs whose files were added or edited.
+            removed: (measure_id, version) pairs whose files were deleted.
+
+        Returns:
+            Error messages for changed specs that failed to reload, by key.
+        """
+        changed = set(changed)
+        removed = set(removed)
+        reloaded: dict[tuple[str, str], MeasureSpec] = {}
+        errors: dict[tuple[str, str], str] = {}
+        for key in changed:
+            if key in self._cache:
+                try:
+                    reloaded[key] = self._load(*key)
+                except (MeasureNotFoundError, MeasureValidationError, ValueError) as e:
+                    errors[key] = str(e)
+
+        stale = (changed | removed) - errors.keys()
+        self._snapshot_index = {
+            k: v for k, v in self._snapshot_index.items() if k not in stale
+        }
+        self._cache.update(reloaded, discard=stale)
+        self.version_index.invalidate()
+        return errors
+
+    def pin(self, measure_id: str, version: str) -> MeasureSpec:
+        """Load a measure spec and keep it cached regardless of cache capacity.
+
+        Args:
+            measure_id: The measure identifier.
+            version: The version string.
+
+        Returns:
+            The pinned MeasureSpec.
+
+        Raises:
+            MeasureNotFoundError: If the spec file doesn't exist.
+            MeasureValidationError: If the spec fails schema validation.
+        """
+        self._cache.pin((measure_id, version))
+        try:
+            return self.get(measure_id, version)
+        except Exception:
+            self._cache.unpin((measure_id, version))
+            raise
+
+    def cache_stats(self) -> CacheStats:
+        """Hit, miss and eviction counters for the spec cache."""
+        return self._cache.stats()
+
+    def preload(self, max_workers: int | None = None) -> PreloadReport:
+        """Load and validate every measure spec in the registry concurrently.
+
+        Args:
+            max_workers: Thread pool size (default: ThreadPoolExecutor's default).
+
+        Returns:
+            PreloadReport with per-spec load timings.
+
+        Raises:
+            PreloadError: If any spec fails to load, listing every failure.
+        """
+        keys = [
+            (measure_id, version)
+            for measure_id in self.version_index.spec_ids()
+            for version in self.version_index.versions(measure_id)
+        ]
+        return preload_specs(self.get, keys, max_workers=max_workers)
+
     def list_measures(self) -> list[str]:
         """List all available measure IDs."""
         if not self.measures_path.exists():
@@ -106,20 +252,19 @@ class MeasureRegistry:
         return [d.name for d in self.measures_path.iterdir() if d.is_dir()]
 
     def list_versions(self, measure_id: str) -> list[str]:
-        """List all available versions for a measure."""
-        measure_path = self.measures_path / measure_id
-        if not measure_path.exists():
-            return []
-        versions = []
-        for f in measure_path.glob("*.json"):
-            # Convert filename back to version (1-0-0.json -> 1.0.0)
-            version = f.stem.replace("-", ".")
-            versions.append(version)
-        return sorted(versions)
+        """List all available versions for a measure, in semver order."""
+        return self.version_index.versions(measure_id)
+
+    def refresh(self) -> None:
+        """Rescan the registry for published or removed measure versions."""
+        self.version_index.refresh()
 
     def get_latest(self, measure_id: str) -> MeasureSpec:
         """Get the latest version of a measure.
 
+        Uses the in-memory version index (semver order); call refresh()
+        after publishing new versions to a running registry.
+
         Args:
             measure_id: The measure identifier.
 
@@ -129,9 +274,7 @@ class MeasureRegistry:
         Raises:
             MeasureNotFoundError: If no versions exist.
         """
-        versions = self.list_versions(measure_id)
-        if not versions:
+        latest = self.version_index.latest(measure_id)
+        if latest is None:
             raise MeasureNotFoundError(f"No versions found for measure: {measure_id}")
-        # Simple string sort works for semver if all have same number of digits
-        latest = versions[-1]
         return self.get(measure_id, latest)
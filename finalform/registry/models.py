@@ -1,8 +1,57 @@
 """Pydantic models for measure and binding specifications."""
 
-from typing import Literal
+from typing import TYPE_CHECKING, Any, Literal, TypeVar
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
+
+from finalform.registry.fingerprint import spec_fingerprint
+
+if TYPE_CHECKING:
+    from finalform.registry.plan import BindingPlan, MeasurePlan
+
+
+class _CompiledState:
+    """Derived data cached on a loaded spec.
+
+    Holds values computed from the spec's fields (such as the compiled
+    lookup plan and the content fingerprint). It never takes part in
+    model equality: two specs with the same fields are equal whether or
+    not either has been compiled.
+    """
+
+    __slots__ = ("plan", "fingerprint")
+
+    def __init__(self) -> None:
+        self.plan: MeasurePlan | BindingPlan | None = None
+        self.fingerprint: str | None = None
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, _CompiledState)
+
+    __hash__ = None  # type: ignore[assignment]
+
+
+_SpecT = TypeVar("_SpecT", bound="_CompiledSpec")
+
+
+class _CompiledSpec(BaseModel):
+    """Base for specs that cache a _CompiledState.
+
+    Copies (model_copy(), copy.copy(), copy.deepcopy()) start with empty
+    state, since an update may change the fields it was derived from.
+    """
+
+    _compiled: _CompiledState = PrivateAttr(default_factory=_CompiledState)
+
+    def __copy__(self: _SpecT) -> _SpecT:
+        copied = super().__copy__()
+        copied._compiled = _CompiledState()
+        return copied
+
+    def __deepcopy__(self: _SpecT, memo: dict[int, Any] | None = None) -> _SpecT:
+        copied = super().__deepcopy__(memo)
+        copied._compiled = _CompiledState()
+        return copied
 
 
 class Interpretation(BaseModel):
@@ -40,7 +89,7 @@ class MeasureItem(BaseModel):
     aliases: dict[str, str] = Field(default_factory=dict)
 
 
-class MeasureSpec(BaseModel):
+class MeasureSpec(_CompiledSpec):
     """Complete measure specification."""
 
     type: Literal["measure_spec"]
@@ -54,19 +103,33 @@ class MeasureSpec(BaseModel):
     items: list[MeasureItem]
     scales: list[MeasureScale]
 
+    @property
+    def plan(self) -> "MeasurePlan":
+        """Compiled lookup plan for this measure, built on first access."""
+        compiled = self._compiled
+        if compiled.plan is None:
+            from finalform.registry.plan import compile_measure
+
+            compiled.plan = compile_measure(self)
+        return compiled.plan  # type: ignore[return-value]
+
+    @property
+    def fingerprint(self) -> str:
+        """Content hash of this measure spec, computed on first access."""
+        compiled = self._compiled
+        if compiled.fingerprint is None:
+            compiled.fingerprint = spec_fingerprint(self)
+        return compiled.fingerprint
+
     def get_item(self, item_id: str) -> MeasureItem | None:
         """Get an item by its ID."""
-        for item in self.items:
-            if item.item_id == item_id:
-                return item
-        return None
+        item_plan = self.plan.items_by_id.get(item_id)
+        return item_plan.spec if item_plan else None
 
     def get_scale(self, scale_id: str) -> MeasureScale | None:
         """Get a scale by its ID."""
-        for scale in self.scales:
-            if scale.scale_id == scale_id:
-                return scale
-        return None
+        scale_plan = self.plan.scales_by_id.get(scale_id)
+        return scale_plan.spec if scale_plan else None
 
 
 class Binding(BaseModel):
@@ -86,7 +149,7 @@ class BindingSection(BaseModel):
     bindings: list[Binding]
 
 
-class FormBindingSpec(BaseModel):
+class FormBindingSpec(_CompiledSpec):
     """Complete form binding specification."""
 
     type: Literal["form_binding_spec"]
@@ -96,6 +159,24 @@ class FormBindingSpec(BaseModel):
     description: str | None = None
     sections: list[BindingSection]
 
+    @property
+    def plan(self) -> "BindingPlan":
+        """Compiled field routing table for this binding, built on first access."""
+        compiled = self._compiled
+        if compiled.plan is None:
+            from finalform.registry.plan import compile_binding
+
+            compiled.plan = compile_binding(self)
+        return compiled.plan  # type: ignore[return-value]
+
+    @property
+    def fingerprint(self) -> str:
+        """Content hash of this binding spec, computed on first access."""
+        compiled = self._compiled
+        if compiled.fingerprint is None:
+            compiled.fingerprint = spec_fingerprint(self)
+        return compiled.fingerprint
+
     def get_section_for_measure(self, measure_id: str) -> BindingSection | None:
         """Get the binding section for a specific measure."""
         for section in self.sections:
@@ -0,0 +1,512 @@
+"""Compiled lookup plans for measure and binding specifications.
+
+A MeasurePlan is built once per loaded MeasureSpec. It holds the dict
+indexes and precomputed constants that the pipeline stages need, so
+per-item and per-scale lookups are O(1) instead of linear scans over
+the spec's item and scale lists. A BindingPlan does the same for a
+FormBindingSpec: it routes form fields straight to binding slots.
+
+Plans are immutable snapshots of the spec they were compiled from.
+Specs are treated as read-only once loaded; a spec that is mutated
+after its plan was built must be recompiled with compile_measure() or
+compile_binding().
+"""
+
+from bisect import bisect_left
+from collections.abc import Callable, Collection
+from dataclasses import dataclass, field
+from typing import Literal
+
+from finalform.registry.models import FormBindingSpec, MeasureItem, MeasureScale, MeasureSpec
+
+RecodeStrategy = Literal["text", "numeric", "mixed"]
+# (total of present values, number of present values, factor) -> score
+ScoreFunction = Callable[[int | float, int, float], float]
+# Widest band range (max - min + 1) that gets a dense integer table
+DENSE_BAND_SPAN = 1024
+
+
+@dataclass(frozen=True, slots=True)
+class ItemPlan:
+    """Compiled lookup data for a single measure item."""
+
+    item_id: str
+    index: int  # position in MeasureSpec.items
+    spec: MeasureItem
+    min_value: int | None  # None if the response_map is empty
+    max_value: int | None
+    scale_ids: tuple[str, ...]  # scales that include this item
+    # Normalized response text -> value, with aliases folded in
+    responses: dict[str, int]
+    # Keys of responses that also parse as numbers (numeric parsing wins)
+    numeric_responses: frozenset[str]
+    # How to recode text answers; see recode_strategy()
+    strategy: RecodeStrategy
+
+
+@dataclass(frozen=True, slots=True)
+class BandTable:
+    """Compiled interpretation bands of a scale.
+
+    A score gets the first listed band whose inclusive [min, max] range
+    contains it. Bands may be unsorted, overlap or leave gaps, so the
+    table resolves them once: bounds holds every distinct band min and
+    max in order, at_bound the band for a score equal to a bound, and
+    between the band for scores strictly between two consecutive bounds.
+    Integer scores from dense_min to dense_max also have a direct entry
+    in dense, which is empty when the bands span more than
+    DENSE_BAND_SPAN scores. Bands are indexes into the scale's
+    interpretations, -1 for none.
+
+    overlaps lists each pair of bands (in listed order) that share a
+    score, and gaps each inclusive integer score range between the lowest
+    and highest band that no band covers. Bands with min > max cover
+    nothing and take part in neither.
+    """
+
+    bounds: tuple[int, ...]
+    at_bound: tuple[int, ...]  # aligned with bounds
+    between: tuple[int, ...]  # len(bounds) - 1 entries
+    dense_min: int
+    dense_max: int
+    dense: tuple[int, ...]  # band for each integer score from dense_min
+    overlaps: tuple[tuple[int, int], ...]  # (earlier band, later band)
+    gaps: tuple[tuple[int, int], ...]  # (first score, last score)
+
+    def find(self, value: float) -> int:
+        """Get the index of the first band containing a score, or -1."""
+        if self.dense_min <= value <= self.dense_max:
+            score = int(value)
+            if score == value:
+                return self.dense[score - self.dense_min]
+        position = bisect_left(self.bounds, value)
+        if position < len(self.bounds):
+            if self.bounds[position] == value:
+                return self.at_bound[position]
+            if position:
+                return self.between[position - 1]
+        return -1
+
+
+@dataclass(frozen=True, slots=True)
+class ScalePlan:
+    """Compiled lookup data for a single measure scale."""
+
+    scale_id: str
+    index: int  # position in MeasureSpec.scales
+    spec: MeasureScale
+    item_ids: tuple[str, ...]
+    item_indexes: tuple[int | None, ...]  # None for items unknown to the measure
+    reversed_mask: tuple[bool, ...]  # aligned with item_ids
+    reverse_max: int | None  # max anchor of the scale's first item
+    # Times each entry of item_ids is reverse scored (0 if reverse_max is None)
+    reverse_counts: tuple[int, ...]
+    has_repeats: bool  # some item is listed more than once
+    # Score from the present values: score_fn(total, count, score_factors[count])
+    score_fn: ScoreFunction
+    score_factors: tuple[float, ...]  # indexed by number of present values
+    bands: BandTable
+
+
+@dataclass(frozen=True, slots=True)
+class MeasurePlan:
+    """Compiled, read-only lookup plan for a measure specification.
+
+    The dict attributes must not be mutated; they are shared by every
+    stage that processes the measure.
+    """
+
+    measure_id: str
+    version: str
+    items: tuple[ItemPlan, ...]
+    scales: tuple[ScalePlan, ...]
+    items_by_id: dict[str, ItemPlan]
+    scales_by_id: dict[str, ScalePlan]
+    item_ids: frozenset[str]
+
+    def get_item(self, item_id: str) -> ItemPlan | None:
+        """Get an item plan by item ID."""
+        return self.items_by_id.get(item_id)
+
+    def get_scale(self, scale_id: str) -> ScalePlan | None:
+        """Get a scale plan by scale ID."""
+        return self.scales_by_id.get(scale_id)
+
+
+def normalize_response(text: str) -> str:
+    """Normalize response text for lookup: lowercase and strip whitespace."""
+    return text.lower().strip()
+
+
+def _is_numeric(text: str) -> bool:
+    """Whether text parses as a number."""
+    try:
+        float(text)
+    except ValueError:
+        return False
+    return True
+
+
+def compile_responses(item: MeasureItem) -> dict[str, int]:
+    """Build an item's normalized response table with aliases folded in.
+
+    Looking up normalize_response(answer) in the table gives the same
+    result as resolving the answer through the item's aliases and then
+    its response_map. An alias takes precedence over a response with the
+    same text, so an alias whose canonical text is not a response removes
+    that text from the table.
+
+    Args:
+        item: The measure item to compile.
+
+    Returns:
+        Dict of normalized response text to value.
+    """
+    response_map = {normalize_response(k): v for k, v in item.response_map.items()}
+    responses = dict(response_map)
+    aliases = {normalize_response(k): v for k, v in item.aliases.items()}
+    for alias, canonical in aliases.items():
+        value = response_map.get(normalize_response(canonical))
+        if value is None:
+            responses.pop(alias, None)
+        else:
+            responses[alias] = value
+    return responses
+
+
+def recode_strategy(item: MeasureItem, numeric_responses: frozenset[str]) -> RecodeStrategy:
+    """Choose how an item's text answers are recoded.
+
+    - "text": no response text parses as a number, so a text answer is
+      looked up first and only parsed as a number if the lookup misses.
+    - "numeric": every response_map key is a number, so a text answer is
+      parsed as a number first and only looked up if that fails.
+    - "mixed": otherwise. A lookup hit is used unless the text also
+      parses as a number, in which case numeric parsing wins.
+
+    All three give the same result; they differ only in which check runs
+    first for the answers the item usually gets.
+
+    Args:
+        item: The measure item.
+        numeric_responses: Keys of the item's response table that parse
+            as numbers.
+
+    Returns:
+        The item's recode strategy.
+    """
+    if not numeric_responses:
+        return "text"
+    if item.response_map and all(_is_numeric(text) for text in item.response_map):
+        return "numeric"
+    return "mixed"
+
+
+def _scaled_total(total: int | float, count: int, factor: float) -> float:
+    """Score for sum-based methods: the total times the count's factor."""
+    return total * factor
+
+
+def _mean(total: int | float, count: int, factor: float) -> float:
+    """Score for the average method: the mean of the present values."""
+    return total / count
+
+
+def score_factors(scale: MeasureScale) -> tuple[float, ...]:
+    """Build a scale's factor table for sum-based scoring.
+
+    Entry n is the multiplier for a total of n present values: the
+    proration factor len(items) / n (1.0 when nothing is missing), doubled
+    for sum_then_double. Doubling is exact in floating point, so
+    total * factor equals prorating and then doubling. The average method
+    ignores the table.
+
+    Args:
+        scale: The measure scale.
+
+    Returns:
+        Tuple of len(scale.items) + 1 factors (entry 0 is unused).
+    """
+    items_total = len(scale.items)
+    multiplier = 2 if scale.method == "sum_then_double" else 1
+    return (0.0,) + tuple(
+        items_total / count * multiplier for count in range(1, items_total + 1)
+    )
+
+
+def compile_bands(scale: MeasureScale) -> BandTable:
+    """Compile a scale's interpretation bands into a lookup table.
+
+    Membership in every band is the same for all scores strictly between
+    two consecutive bounds, so resolving one score per bound and one per
+    gap gives the same band as scanning the list for any score.
+
+    Args:
+        scale: The measure scale.
+
+    Returns:
+        The scale's BandTable.
+    """
+    bands = scale.interpretations
+
+    def first_band(value: float) -> int:
+        for index, band in enumerate(bands):
+            if band.min <= value <= band.max:
+                return index
+        return -1
+
+    # Overlaps and gaps are recorded for reporting; lookups already
+    # resolve them to the first listed band, or none
+    ranges = [
+        (index, band.min, band.max) for index, band in enumerate(bands) if band.min <= band.max
+    ]
+    overlaps = [
+        (first, second)
+        for position, (first, low, high) in enumerate(ranges)
+        for second, other_low, other_high in ranges[position + 1 :]
+        if low <= other_high and other_low <= high
+    ]
+    gaps: list[tuple[int, int]] = []
+    covered: int | None = None  # highest score covered by the bands so far
+    for _, low, high in sorted(ranges, key=lambda band: band[1]):
+        if covered is not None and low > covered + 1:
+            gaps.append((covered + 1, low - 1))
+        covered = high if covered is None else max(covered, high)
+
+    bounds = sorted({bound for band in bands for bound in (band.min, band.max)})
+    if bounds and bounds[-1] - bounds[0] < DENSE_BAND_SPAN:
+        dense_min, dense_max = bounds[0], bounds[-1]
+    else:
+        dense_min, dense_max = 0, -1
+    return BandTable(
+        bounds=tuple(bounds),
+        at_bound=tuple(first_band(bound) for bound in bounds),
+        between=tuple(first_band((low + high) / 2) for low, high in zip(bounds, bounds[1:])),
+        dense_min=dense_min,
+        dense_max=dense_max,
+        dense=tuple(first_band(score) for score in range(dense_min, dense_max + 1)),
+        overlaps=tuple(overlaps),
+        gaps=tuple(gaps),
+    )
+
+
+def compile_measure(spec: MeasureSpec) -> MeasurePlan:
+    """Compile a measure specification into a lookup plan.
+
+    Duplicate item or scale IDs resolve to the first occurrence, matching
+    the historical linear-scan behavior of MeasureSpec.get_item/get_scale.
+
+    Args:
+        spec: The measure specification to compile.
+
+    Returns:
+        The compiled MeasurePlan.
+    """
+    # Reverse map: item_id -> scale_ids that include it (in scale order)
+    item_scales: dict[str, list[str]] = {}
+    for scale in spec.scales:
+        for item_id in scale.items:
+            scale_ids = item_scales.setdefault(item_id, [])
+            if scale.scale_id not in scale_ids:
+                scale_ids.append(scale.scale_id)
+
+    items: list[ItemPlan] = []
+    items_by_id: dict[str, ItemPlan] = {}
+    for index, item in enumerate(spec.items):
+        values = item.response_map.values()
+        responses = compile_responses(item)
+        numeric_responses = frozenset(text for text in responses if _is_numeric(text))
+        item_plan = ItemPlan(
+            item_id=item.item_id,
+            index=index,
+            spec=item,
+            min_value=min(values) if values else None,
+            max_value=max(values) if values else None,
+            scale_ids=tuple(item_scales.get(item.item_id, ())),
+            responses=responses,
+            numeric_responses=numeric_responses,
+            strategy=recode_strategy(item, numeric_responses),
+        )
+        items.append(item_plan)
+        items_by_id.setdefault(item.item_id, item_plan)
+
+    scales: list[ScalePlan] = []
+    scales_by_id: dict[str, ScalePlan] = {}
+    for index, scale in enumerate(spec.scales):
+        reversed_ids = set(scale.reversed_items)
+        item_indexes = tuple(
+            items_by_id[item_id].index if item_id in items_by_id else None
+            for item_id in scale.items
+        )
+        # Reverse scoring uses the first item's response range for the
+        # whole scale (all items in a scale share the same anchors)
+        first_item = items_by_id.get(scale.items[0]) if scale.items else None
+        reverse_max = first_item.max_value if first_item else None
+        if scale.reversed_items and reverse_max is not None:
+            reverse_counts = tuple(scale.reversed_items.count(item_id) for item_id in scale.items)
+        else:
+            reverse_counts = (0,) * len(scale.items)
+        scale_plan = ScalePlan(
+            scale_id=scale.scale_id,
+            index=index,
+            spec=scale,
+            item_ids=tuple(scale.items),
+            item_indexes=item_indexes,
+            reversed_mask=tuple(item_id in reversed_ids for item_id in scale.items),
+            reverse_max=reverse_max,
+            reverse_counts=reverse_counts,
+            has_repeats=len(set(scale.items)) < len(scale.items),
+            score_fn=_mean if scale.method == "average" else _scaled_total,
+            score_factors=score_factors(scale),
+            bands=compile_bands(scale),
+        )
+        scales.append(scale_plan)
+        scales_by_id.setdefault(scale.scale_id, scale_plan)
+
+    return MeasurePlan(
+        measure_id=spec.measure_id,
+        version=spec.version,
+        items=tuple(items),
+        scales=tuple(scales),
+        items_by_id=items_by_id,
+        scales_by_id=scales_by_id,
+        item_ids=frozenset(items_by_id),
+    )
+
+
+@dataclass(frozen=True, slots=True)
+class BindingSectionPlan:
+    """Compiled data for one section of a binding spec."""
+
+    index: int  # position in FormBindingSpec.sections
+    measure_id: str
+    measure_version: str
+    slots: range  # indexes into BindingPlan.slot_item_ids, in binding order
+
+
+@dataclass(frozen=True, slots=True)
+class BindingPlan:
+    """Compiled, read-only routing table for a form binding spec.
+
+    Every Binding is a slot, numbered in section and binding order.
+    by_field_key and by_position map a form field to the slots it fills,
+    so a form response can be mapped in one pass over its items. The
+    dict attributes must not be mutated.
+    """
+
+    binding_id: str
+    version: str
+    sections: tuple[BindingSectionPlan, ...]
+    slot_item_ids: tuple[str, ...]
+    slot_sections: tuple[int, ...]  # section index of each slot
+    by_field_key: dict[str, tuple[int, ...]]
+    by_position: dict[int, tuple[int, ...]]
+    # Sub-plans built by select(), keyed by the requested measure IDs
+    _selections: dict[frozenset[str], "BindingPlan"] = field(
+        default_factory=dict, compare=False, repr=False
+    )
+
+    def select(self, measure_ids: Collection[str]) -> "BindingPlan":
+        """Get a plan restricted to the sections for the given measures.
+
+        The sub-plan's slots are renumbered, but its sections keep their
+        index in the full binding. Sub-plans are cached per set of IDs.
+
+        Args:
+            measure_ids: Measure IDs whose sections to keep.
+
+        Returns:
+            A BindingPlan with only the matching sections.
+        """
+        key = frozenset(measure_ids)
+        selected = self._selections.get(key)
+        if selected is None:
+            selected = _restrict(self, key)
+            self._selections[key] = selected
+        return selected
+
+
+def _restrict(plan: BindingPlan, measure_ids: frozenset[str]) -> BindingPlan:
+    """Build a sub-plan holding only the sections for measure_ids."""
+    sections: list[BindingSectionPlan] = []
+    slot_item_ids: list[str] = []
+    slot_sections: list[int] = []
+    old_to_new: dict[int, int] = {}
+
+    for section in plan.sections:
+        if section.measure_id not in measure_ids:
+            continue
+        start = len(slot_item_ids)
+        for old_slot in section.slots:
+            old_to_new[old_slot] = len(slot_item_ids)
+            slot_item_ids.append(plan.slot_item_ids[old_slot])
+            slot_sections.append(section.index)
+        sections.append(
+            BindingSectionPlan(
+                index=section.index,
+                measure_id=section.measure_id,
+                measure_version=section.measure_version,
+                slots=range(start, len(slot_item_ids)),
+            )
+        )
+
+    def renumber(slots: tuple[int, ...]) -> tuple[int, ...]:
+        return tuple(old_to_new[slot] for slot in slots if slot in old_to_new)
+
+    by_field_key = {key: renumber(slots) for key, slots in plan.by_field_key.items()}
+    by_position = {key: renumber(slots) for key, slots in plan.by_position.items()}
+
+    return BindingPlan(
+        binding_id=plan.binding_id,
+        version=plan.version,
+        sections=tuple(sections),
+        slot_item_ids=tuple(slot_item_ids),
+        slot_sections=tuple(slot_sections),
+        by_field_key={key: slots for key, slots in by_field_key.items() if slots},
+        by_position={key: slots for key, slots in by_position.items() if slots},
+    )
+
+
+def compile_binding(spec: FormBindingSpec) -> BindingPlan:
+    """Compile a form binding specification into a routing table.
+
+    Args:
+        spec: The binding specification to compile.
+
+    Returns:
+        The compiled BindingPlan.
+    """
+    sections: list[BindingSectionPlan] = []
+    slot_item_ids: list[str] = []
+    slot_sections: list[int] = []
+    by_field_key: dict[str, list[int]] = {}
+    by_position: dict[int, list[int]] = {}
+
+    for section_index, section in enumerate(spec.sections):
+        start = len(slot_item_ids)
+        for binding in section.bindings:
+            slot = len(slot_item_ids)
+            slot_item_ids.append(binding.item_id)
+            slot_sections.append(section_index)
+            if binding.by == "field_key":
+                by_field_key.setdefault(str(binding.value), []).append(slot)
+            else:
+                by_position.setdefault(int(binding.value), []).append(slot)
+        sections.append(
+            BindingSectionPlan(
+                index=section_index,
+                measure_id=section.measure_id,
+                measure_version=section.measure_version,
+                slots=range(start, len(slot_item_ids)),
+            )
+        )
+
+    return BindingPlan(
+        binding_id=spec.binding_id,
+        version=spec.version,
+        sections=tuple(sections),
+        slot_item_ids=tuple(slot_item_ids),
+        slot_sections=tuple(slot_sections),
+        by_field_key={key: tuple(slots) for key, slots in by_field_key.items()},
+        by_position={key: tuple(slots) for key, slots in by_position.items()},
+    )
@@ -0,0 +1,99 @@
+"""Parallel eager loading of registry specs.
+
+Long-running workers can pay all registry I/O, schema validation and
+plan compilation up front instead of on the first form that touches a
+rarely used measure.
+"""
+
+import time
+from collections.abc import Callable, Iterable
+from concurrent.futures import FIRST_EXCEPTION, Future, ThreadPoolExecutor, wait
+from typing import Any
+
+from pydantic import BaseModel
+
+
+class PreloadError(Exception):
+    """Raised when one or more specs fail to load during preload."""
+
+    def __init__(self, errors: list[str]) -> None:
+        self.errors = errors
+        super().__init__(
+            f"Failed to preload {len(errors)} spec(s):\n" + "\n".join(f"  - {e}" for e in errors)
+        )
+
+
+class PreloadReport(BaseModel):
+    """Per-spec load timings from a preload."""
+
+    timings: dict[str, float]  # "<spec_id>@<version>" -> seconds
+    total_seconds: float
+
+    @property
+    def count(self) -> int:
+        """Number of specs loaded."""
+        return len(self.timings)
+
+    @property
+    def slowest(self) -> tuple[str, float] | None:
+        """The slowest spec to load and its time, if any were loaded."""
+        if not self.timings:
+            return None
+        return max(self.timings.items(), key=lambda item: item[1])
+
+
+def preload_specs(
+    load: Callable[[str, str], Any],
+    keys: Iterable[tuple[str, str]],
+    max_workers: int | None = None,
+) -> PreloadReport:
+    """Load specs concurrently with a thread pool.
+
+    Stops scheduling new loads at the first failure, waits for loads
+    already running, and raises every error seen.
+
+    Args:
+        load: Loader called as load(spec_id, version), e.g. registry.get.
+        keys: (spec_id, version) pairs to load.
+        max_workers: Thread pool size (default: ThreadPoolExecutor's default).
+
+    Returns:
+        PreloadReport with per-spec timings.
+
+    Raises:
+        PreloadError: If any spec failed to load.
+    """
+
+    def timed_load(spec_id: str, version: str) -> float:
+        start = time.perf_counter()
+        load(spec_id, version)
+        return time.perf_counter() - start
+
+    start = time.perf_counter()
+    timings: dict[str, float] = {}
+    errors: list[str] = []
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures: dict[Future[float], str] = {
+            executor.submit(timed_load, spec_id, version): f"{spec_id}@{version}"
+            for spec_id, version in keys
+        }
+        _, pending = wait(futures, return_when=FIRST_EXCEPTION)
+        # A load failed: cancel loads that have not started yet. Leaving
+        # the executor waits for the ones already running.
+        for future in pending:
+            future.cancel()
+
+    for future, name in futures.items():
+        if future.cancelled():
+            continue
+        exc = future.exception()
+        if exc is not None:
+            errors.append(f"{name}: {exc}")
+        else:
+            timings[name] = future.result()
+
+    if errors:
+        raise PreloadError(errors)
+
+    return PreloadReport(timings=timings, total_seconds=time.perf_counter() - start)
@@ -0,0 +1,79 @@
+"""Process-wide cache of compiled JSON Schema validators.
+
+Building a jsonschema validator resolves the metaschema and checks the
+schema itself, which costs far more than validating a single spec.
+get_validator() does that once per schema file and content hash, and the
+compiled validator is shared by the registries, the CLI and any other
+schema validation (including output schemas).
+"""
+
+import hashlib
+import json
+import threading
+from pathlib import Path
+from typing import Any
+
+import jsonschema
+from jsonschema.protocols import Validator
+
+_validators: dict[tuple[str, str], Validator] = {}
+_lock = threading.Lock()
+
+
+def get_validator(schema_path: Path | str) -> Validator:
+    """Get the compiled validator for a schema file.
+
+    The schema file is re-read on every call so an edited schema gets a
+    new validator, but the validator itself is only built once per
+    (path, content hash).
+
+    Args:
+        schema_path: Path to a JSON Schema file.
+
+    Returns:
+        A validator for the schema's declared draft (latest draft if none).
+
+    Raises:
+        jsonschema.SchemaError: If the schema itself is invalid.
+    """
+    path = Path(schema_path).resolve()
+    content = path.read_bytes()
+    cache_key = (str(path), hashlib.sha256(content).hexdigest())
+
+    validator = _validators.get(cache_key)
+    if validator is not None:
+        return validator
+
+    with _lock:
+        validator = _validators.get(cache_key)
+        if validator is None:
+            schema = json.loads(content)
+            validator_cls = jsonschema.validators.validator_for(schema)
+            validator_cls.check_schema(schema)
+            validator = validator_cls(schema)
+            _validators[cache_key] = validator
+    return validator
+
+
+def schema_errors(validator: Validator, data: Any) -> list[str]:
+    """Validate data and return every error, not just the first.
+
+    Args:
+        validator: A compiled validator from get_validator().
+        data: The instance to validate.
+
+    Returns:
+        Error messages prefixed with their JSON path, sorted by location
+        (empty if the data is valid).
+    """
+    errors = sorted(
+        validator.iter_errors(data),
+        key=lambda e: [str(part) for part in e.absolute_path],
+    )
+    return [f"{e.json_path}: {e.message}" for e in errors]
+
+
+def clear_validator_cache() -> None:
+    """Drop all cached validators."""
+    with _lock:
+        _validators.clear()
@@ -0,0 +1,348 @@
+"""Precompiled registry snapshots for fast startup.
+
+A snapshot is a single binary file holding every measure and binding spec
+of a registry pair, already schema-validated, parsed into pydantic models
+and compiled into lookup plans. Registries constructed with a snapshot
+skip JSON parsing and schema validation.
+
+The file is a small header (the file index) followed by one pickled spec
+per distinct source file. Loading reads only the header; a spec is read
+from its offset when a registry first needs it, so registries keep no
+more specs in memory than their cache holds.
+
+Specs are stored keyed by the SHA-256 of their source file, and the
+snapshot records the size, mtime and hash of every file it was built
+from. Loading verifies the snapshot against the registry directories and
+rejects it with StaleSnapshotError if any spec or schema was added,
+removed or changed since it was compiled.
+
+Snapshots are pickles: only load snapshot files you produced yourself.
+"""
+
+import hashlib
+import os
+import pickle
+import struct
+from dataclasses import dataclass, field, replace
+from datetime import datetime, timezone
+from pathlib import Path
+
+from pydantic import BaseModel
+
+from finalform import __version__
+
+SNAPSHOT_FORMAT = 3
+# Header length prefix: unsigned 64-bit little-endian
+_HEADER_LENGTH = struct.Struct("<Q")
+
+
+class SnapshotError(Exception):
+    """Raised when a registry snapshot cannot be read or written."""
+
+    pass
+
+
+class StaleSnapshotError(SnapshotError):
+    """Raised when a snapshot no longer matches the registry on disk."""
+
+    pass
+
+
+@dataclass(frozen=True, slots=True)
+class SnapshotFile:
+    """Fingerprint of a single spec file at compile time."""
+
+    spec_id: str
+    version: str
+    relpath: str  # relative to the registry's spec directory
+    size: int
+    mtime_ns: int
+    sha256: str
+
+
+@dataclass
+class RegistrySnapshot:
+    """Validated measure and binding specs for a registry pair.
+
+    A compiled snapshot holds its specs in specs. A loaded snapshot holds
+    only the file index: spec_offsets locates each spec in the file it was
+    loaded from, and load_spec() reads it on demand.
+    """
+
+    format: int
+    final_form_version: str
+    created_at: str
+    measure_schema_sha256: str | None
+    binding_schema_sha256: str | None
+    measure_files: list[SnapshotFile] = field(default_factory=list)
+    binding_files: list[SnapshotFile] = field(default_factory=list)
+    specs: dict[str, BaseModel] = field(default_factory=dict)  # sha256 -> spec
+    # sha256 -> (offset, length) of the pickled spec, from the end of the header
+    spec_offsets: dict[str, tuple[int, int]] = field(default_factory=dict)
+    # Set by load_snapshot(): the file, where its specs start, and its
+    # (inode, size, mtime_ns) when loaded
+    path: Path | None = field(default=None, compare=False)
+    data_offset: int = field(default=0, compare=False)
+    file_stat: tuple[int, int, int] | None = field(default=None, compare=False)
+
+    def measures(self) -> dict[tuple[str, str], str]:
+        """Return the SHA-256 of each measure spec keyed by (measure_id, version)."""
+        return {(f.spec_id, f.version): f.sha256 for f in self.measure_files}
+
+    def bindings(self) -> dict[tuple[str, str], str]:
+        """Return the SHA-256 of each binding spec keyed by (binding_id, version)."""
+        return {(f.spec_id, f.version): f.sha256 for f in self.binding_files}
+
+    def load_spec(self, sha256: str) -> BaseModel:
+        """Get a spec by the SHA-256 of its source file.
+
+        Specs of a loaded snapshot are read from its file on every call;
+        callers cache them.
+
+        Args:
+            sha256: Hash from measures() or bindings().
+
+        Returns:
+            The spec, with its lookup plan compiled.
+
+        Raises:
+            SnapshotError: If the spec is not in the snapshot, or the
+                snapshot file was replaced or removed since it was loaded.
+        """
+        spec = self.specs.get(sha256)
+        if spec is not None:
+            return spec
+        location = self.spec_offsets.get(sha256)
+        if location is None or self.path is None:
+            raise SnapshotError(f"Spec {sha256} is not in the registry snapshot")
+
+        offset, length = location
+        try:
+            with open(self.path, "rb") as f:
+                stat = os.fstat(f.fileno())
+                if (stat.st_ino, stat.st_size, stat.st_mtime_ns) != self.file_stat:
+                    raise SnapshotError(
+                        f"Registry snapshot {self.path} changed since it was loaded"
+                    )
+                f.seek(self.data_offset + offset)
+                data = f.read(length)
+        except OSError as e:
+            raise SnapshotError(f"Could not read registry snapshot {self.path}: {e}") from e
+        return pickle.loads(data)
+
+    def verify_measures(
+        self,
+        measures_path: Path,
+        schema_path: Path | str | None = None,
+    ) -> None:
+        """Check the measure part of the snapshot against the files on disk.
+
+        Raises:
+            StaleSnapshotError: If the snapshot is out of date.
+        """
+        _verify_schema(self.measure_schema_sha256, schema_path, "measure")
+        _verify_files(self.measure_files, measures_path)
+
+    def verify_bindings(
+        self,
+        bindings_path: Path,
+        schema_path: Path | str | None = None,
+    ) -> None:
+        """Check the binding part of the snapshot against the files on disk.
+
+        Raises:
+            StaleSnapshotError: If the snapshot is out of date.
+        """
+        _verify_schema(self.binding_schema_sha256, schema_path, "binding")
+        _verify_files(self.binding_files, bindings_path)
+
+
+def _sha256_file(path: Path) -> str:
+    """Return the hex SHA-256 of a file's bytes."""
+    return hashlib.sha256(path.read_bytes()).hexdigest()
+
+
+def _spec_files(spec_dir: Path) -> list[Path]:
+    """List spec files as <spec_dir>/<spec_id>/<version>.json, sorted."""
+    if not spec_dir.exists():
+        return []
+    return sorted(spec_dir.glob("*/*.json"))
+
+
+def _verify_schema(
+    expected_sha256: str | None,
+    schema_path: Path | str | None,
+    kind: str,
+) -> None:
+    """Reject a snapshot not validated against the schema the registry expects.
+
+    A registry without a schema accepts any snapshot.
+    """
+    if not schema_path:
+        return
+    if _sha256_file(Path(schema_path)) != expected_sha256:
+        raise StaleSnapshotError(
+            f"Snapshot was compiled with a different {kind} schema; "
+            f"re-run 'finalform registry compile'"
+        )
+
+
+def _verify_files(files: list[SnapshotFile], spec_dir: Path) -> None:
+    """Reject a snapshot whose spec files were added, removed or edited."""
+    on_disk = {path.relative_to(spec_dir).as_posix(): path for path in _spec_files(spec_dir)}
+    recorded = {f.relpath: f for f in files}
+
+    added = sorted(on_disk.keys() - recorded.keys())
+    removed = sorted(recorded.keys() - on_disk.keys())
+    if added or removed:
+        raise StaleSnapshotError(
+            f"Snapshot is stale for {spec_dir}: added={added}, removed={removed}; "
+            f"re-run 'finalform registry compile'"
+        )
+
+    for relpath, entry in recorded.items():
+        stat = on_disk[relpath].stat()
+        if stat.st_size == entry.size and stat.st_mtime_ns == entry.mtime_ns:
+            continue
+        # Metadata changed (e.g. copied or touched) - fall back to content hash
+        if _sha256_file(on_disk[relpath]) != entry.sha256:
+            raise StaleSnapshotError(
+                f"Snapshot is stale for {spec_dir}: {relpath} changed; "
+                f"re-run 'finalform registry compile'"
+            )
+
+
+def compile_snapshot(
+    measure_registry_path: Path | str,
+    binding_registry_path: Path | str,
+    measure_schema_path: Path | str | None = None,
+    binding_schema_path: Path | str | None = None,
+) -> RegistrySnapshot:
+    """Load, validate and compile every spec in a registry pair.
+
+    Args:
+        measure_registry_path: Path to the measure registry directory.
+        binding_registry_path: Path to the form binding registry directory.
+        measure_schema_path: Optional measure_spec schema for validation.
+        binding_schema_path: Optional form_binding_spec schema for validation.
+
+    Returns:
+        The compiled RegistrySnapshot.
+
+    Raises:
+        MeasureValidationError: If a measure spec fails validation.
+        BindingValidationError: If a binding spec fails validation.
+    """
+    from finalform.registry.bindings import BindingRegistry
+    from finalform.registry.measures import MeasureRegistry
+
+    measure_registry = MeasureRegistry(measure_registry_path, schema_path=measure_schema_path)
+    binding_registry = BindingRegistry(binding_registry_path, schema_path=binding_schema_path)
+
+    snapshot = RegistrySnapshot(
+        format=SNAPSHOT_FORMAT,
+        final_form_version=__version__,
+        created_at=datetime.now(timezone.utc).isoformat(),
+        measure_schema_sha256=(
+            _sha256_file(Path(measure_schema_path)) if measure_schema_path else None
+        ),
+        binding_schema_sha256=(
+            _sha256_file(Path(binding_schema_path)) if binding_schema_path else None
+        ),
+    )
+
+    for spec_dir, files, registry in (
+        (measure_registry.measures_path, snapshot.measure_files, measure_registry),
+        (binding_registry.bindings_path, snapshot.binding_files, binding_registry),
+    ):
+        for path in _spec_files(spec_dir):
+            stat = path.stat()
+            entry = SnapshotFile(
+                spec_id=path.parent.name,
+                version=path.stem.replace("-", "."),
+                relpath=path.relative_to(spec_dir).as_posix(),
+                size=stat.st_size,
+                mtime_ns=stat.st_mtime_ns,
+                sha256=_sha256_file(path),
+            )
+            if entry.sha256 not in snapshot.specs:
+                snapshot.specs[entry.sha256] = registry.get(entry.spec_id, entry.version)
+            files.append(entry)
+
+    return snapshot
+
+
+def write_snapshot(snapshot: RegistrySnapshot, path: Path | str) -> None:
+    """Write a snapshot to disk atomically.
+
+    Args:
+        snapshot: The snapshot to write (compiled, so it holds its specs).
+        path: Destination file path.
+    """
+    path = Path(path)
+    blobs: list[bytes] = []
+    spec_offsets: dict[str, tuple[int, int]] = {}
+    offset = 0
+    for sha256 in sorted(snapshot.specs):
+        blob = pickle.dumps(snapshot.specs[sha256], protocol=pickle.HIGHEST_PROTOCOL)
+        spec_offsets[sha256] = (offset, len(blob))
+        blobs.append(blob)
+        offset += len(blob)
+    header = pickle.dumps(
+        replace(snapshot, specs={}, spec_offsets=spec_offsets, path=None, file_stat=None),
+        protocol=pickle.HIGHEST_PROTOCOL,
+    )
+
+    tmp_path = path.with_name(path.name + ".tmp")
+    with open(tmp_path, "wb") as f:
+        f.write(_HEADER_LENGTH.pack(len(header)))
+        f.write(header)
+        for blob in blobs:
+            f.write(blob)
+    os.replace(tmp_path, path)
+
+
+def load_snapshot(path: Path | str) -> RegistrySnapshot:
+    """Read a snapshot's header (its file index) from disk.
+
+    Specs are read later, one at a time, by RegistrySnapshot.load_spec().
+    The snapshot is not verified here; registries verify the parts they
+    use against their own directories.
+
+    Args:
+        path: Path to the snapshot file.
+
+    Returns:
+        The loaded RegistrySnapshot.
+
+    Raises:
+        SnapshotError: If the file is missing or not a compatible snapshot.
+        StaleSnapshotError: If the snapshot was built by another finalform version.
+    """
+    path = Path(path)
+    if not path.exists():
+        raise SnapshotError(f"Registry snapshot not found: {path}")
+
+    try:
+        with open(path, "rb") as f:
+            stat = os.fstat(f.fileno())
+            (header_length,) = _HEADER_LENGTH.unpack(f.read(_HEADER_LENGTH.size))
+            if _HEADER_LENGTH.size + header_length > stat.st_size:
+                raise ValueError("truncated header")
+            snapshot = pickle.loads(f.read(header_length))
+    except Exception as e:
+        raise SnapshotError(f"Could not read registry snapshot {path}: {e}") from e
+
+    if not isinstance(snapshot, RegistrySnapshot) or snapshot.format != SNAPSHOT_FORMAT:
+        raise SnapshotError(f"Unsupported registry snapshot format: {path}")
+
+    if snapshot.final_form_version != __version__:
+        raise StaleSnapshotError(
+            f"Snapshot was compiled by finalform {snapshot.final_form_version}, "
+            f"running {__version__}; re-run 'finalform registry compile'"
+        )
+
+    snapshot.path = path
+    snapshot.data_offset = _HEADER_LENGTH.size + header_length
+    snapshot.file_stat = (stat.st_ino, stat.st_size, stat.st_mtime_ns)
+    return snapshot
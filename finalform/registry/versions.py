@@ -0,0 +1,117 @@
+"""Semver-aware version index for spec registries.
+
+Spec files live at <spec_dir>/<spec_id>/<version>.json with dashes in
+place of dots (1-10-0.json for 1.10.0). The index walks the directory
+once, parses every version into a semver sort key, and then answers
+version listings and latest-version lookups from memory.
+"""
+
+import re
+import threading
+from pathlib import Path
+
+_SEMVER = re.compile(r"^(\d+)\.(\d+)\.(\d+)(?:[-.](.+))?$")
+
+VersionKey = tuple[object, ...]
+
+
+def parse_version(version: str) -> VersionKey:
+    """Parse a version string into a sort key with semver precedence.
+
+    Release versions compare numerically (1.10.0 > 1.9.0) and sort after
+    their pre-releases (1.0.0 > 1.0.0-rc.1). Pre-release identifiers are
+    separated by dots and compare numerically when numeric, lexically
+    otherwise. Build metadata (+...) is ignored, so 1.0.0+build has the
+    same precedence as 1.0.0. Versions that are not semver sort before
+    all semver versions, by string.
+
+    Args:
+        version: The version string (e.g., '1.10.0').
+
+    Returns:
+        A tuple usable as a sort key.
+    """
+    match = _SEMVER.match(version.partition("+")[0])
+    if match is None:
+        return (0, version)
+
+    major, minor, patch, prerelease = match.groups()
+    if prerelease is None:
+        # A release has higher precedence than any of its pre-releases
+        pre_key: tuple[object, ...] = (1,)
+    else:
+        pre_key = (
+            0,
+            tuple(
+                (0, int(part), "") if part.isdigit() else (1, 0, part)
+                for part in prerelease.split(".")
+            ),
+        )
+    return (1, int(major), int(minor), int(patch), pre_key)
+
+
+class VersionIndex:
+    """In-memory index of available spec versions.
+
+    Built lazily on first use with a single directory walk. Call
+    refresh() to rebuild it immediately, or invalidate() to have it
+    rebuilt on next use, after spec files are published or removed.
+    """
+
+    def __init__(self, spec_dir: Path) -> None:
+        """Initialize the index.
+
+        Args:
+            spec_dir: Directory containing <spec_id>/<version>.json files.
+        """
+        self.spec_dir = spec_dir
+        # (versions by spec_id, latest version by spec_id), swapped as a unit
+        self._state: tuple[dict[str, list[str]], dict[str, str]] | None = None
+        self._lock = threading.Lock()
+
+    def _build(self) -> tuple[dict[str, list[str]], dict[str, str]]:
+        """Walk the spec directory and build the index."""
+        with self._lock:
+            if self._state is not None:
+                return self._state
+
+            versions: dict[str, list[str]] = {}
+            if self.spec_dir.exists():
+                for path in self.spec_dir.glob("*/*.json"):
+                    # Convert filename back to version (1-0-0.json -> 1.0.0)
+                    version = path.stem.replace("-", ".")
+                    versions.setdefault(path.parent.name, []).append(version)
+
+            for spec_versions in versions.values():
+                # Versions differing only in build metadata tie on precedence;
+                # order those by string so the listing is deterministic
+                spec_versions.sort()
+                spec_versions.sort(key=parse_version)
+
+            latest = {spec_id: spec_versions[-1] for spec_id, spec_versions in versions.items()}
+            self._state = (versions, latest)
+            return self._state
+
+    def spec_ids(self) -> list[str]:
+        """List spec IDs that have at least one version."""
+        versions, _ = self._state or self._build()
+        return sorted(versions)
+
+    def versions(self, spec_id: str) -> list[str]:
+        """List available versions for a spec, oldest first."""
+        versions, _ = self._state or self._build()
+        return list(versions.get(spec_id, []))
+
+    def latest(self, spec_id: str) -> str | None:
+        """Get the highest available version for a spec, or None."""
+        _, latest = self._state or self._build()
+        return latest.get(spec_id)
+
+    def refresh(self) -> None:
+        """Rebuild the index from disk now."""
+        self.invalidate()
+        self._build()
+
+    def invalidate(self) -> None:
+        """Discard the index; it is rebuilt on next use."""
+        self._state = None
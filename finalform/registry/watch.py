@@ -0,0 +1,181 @@
+"""Hot reloading of registry specs for long-running processes.
+
+RegistryWatcher polls registry directories by file mtime and size. When
+spec files are added, changed or removed it rebuilds only the affected
+cache entries (off the per-form path, in the watcher thread) and swaps
+them into the registry atomically, then notifies subscribers with
+ReloadEvents so callers can log them or re-resolve their specs.
+"""
+
+import logging
+import threading
+from collections.abc import Callable
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Literal
+
+from finalform.registry.bindings import BindingRegistry
+from finalform.registry.measures import MeasureRegistry
+
+logger = logging.getLogger(__name__)
+
+FileStat = tuple[int, int]  # (mtime_ns, size)
+
+
+@dataclass(frozen=True)
+class ReloadEvent:
+    """A spec file change detected by the watcher."""
+
+    registry: Literal["measure", "binding"]
+    change: Literal["added", "changed", "removed"]
+    spec_id: str
+    version: str
+    path: Path
+    error: str | None = None  # set when the new file failed to load
+
+    def __str__(self) -> str:
+        message = f"{self.registry} {self.spec_id}@{self.version} {self.change}"
+        if self.error:
+            message += f" (reload failed, keeping previous spec: {self.error})"
+        return message
+
+
+class RegistryWatcher:
+    """Polls registries for spec file changes and reloads them in place.
+
+    Use poll() to check once, or start() to poll from a daemon thread.
+    The first poll records the current state of the registry and reports
+    no events.
+    """
+
+    def __init__(
+        self,
+        *registries: MeasureRegistry | BindingRegistry,
+        interval: float = 2.0,
+    ) -> None:
+        """Initialize the watcher.
+
+        Args:
+            registries: The registries to watch.
+            interval: Seconds between polls when running in the background.
+        """
+        self.registries = registries
+        self.interval = interval
+        self._stats: dict[int, dict[Path, FileStat]] = {}
+        self._subscribers: list[Callable[[list[ReloadEvent]], None]] = []
+        self._poll_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def subscribe(self, callback: Callable[[list[ReloadEvent]], None]) -> None:
+        """Register a callback invoked with each non-empty batch of events."""
+        self._subscribers.append(callback)
+
+    def _scan(self, spec_dir: Path) -> dict[Path, FileStat]:
+        """Stat every spec file in a registry directory."""
+        stats: dict[Path, FileStat] = {}
+        if not spec_dir.exists():
+            return stats
+        for path in spec_dir.glob("*/*.json"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue  # Removed between glob and stat
+            stats[path] = (stat.st_mtime_ns, stat.st_size)
+        return stats
+
+    def _poll_registry(
+        self,
+        registry: MeasureRegistry | BindingRegistry,
+    ) -> list[ReloadEvent]:
+        """Detect and apply changes for a single registry."""
+        kind: Literal["measure", "binding"] = (
+            "measure" if isinstance(registry, MeasureRegistry) else "binding"
+        )
+        current = self._scan(registry.version_index.spec_dir)
+        previous = self._stats.get(id(registry))
+        if previous is None:
+            self._stats[id(registry)] = current
+            return []
+
+        def key(path: Path) -> tuple[str, str]:
+            return (path.parent.name, path.stem.replace("-", "."))
+
+        changes: dict[Path, Literal["added", "changed", "removed"]] = {}
+        for path, stat in current.items():
+            if path not in previous:
+                changes[path] = "added"
+            elif previous[path] != stat:
+                changes[path] = "changed"
+        for path in previous.keys() - current.keys():
+            changes[path] = "removed"
+        if not changes:
+            return []
+
+        errors = registry.reload_specs(
+            changed={key(p) for p, c in changes.items() if c != "removed"},
+            removed={key(p) for p, c in changes.items() if c == "removed"},
+        )
+
+        events: list[ReloadEvent] = []
+        next_stats = dict(current)
+        for path, change in sorted(changes.items()):
+            spec_id, version = key(path)
+            error = errors.get((spec_id, version))
+            if error is not None:
+                # Keep the old stat so the file is retried on the next poll
+                if path in previous:
+                    next_stats[path] = previous[path]
+                else:
+                    del next_stats[path]
+            events.append(ReloadEvent(kind, change, spec_id, version, path, error))
+        self._stats[id(registry)] = next_stats
+        return events
+
+    def poll(self) -> list[ReloadEvent]:
+        """Check all registries once and apply any changes.
+
+        Returns:
+            The events detected by this poll.
+        """
+        with self._poll_lock:
+            events: list[ReloadEvent] = []
+            for registry in self.registries:
+                events.extend(self._poll_registry(registry))
+
+        for event in events:
+            if event.error:
+                logger.warning("Registry reload: %s", event)
+            else:
+                logger.info("Registry reload: %s", event)
+
+        if events:
+            for callback in self._subscribers:
+                callback(events)
+        return events
+
+    def _run(self) -> None:
+        """Background polling loop."""
+        while not self._stop.wait(self.interval):
+            try:
+                self.poll()
+            except Exception:
+                logger.exception("Registry watcher poll failed")
+
+    def start(self) -> None:
+        """Record the current registry state and start background polling."""
+        if self._thread is not None:
+            return
+        self.poll()
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="finalform-registry-watcher", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop background polling."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
@@ -4,14 +4,14 @@ The engine is generic - it reads all scoring rules from the measure spec.
 No per-questionnaire code is allowed.
 """
 
+from dataclasses import dataclass
 from typing import Literal
 
 from pydantic import BaseModel
 
 from finalform.recoding.recoder import RecodedSection
 from finalform.registry.models import MeasureSpec
-from finalform.scoring.methods import compute_score, prorate_score
-from finalform.scoring.reverse import apply_reverse_scoring, get_max_value_for_item
+from finalform.registry.plan import ScalePlan
 
 
 class ScoringError(Exception):
@@ -35,6 +35,37 @@ class ScaleScore(BaseModel):
     error: str | None = None
 
 
+@dataclass(slots=True)
+class ScaleOutcome:
+    """Lightweight scale score, used internally in place of ScaleScore."""
+
+    scale_id: str
+    name: str
+    value: float | None
+    method: Literal["sum", "average", "sum_then_double"]
+    items_used: int
+    items_total: int
+    missing_items: list[str]
+    reversed_items: list[str]
+    prorated: bool = False
+    error: str | None = None
+
+    def to_model(self) -> ScaleScore:
+        """Convert to the public ScaleScore model."""
+        return ScaleScore(
+            scale_id=self.scale_id,
+            name=self.name,
+            value=self.value,
+            method=self.method,
+            items_used=self.items_used,
+            items_total=self.items_total,
+            missing_items=self.missing_items,
+            reversed_items=self.reversed_items,
+            prorated=self.prorated,
+            error=self.error,
+        )
+
+
 class ScoringResult(BaseModel):
     """Result of scoring all scales in a measure."""
 
@@ -82,10 +113,7 @@ class ScoringEngine:
             item_values[item.item_id] = item.value
 
         # Score each scale
-        scale_scores: list[ScaleScore] = []
-        for scale in measure.scales:
-            score = self._score_scale(scale, item_values, measure)
-            scale_scores.append(score)
+        scale_scores = [outcome.to_model() for outcome in self.score_values(item_values, measure)]
 
         return ScoringResult(
             measure_id=section.measure_id,
@@ -93,102 +121,109 @@ class ScoringEngine:
             scales=scale_scores,
         )
 
-    def _score_scale(
+    def score_values(
         self,
-        scale,
         item_values: dict[str, int | float | None],
         measure: MeasureSpec,
-    ) -> ScaleScore:
-        """Score a single scale."""
-        # Collect values for items in this scale
-        values: dict[str, int | float] = {}
-        missing_items: list[str] = []
+    ) -> list[ScaleOutcome]:
+        """Compute all scale scores from item values, without result models.
 
-        for item_id in scale.items:
+        Args:
+            item_values: Dict of item_id -> recoded value (None if missing).
+            measure: The measure specification.
+
+        Returns:
+            ScaleOutcome for each scale, in measure order.
+        """
+        return [self._score_scale(scale_plan, item_values) for scale_plan in measure.plan.scales]
+
+    def _score_scale(
+        self,
+        scale_plan: ScalePlan,
+        item_values: dict[str, int | float | None],
+    ) -> ScaleOutcome:
+        """Score a single scale.
+
+        Runs on the scale's compiled plan: one pass over its items totals
+        the present values (reverse scoring them in place), and the method
+        and proration are a lookup in the plan's factor table.
+        """
+        scale = scale_plan.spec
+        item_ids = scale_plan.item_ids
+        reverse_max = scale_plan.reverse_max
+
+        # Total the present values in scale order, as sum() would
+        total: int | float = 0
+        count = 0
+        missing_items: list[str] = []
+        for item_id, reverse_count in zip(item_ids, scale_plan.reverse_counts):
             value = item_values.get(item_id)
             if value is None:
                 missing_items.append(item_id)
-            else:
-                values[item_id] = value
+                continue
+            if reverse_count:
+                for _ in range(reverse_count):
+                    value = reverse_max - value
+            total += value
+            count += 1
+
+        # items_used counts distinct items
+        items_used = count
+        if scale_plan.has_repeats:
+            items_used = len(
+                {item_id for item_id in item_ids if item_values.get(item_id) is not None}
+            )
 
         # Check if too many items are missing
         if len(missing_items) > scale.missing_allowed:
-            strategy = getattr(scale, "missing_strategy", "fail")
-            if strategy == "skip":
+            if scale.missing_strategy == "skip":
                 # Skip silently - return null score with no error
-                return ScaleScore(
-                    scale_id=scale.scale_id,
-                    name=scale.name,
-                    value=None,
-                    method=scale.method,
-                    items_used=len(values),
-                    items_total=len(scale.items),
-                    missing_items=missing_items,
-                    reversed_items=scale.reversed_items,
-                    prorated=False,
-                    error=None,
-                )
+                error = None
             else:
                 # "fail" or "prorate" - report the error
-                return ScaleScore(
-                    scale_id=scale.scale_id,
-                    name=scale.name,
-                    value=None,
-                    method=scale.method,
-                    items_used=len(values),
-                    items_total=len(scale.items),
-                    missing_items=missing_items,
-                    reversed_items=scale.reversed_items,
-                    prorated=False,
-                    error=f"Too many missing items: {len(missing_items)} missing, "
-                    f"{scale.missing_allowed} allowed",
+                error = (
+                    f"Too many missing items: {len(missing_items)} missing, "
+                    f"{scale.missing_allowed} allowed"
                 )
+            return ScaleOutcome(
+                scale_id=scale.scale_id,
+                name=scale.name,
+                value=None,
+                method=scale.method,
+                items_used=items_used,
+                items_total=len(item_ids),
+                missing_items=missing_items,
+                reversed_items=scale.reversed_items,
+                prorated=False,
+                error=error,
+            )
 
         # If no values at all, can't score
-        if not values:
-            return ScaleScore(
+        if not count:
+            return ScaleOutcome(
                 scale_id=scale.scale_id,
                 name=scale.name,
                 value=None,
                 method=scale.method,
                 items_used=0,
-                items_total=len(scale.items),
+                items_total=len(item_ids),
                 missing_items=missing_items,
                 reversed_items=scale.reversed_items,
                 prorated=False,
                 error="No values available for scoring",
             )
 
-        # Apply reverse scoring if needed
-        if scale.reversed_items:
-            # Get max value from first item's response map
-            # (assuming all items in scale have same response range)
-            first_item_id = scale.items[0]
-            first_item_spec = measure.get_item(first_item_id)
-            if first_item_spec:
-                max_value = get_max_value_for_item(first_item_spec.response_map)
-                values = apply_reverse_scoring(values, scale.reversed_items, max_value)
-
-        # Get list of values in scale order
-        value_list = [values[item_id] for item_id in scale.items if item_id in values]
-
-        # Compute score
-        prorated = len(missing_items) > 0
-        if prorated:
-            score_value = prorate_score(value_list, scale.method, len(scale.items))
-        else:
-            score_value = compute_score(value_list, scale.method)
-
-        return ScaleScore(
+        # Compute score (prorated if any item is missing)
+        return ScaleOutcome(
             scale_id=scale.scale_id,
             name=scale.name,
-            value=score_value,
+            value=scale_plan.score_fn(total, count, scale_plan.score_factors[count]),
             method=scale.method,
-            items_used=len(values),
-            items_total=len(scale.items),
+            items_used=items_used,
+            items_total=len(item_ids),
             missing_items=missing_items,
             reversed_items=scale.reversed_items,
-            prorated=prorated,
+            prorated=bool(missing_items),
             error=None,
         )
 
@@ -208,8 +243,8 @@ class ScoringEngine:
         Returns:
             ScaleScore for the specified scale, or None if not found.
         """
-        scale = measure.get_scale(scale_id)
-        if scale is None:
+        scale_plan = measure.plan.scales_by_id.get(scale_id)
+        if scale_plan is None:
             return None
 
         # Build lookup for item values
@@ -217,4 +252,4 @@ class ScoringEngine:
         for item in section.items:
             item_values[item.item_id] = item.value
 
-        return self._score_scale(scale, item_values, measure)
+        return self._score_scale(scale_plan, item_values).to_model()
@@ -0,0 +1,148 @@
+"""Vectorized batch validation.
+
+Backfills validate the same measure across many submissions. Instead of
+checking one section at a time, BatchValidator takes the N x items
+matrix of recoded values and missing mask that BatchScoringEngine
+scores, and computes the range and missing masks for all N submissions
+with array operations. Each row's ValidationResult matches what
+Validator.validate gives for a section holding that row's items.
+
+Requires numpy (pip install 'finalform[batch]').
+"""
+
+from dataclasses import dataclass
+
+try:
+    import numpy as np
+except ImportError as e:  # pragma: no cover - depends on the environment
+    raise ImportError(
+        "Batch validation requires numpy. Install it with: pip install 'finalform[batch]'"
+    ) from e
+
+from finalform.registry.models import MeasureSpec
+from finalform.validation.checks import ValidationResult
+
+
+@dataclass(frozen=True, slots=True)
+class ValidationColumns:
+    """Validation of many submissions of one measure.
+
+    Column j of every matrix holds measure.items[j].
+    """
+
+    measure_id: str
+    item_ids: tuple[str, ...]
+    min_values: tuple[int | None, ...]  # range of each column
+    max_values: tuple[int | None, ...]
+    values: np.ndarray  # N x items, as validated
+    missing: np.ndarray  # bool, N x items
+    out_of_range: np.ndarray  # bool, N x items
+    missing_count: np.ndarray  # int64, distinct items missing per submission
+    completeness: np.ndarray  # float64
+    valid: np.ndarray  # bool
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def result(self, row: int) -> ValidationResult:
+        """Get Validator.validate's ValidationResult for a submission."""
+        item_missing = self.missing[row].tolist()
+        out_of_range = self.out_of_range[row].tolist()
+        errors = [
+            f"Item {item_id}: value {self.values[row, index].item()} "
+            f"out of range [{self.min_values[index]}, {self.max_values[index]}]"
+            for index, item_id in enumerate(self.item_ids)
+            if out_of_range[index]
+        ]
+        return ValidationResult(
+            measure_id=self.measure_id,
+            valid=bool(self.valid[row]),
+            completeness=float(self.completeness[row]),
+            missing_items=sorted(
+                {item_id for item_id, absent in zip(self.item_ids, item_missing) if absent}
+            ),
+            out_of_range_items=sorted(
+                item_id for item_id, outside in zip(self.item_ids, out_of_range) if outside
+            ),
+            errors=errors,
+        )
+
+
+class BatchValidator:
+    """Validates many submissions of a measure at once.
+
+    Applies the same checks as Validator (range against each item's
+    response_map and missing items), with each check evaluated over all
+    submissions as arrays.
+    """
+
+    def validate(
+        self,
+        values: np.ndarray,
+        missing: np.ndarray,
+        measure: MeasureSpec,
+    ) -> ValidationColumns:
+        """Validate a matrix of submissions.
+
+        Args:
+            values: N x len(measure.items) recoded values (int or float),
+                column j holding measure.items[j]. Missing entries are ignored.
+            missing: Boolean mask of the same shape, True where missing.
+            measure: The measure specification.
+
+        Returns:
+            ValidationColumns for the submissions.
+
+        Raises:
+            ValueError: If values or missing has the wrong shape.
+        """
+        values = np.asarray(values)
+        missing = np.asarray(missing, dtype=bool)
+        expected = (len(values), len(measure.items))
+        if values.ndim != 2 or values.shape != expected or missing.shape != expected:
+            raise ValueError(
+                f"values and missing must both have shape (N, {len(measure.items)}), "
+                f"got {values.shape} and {missing.shape}"
+            )
+        if values.dtype.kind not in "iuf":
+            raise ValueError(f"values must be numeric, got dtype {values.dtype}")
+
+        plan = measure.plan
+        # A repeated item is range-checked against its first occurrence
+        column_plans = [plan.items_by_id[item.item_id] for item in measure.items]
+        min_values = tuple(item_plan.min_value for item_plan in column_plans)
+        max_values = tuple(item_plan.max_value for item_plan in column_plans)
+        # Items with an empty response_map have no valid values
+        lower = np.array([np.nan if v is None else v for v in min_values], dtype=np.float64)
+        upper = np.array([np.nan if v is None else v for v in max_values], dtype=np.float64)
+        out_of_range = ~missing & ~((values >= lower) & (values <= upper))
+
+        # Missing items are counted once per item ID
+        if len(plan.items) == len(plan.item_ids):
+            missing_count = missing.sum(axis=1)
+        else:
+            columns_by_id: dict[str, list[int]] = {}
+            for index, item in enumerate(measure.items):
+                columns_by_id.setdefault(item.item_id, []).append(index)
+            missing_count = sum(
+                missing[:, columns].any(axis=1) for columns in columns_by_id.values()
+            )
+
+        total_items = len(plan.item_ids)
+        if total_items > 0:
+            completeness = (total_items - missing_count) / total_items
+        else:
+            completeness = np.ones(len(values), dtype=np.float64)
+
+        return ValidationColumns(
+            measure_id=plan.measure_id,
+            item_ids=tuple(item.item_id for item in measure.items),
+            min_values=min_values,
+            max_values=max_values,
+            values=values,
+            missing=missing,
+            out_of_range=out_of_range,
+            missing_count=np.asarray(missing_count, dtype=np.int64),
+            completeness=np.asarray(completeness, dtype=np.float64),
+            valid=~out_of_range.any(axis=1),
+        )
@@ -5,8 +5,9 @@ Validates completeness, range, and flags missing items.
 
 from pydantic import BaseModel
 
-from finalform.recoding.recoder import RecodedSection
+from finalform.recoding.recoder import RecodedItem, RecodedSection
 from finalform.registry.models import MeasureSpec
+from finalform.registry.plan import MeasurePlan, ScalePlan
 
 
 class ValidationResult(BaseModel):
@@ -53,68 +54,87 @@ class Validator:
         Returns:
             ValidationResult with validation status and details.
         """
-        errors: list[str] = []
-        missing_items: list[str] = []
-        out_of_range_items: list[str] = []
+        plan = measure.plan
+        missing_items, out_of_range_items, errors = self.check_values(
+            plan,
+            [item.item_id for item in section.items],
+            [item.value for item in section.items],
+            [item.missing for item in section.items],
+        )
+
+        # Calculate completeness
+        total_items = len(plan.item_ids)
+        present_items = total_items - len(missing_items)
+        completeness = present_items / total_items if total_items > 0 else 1.0
+
+        # Determine overall validity
+        # Valid if no errors, no out-of-range, and completeness is acceptable
+        valid = len(errors) == 0 and len(out_of_range_items) == 0
 
-        # Build set of item IDs in the recoded section
-        recoded_item_ids = {item.item_id for item in section.items}
+        return ValidationResult(
+            measure_id=section.measure_id,
+            valid=valid,
+            completeness=completeness,
+            missing_items=missing_items,
+            out_of_range_items=out_of_range_items,
+            errors=errors,
+        )
 
-        # Build set of expected item IDs from measure
-        expected_item_ids = {item.item_id for item in measure.items}
+    def check_values(
+        self,
+        plan: MeasurePlan,
+        item_ids: list[str],
+        values: list[int | float | None],
+        missing: list[bool],
+    ) -> tuple[list[str], list[str], list[str]]:
+        """Check recoded values against a measure plan, without result models.
 
-        # Check for missing items (in measure but not in recoded)
-        for item_id in expected_item_ids:
-            if item_id not in recoded_item_ids:
-                missing_items.append(item_id)
+        Args:
+            plan: The compiled measure plan.
+            item_ids: Recoded item IDs, in section order.
+            values: Recoded values aligned with item_ids.
+            missing: Missing flags aligned with item_ids.
 
-        # Check for items marked as missing
-        for item in section.items:
-            if item.missing:
-                if item.item_id not in missing_items:
-                    missing_items.append(item.item_id)
+        Returns:
+            Tuple of (sorted missing item IDs, sorted out-of-range item IDs,
+            error messages).
+        """
+        errors: list[str] = []
+        missing_items: set[str] = set()
+        out_of_range_items: list[str] = []
+        items_by_id = plan.items_by_id
 
-        # Validate each item
-        for item in section.items:
-            if item.missing or item.value is None:
+        # Validate each item, collecting those marked as missing
+        for item_id, value, item_missing in zip(item_ids, values, missing):
+            if item_missing:
+                missing_items.add(item_id)
+                continue
+            if value is None:
                 continue
 
-            # Get item spec for range validation
-            item_spec = measure.get_item(item.item_id)
-            if item_spec is None:
-                errors.append(f"Unknown item: {item.item_id}")
+            # Get item plan for range validation
+            item_plan = items_by_id.get(item_id)
+            if item_plan is None:
+                errors.append(f"Unknown item: {item_id}")
                 continue
 
-            # Get valid range from response_map
-            valid_values = list(item_spec.response_map.values())
-            min_val = min(valid_values)
-            max_val = max(valid_values)
+            # Valid range is precomputed from the response_map
+            min_val = item_plan.min_value
+            max_val = item_plan.max_value
 
             # Check if value is in valid range
-            if not (min_val <= item.value <= max_val):
-                out_of_range_items.append(item.item_id)
+            if not (min_val <= value <= max_val):
+                out_of_range_items.append(item_id)
                 errors.append(
-                    f"Item {item.item_id}: value {item.value} "
+                    f"Item {item_id}: value {value} "
                     f"out of range [{min_val}, {max_val}]"
                 )
 
-        # Calculate completeness
-        total_items = len(expected_item_ids)
-        present_items = total_items - len(missing_items)
-        completeness = present_items / total_items if total_items > 0 else 1.0
-
-        # Determine overall validity
-        # Valid if no errors, no out-of-range, and completeness is acceptable
-        valid = len(errors) == 0 and len(out_of_range_items) == 0
+        # Expected items (precomputed on the plan) absent from the section
+        # are missing too
+        missing_items.update(plan.item_ids.difference(item_ids))
 
-        return ValidationResult(
-            measure_id=section.measure_id,
-            valid=valid,
-            completeness=completeness,
-            missing_items=sorted(missing_items),
-            out_of_range_items=sorted(out_of_range_items),
-            errors=errors,
-        )
+        return sorted(missing_items), sorted(out_of_range_items), errors
 
     def validate_for_scale(
         self,
@@ -134,8 +154,9 @@ class Validator:
         Returns:
             ValidationResult for the scale's items only.
         """
-        scale = measure.get_scale(scale_id)
-        if scale is None:
+        plan = measure.plan
+        scale_plan = plan.scales_by_id.get(scale_id)
+        if scale_plan is None:
             return ValidationResult(
                 measure_id=section.measure_id,
                 valid=False,
@@ -145,69 +166,136 @@ class Validator:
                 errors=[f"Unknown scale: {scale_id}"],
             )
 
-        errors: list[str] = []
-        missing_items: list[str] = []
-        out_of_range_items: list[str] = []
-
         # Build lookup for recoded items
         recoded_items_by_id = {item.item_id: item for item in section.items}
 
         # Check each item in the scale
-        for item_id in scale.items:
-            recoded_item = recoded_items_by_id.get(item_id)
+        statuses = [
+            _scale_item_status(plan, recoded_items_by_id, item_id)
+            for item_id in scale_plan.item_ids
+        ]
+        return _scale_result(section.measure_id, scale_plan, statuses)
 
-            if recoded_item is None:
-                missing_items.append(item_id)
-                continue
+    def validate_all_scales(
+        self,
+        section: RecodedSection,
+        measure: MeasureSpec,
+    ) -> dict[str, ValidationResult]:
+        """Validate a section for every scale of the measure.
 
-            if recoded_item.missing or recoded_item.value is None:
-                missing_items.append(item_id)
-                continue
+        Gives the same results as calling validate_for_scale() for each
+        scale, but each item is looked up, range-checked and checked for
+        missing once, however many scales include it.
 
-            # Get item spec for range validation
-            item_spec = measure.get_item(item_id)
-            if item_spec is None:
-                errors.append(f"Unknown item in scale: {item_id}")
-                continue
+        Args:
+            section: The recoded section to validate.
+            measure: The measure specification.
+
+        Returns:
+            Dict of scale ID to the ValidationResult for that scale's
+            items, in measure order.
+        """
+        plan = measure.plan
+        recoded_items_by_id = {item.item_id: item for item in section.items}
+        statuses: dict[str, _ItemStatus] = {}
+
+        results: dict[str, ValidationResult] = {}
+        for scale_plan in plan.scales_by_id.values():
+            scale_statuses = []
+            for item_id in scale_plan.item_ids:
+                status = statuses.get(item_id)
+                if status is None:
+                    status = _scale_item_status(plan, recoded_items_by_id, item_id)
+                    statuses[item_id] = status
+                scale_statuses.append(status)
+            results[scale_plan.scale_id] = _scale_result(
+                section.measure_id, scale_plan, scale_statuses
+            )
+        return results
 
-            # Check range
-            valid_values = list(item_spec.response_map.values())
-            min_val = min(valid_values)
-            max_val = max(valid_values)
 
-            if not (min_val <= recoded_item.value <= max_val):
-                out_of_range_items.append(item_id)
-                errors.append(
-                    f"Item {item_id}: value {recoded_item.value} "
-                    f"out of range [{min_val}, {max_val}]"
-                )
+# (missing, out of range, error message) for one item of a scale
+_ItemStatus = tuple[bool, bool, str | None]
 
-        # Calculate completeness for this scale
-        total_items = len(scale.items)
-        present_items = total_items - len(missing_items)
-        completeness = present_items / total_items if total_items > 0 else 1.0
 
-        # Check if missing count is acceptable for this scale
-        missing_allowed = scale.missing_allowed
-        too_many_missing = len(missing_items) > missing_allowed
+def _scale_item_status(
+    plan: MeasurePlan,
+    recoded_items_by_id: dict[str, RecodedItem],
+    item_id: str,
+) -> _ItemStatus:
+    """Check one scale item of a section for missing and range."""
+    recoded_item = recoded_items_by_id.get(item_id)
 
-        valid = (
-            len(errors) == 0
-            and len(out_of_range_items) == 0
-            and not too_many_missing
-        )
+    if recoded_item is None:
+        return True, False, None
 
-        if too_many_missing:
-            errors.append(
-                f"Too many missing items for scale {scale_id}: "
-                f"{len(missing_items)} missing, {missing_allowed} allowed"
-            )
+    if recoded_item.missing or recoded_item.value is None:
+        return True, False, None
 
-        return ValidationResult(
-            measure_id=section.measure_id,
-            valid=valid,
-            completeness=completeness,
-            missing_items=sorted(missing_items),
-            out_of_range_items=sorted(out_of_range_items),
-            errors=errors,
+    # Get item plan for range validation
+    item_plan = plan.items_by_id.get(item_id)
+    if item_plan is None:
+        return False, False, f"Unknown item in scale: {item_id}"
+
+    # Check range
+    min_val = item_plan.min_value
+    max_val = item_plan.max_value
+
+    if not (min_val <= recoded_item.value <= max_val):
+        return (
+            False,
+            True,
+            f"Item {item_id}: value {recoded_item.value} out of range [{min_val}, {max_val}]",
         )
+    return False, False, None
+
+
+def _scale_result(
+    measure_id: str,
+    scale_plan: ScalePlan,
+    statuses: list[_ItemStatus],
+) -> ValidationResult:
+    """Build a scale's ValidationResult from its items' statuses."""
+    errors: list[str] = []
+    missing_items: list[str] = []
+    out_of_range_items: list[str] = []
+
+    for item_id, (missing, out_of_range, error) in zip(scale_plan.item_ids, statuses):
+        if missing:
+            missing_items.append(item_id)
+            continue
+        if out_of_range:
+            out_of_range_items.append(item_id)
+        if error is not None:
+            errors.append(error)
+
+    # Calculate completeness for this scale
+    scale = scale_plan.spec
+    total_items = len(scale.items)
+    present_items = total_items - len(missing_items)
+    completeness = present_items / total_items if total_items > 0 else 1.0
+
+    # Check if missing count is acceptable for this scale
+    missing_allowed = scale.missing_allowed
+    too_many_missing = len(missing_items) > missing_allowed
+
+    valid = (
+        len(errors) == 0
+        and len(out_of_range_items) == 0
+        and not too_many_missing
+    )
+
+    if too_many_missing:
+        errors.append(
+            f"Too many missing items for scale {scale.scale_id}: "
+            f"{len(missing_items)} missing, {missing_allowed} allowed"
+        )
+
+    return ValidationResult(
+        measure_id=measure_id,
+        valid=valid,
+        completeness=completeness,
+        missing_items=sorted(missing_items),
+        out_of_range_items=sorted(out_of_range_items),
+        errors=errors,
+    )
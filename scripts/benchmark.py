@@ -0,0 +1,424 @@
+#!/usr/bin/env python3
+"""Micro-benchmarks for the finalform processing pipeline.
+
+Runs against the measure and binding registries in the repository and
+reports per-operation timings. Intended for before/after comparisons of
+performance work, not for CI assertions.
+
+Usage:
+    python scripts/benchmark.py form --measure ipip_neo_60_c
+    python scripts/benchmark.py submission --measure phq9
+    python scripts/benchmark.py mapping --binding intake_01
+    python scripts/benchmark.py recode --measure phq9
+    python scripts/benchmark.py scoring --measure phq9 --rows 100000
+    python scripts/benchmark.py interpret --measure phq9 --rows 100000
+    python scripts/benchmark.py validate --measure ipip_neo_60_c --rows 100000
+"""
+
+import argparse
+import collections
+import itertools
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from finalform.domains.questionnaire import QuestionnaireProcessor  # noqa: E402
+from finalform.input import (  # noqa: E402
+    FormInputClient,
+    process_form_submission,
+    process_form_submissions,
+)
+from finalform.mapping import Mapper  # noqa: E402
+from finalform.recoding import Recoder  # noqa: E402
+from finalform.registry import BindingRegistry, MeasureRegistry  # noqa: E402
+from finalform.registry.models import (  # noqa: E402
+    Binding,
+    BindingSection,
+    FormBindingSpec,
+    MeasureSpec,
+)
+from finalform.scoring import ScoringEngine  # noqa: E402
+
+MEASURE_REGISTRY = ROOT / "measure-registry"
+MEASURE_SCHEMA = ROOT / "schemas" / "measure_spec.schema.json"
+BINDING_REGISTRY = ROOT / "form-binding-registry"
+
+
+def timeit(fn: Callable[[], Any], repeat: int, number: int) -> float:
+    """Return the median time per call in microseconds."""
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            fn()
+        samples.append((time.perf_counter() - start) / number)
+    return statistics.median(samples) * 1e6
+
+
+def report(name: str, micros: float) -> None:
+    """Print a single benchmark line."""
+    print(f"  {name:<48} {micros:>12.1f} us")
+
+
+def synthetic_binding(measure: MeasureSpec) -> FormBindingSpec:
+    """Build a single-section binding that maps field_key == item_id."""
+    return FormBindingSpec(
+        type="form_binding_spec",
+        form_id=f"bench_{measure.measure_id}",
+        binding_id=f"bench_{measure.measure_id}",
+        version="1.0.0",
+        sections=[
+            BindingSection(
+                measure_id=measure.measure_id,
+                measure_version=measure.version,
+                bindings=[
+                    Binding(item_id=item.item_id, by="field_key", value=item.item_id)
+                    for item in measure.items
+                ],
+            )
+        ],
+    )
+
+
+def synthetic_form(measure: MeasureSpec, seed: int) -> dict[str, Any]:
+    """Build a complete form response with text answers for every item."""
+    items = []
+    for offset, item in enumerate(measure.items):
+        anchors = list(item.response_map)
+        items.append({
+            "field_key": item.item_id,
+            "answer": anchors[(seed + offset) % len(anchors)],
+        })
+    return {
+        "form_id": f"bench_{measure.measure_id}",
+        "form_submission_id": f"sub_{seed}",
+        "subject_id": "contact::bench",
+        "timestamp": "2025-01-15T10:30:00Z",
+        "items": items,
+    }
+
+
+def bench_form(args: argparse.Namespace) -> None:
+    """Time per-form processing of a single measure."""
+    registry = MeasureRegistry(MEASURE_REGISTRY, schema_path=MEASURE_SCHEMA)
+    measure = registry.get_latest(args.measure)
+    binding = synthetic_binding(measure)
+    measures = {measure.measure_id: measure}
+    forms = itertools.cycle([synthetic_form(measure, seed) for seed in range(16)])
+
+    print(f"form: {measure.measure_id}@{measure.version} ({len(measure.items)} items)")
+    for mode in QuestionnaireProcessor.MODES:
+        processor = QuestionnaireProcessor(mode=mode)
+        report(
+            f"QuestionnaireProcessor.process ({mode})",
+            timeit(
+                lambda processor=processor: processor.process(next(forms), binding, measures),
+                repeat=args.repeat,
+                number=args.number,
+            ),
+        )
+        tracemalloc.start()
+        processor.process(next(forms), binding, measures)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        print(f"  {f'peak allocation per form ({mode})':<48} {peak / 1024:>12.1f} KiB")
+
+
+def bench_submission(args: argparse.Namespace) -> None:
+    """Time process_form_submission(s) against processing the form directly."""
+    registry = MeasureRegistry(MEASURE_REGISTRY, schema_path=MEASURE_SCHEMA)
+    measure = registry.get_latest(args.measure)
+    item_map = {item.item_id: item.item_id for item in measure.items}
+    form = synthetic_form(measure, seed=0)
+    submission = {
+        "form_id": form["form_id"],
+        "submission_id": form["form_submission_id"],
+        "respondent": {"id": form["subject_id"]},
+        "submitted_at": form["timestamp"],
+        "items": [
+            {"field_id": item["field_key"], "raw_value": item["answer"]}
+            for item in form["items"]
+        ],
+    }
+
+    print(f"submission: {measure.measure_id} ({len(measure.items)} items)")
+    report(
+        "MeasureRegistry.get_latest",
+        timeit(lambda: registry.get_latest(args.measure), args.repeat, args.number),
+    )
+    with tempfile.TemporaryDirectory() as storage:
+        client = FormInputClient(storage)
+        for label, version in (("pinned", measure.version), ("unpinned", None)):
+            report(
+                f"process_form_submission ({label})",
+                timeit(
+                    lambda version=version: process_form_submission(
+                        submission,
+                        measure_id=args.measure,
+                        form_input_client=client,
+                        measure_registry=registry,
+                        measure_version=version,
+                        item_map_override=item_map,
+                    ),
+                    repeat=args.repeat,
+                    number=args.number,
+                ),
+            )
+
+        # Item map read from storage, as in production
+        client.save_item_map(submission["form_id"], args.measure, item_map)
+        kwargs: dict[str, Any] = {
+            "measure_id": args.measure,
+            "form_input_client": client,
+            "measure_registry": registry,
+        }
+        report(
+            "process_form_submission (saved map)",
+            timeit(
+                lambda: process_form_submission(submission, **kwargs),
+                repeat=args.repeat,
+                number=args.number,
+            ),
+        )
+        submissions = [submission] * args.number
+        report(
+            "process_form_submissions (per submission)",
+            timeit(
+                lambda: collections.deque(
+                    process_form_submissions(submissions, **kwargs), maxlen=0
+                ),
+                repeat=args.repeat,
+                number=1,
+            )
+            / args.number,
+        )
+
+    processor = QuestionnaireProcessor()
+    binding = synthetic_binding(measure)
+    report(
+        "QuestionnaireProcessor.process (baseline)",
+        timeit(
+            lambda: processor.process(form, binding, {measure.measure_id: measure}),
+            repeat=args.repeat,
+            number=args.number,
+        ),
+    )
+
+
+def bench_mapping(args: argparse.Namespace) -> None:
+    """Time Mapper.map for every section of a registry binding."""
+    binding = BindingRegistry(BINDING_REGISTRY).get_latest(args.binding)
+    items = []
+    for section in binding.sections:
+        for binding_item in section.bindings:
+            item: dict[str, Any] = {"answer": "several days"}
+            if binding_item.by == "field_key":
+                item["field_key"] = binding_item.value
+            else:
+                item["position"] = binding_item.value
+            items.append(item)
+    form = {
+        "form_id": binding.form_id,
+        "form_submission_id": "sub_0",
+        "subject_id": "contact::bench",
+        "timestamp": "2025-01-15T10:30:00Z",
+        "items": items,
+    }
+    mapper = Mapper()
+
+    print(f"mapping: {binding.binding_id}@{binding.version} "
+          f"({len(binding.sections)} sections, {len(items)} fields)")
+    report(
+        "Mapper.map",
+        timeit(lambda: mapper.map(form, binding), args.repeat, args.number),
+    )
+
+
+def bench_recode(args: argparse.Namespace) -> None:
+    """Time recoding of single answers, with and without the recode memo."""
+    registry = MeasureRegistry(MEASURE_REGISTRY, schema_path=MEASURE_SCHEMA)
+    measure = registry.get_latest(args.measure)
+    item = measure.plan.items[0]
+    anchors = list(item.spec.response_map)
+    answers = {
+        "text": itertools.cycle(anchors),
+        "text, unnormalized": itertools.cycle(f" {a.upper()} " for a in anchors),
+        "numeric string": itertools.cycle(str(v) for v in item.spec.response_map.values()),
+    }
+
+    print(f"recode: {measure.measure_id}@{measure.version} "
+          f"item {item.item_id} ({item.strategy} strategy)")
+    for label, memo_size in (("no memo", None), ("memo", 65536)):
+        recoder = Recoder(memo_size=memo_size)
+        for kind, cycle in answers.items():
+            report(
+                f"Recoder.recode_answer ({kind}, {label})",
+                timeit(
+                    lambda recoder=recoder, cycle=cycle: recoder.recode_answer(
+                        next(cycle), item, measure.fingerprint
+                    ),
+                    repeat=args.repeat,
+                    number=args.number * 10,
+                ),
+            )
+
+
+def bench_scoring(args: argparse.Namespace) -> None:
+    """Time scalar scoring against batch scoring (requires numpy)."""
+    import numpy as np
+
+    from finalform.scoring.batch import BatchScoringEngine
+
+    registry = MeasureRegistry(MEASURE_REGISTRY, schema_path=MEASURE_SCHEMA)
+    measure = registry.get_latest(args.measure)
+    rng = np.random.default_rng(0)
+    maxima = [max(item.response_map.values()) for item in measure.items]
+    values = np.stack([rng.integers(0, top + 1, args.rows) for top in maxima], axis=1)
+    missing = rng.random(values.shape) < 0.05
+    rows = [
+        {
+            item.item_id: int(value)
+            for item, value, absent in zip(measure.items, row, row_missing)
+            if not absent
+        }
+        for row, row_missing in zip(values[:1000], missing[:1000])
+    ]
+    submissions = itertools.cycle(rows)
+
+    print(f"scoring: {measure.measure_id}@{measure.version} ({len(measure.scales)} scales)")
+    engine = ScoringEngine()
+    report(
+        "ScoringEngine.score_values (per submission)",
+        timeit(
+            lambda: engine.score_values(next(submissions), measure),
+            repeat=args.repeat,
+            number=args.number,
+        ),
+    )
+    batch = BatchScoringEngine()
+    report(
+        f"BatchScoringEngine.score (per submission, N={args.rows})",
+        timeit(lambda: batch.score(values, missing, measure), repeat=args.repeat, number=1)
+        / args.rows,
+    )
+
+
+def bench_interpret(args: argparse.Namespace) -> None:
+    """Time per-score band lookup against batch labeling (requires numpy)."""
+    import numpy as np
+
+    from finalform.interpretation.batch import label_column
+    from finalform.interpretation.interpreter import find_band
+
+    registry = MeasureRegistry(MEASURE_REGISTRY, schema_path=MEASURE_SCHEMA)
+    measure = registry.get_latest(args.measure)
+    scale_plan = measure.plan.scales[0]
+    bounds = scale_plan.bands.bounds
+    rng = np.random.default_rng(0)
+    scores = rng.integers(bounds[0], bounds[-1] + 1, args.rows).astype(np.float64)
+    values = itertools.cycle(scores[:1000].tolist())
+
+    print(f"interpret: {measure.measure_id}@{measure.version} scale {scale_plan.scale_id}")
+    report(
+        "find_band (per score)",
+        timeit(lambda: find_band(scale_plan, next(values)), repeat=args.repeat, number=args.number),
+    )
+    report(
+        f"label_column (per score, N={args.rows})",
+        timeit(
+            lambda: label_column(scores, measure, scale_plan.scale_id),
+            repeat=args.repeat,
+            number=1,
+        )
+        / args.rows,
+    )
+
+
+def bench_validate(args: argparse.Namespace) -> None:
+    """Time per-section validation against batch validation (requires numpy)."""
+    import numpy as np
+
+    from finalform.validation import Validator
+    from finalform.validation.batch import BatchValidator
+
+    registry = MeasureRegistry(MEASURE_REGISTRY, schema_path=MEASURE_SCHEMA)
+    measure = registry.get_latest(args.measure)
+    rng = np.random.default_rng(0)
+    maxima = [max(item.response_map.values()) for item in measure.items]
+    values = np.stack([rng.integers(0, top + 1, args.rows) for top in maxima], axis=1)
+    missing = rng.random(values.shape) < 0.05
+    item_ids = [item.item_id for item in measure.items]
+    rows = itertools.cycle(
+        [(row.tolist(), mask.tolist()) for row, mask in zip(values[:1000], missing[:1000])]
+    )
+    plan = measure.plan
+
+    print(f"validate: {measure.measure_id}@{measure.version} ({len(measure.items)} items)")
+    validator = Validator()
+    report(
+        "Validator.check_values (per submission)",
+        timeit(
+            lambda: validator.check_values(plan, item_ids, *next(rows)),
+            repeat=args.repeat,
+            number=args.number,
+        ),
+    )
+    batch = BatchValidator()
+    report(
+        f"BatchValidator.validate (per submission, N={args.rows})",
+        timeit(lambda: batch.validate(values, missing, measure), repeat=args.repeat, number=1)
+        / args.rows,
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--number", type=int, default=200)
+    subparsers = parser.add_subparsers(dest="benchmark", required=True)
+
+    form = subparsers.add_parser("form", help="Per-form processing time")
+    form.add_argument("--measure", default="ipip_neo_60_c")
+    form.set_defaults(func=bench_form)
+
+    submission = subparsers.add_parser("submission", help="Per-submission overhead")
+    submission.add_argument("--measure", default="phq9")
+    submission.set_defaults(func=bench_submission)
+
+    mapping = subparsers.add_parser("mapping", help="Form-to-measure mapping time")
+    mapping.add_argument("--binding", default="intake_01")
+    mapping.set_defaults(func=bench_mapping)
+
+    recode = subparsers.add_parser("recode", help="Per-answer recoding cost")
+    recode.add_argument("--measure", default="phq9")
+    recode.set_defaults(func=bench_recode)
+
+    scoring = subparsers.add_parser("scoring", help="Scalar vs batch scoring")
+    scoring.add_argument("--measure", default="phq9")
+    scoring.add_argument("--rows", type=int, default=100_000)
+    scoring.set_defaults(func=bench_scoring)
+
+    interpret = subparsers.add_parser("interpret", help="Per-score vs batch band lookup")
+    interpret.add_argument("--measure", default="phq9")
+    interpret.add_argument("--rows", type=int, default=100_000)
+    interpret.set_defaults(func=bench_interpret)
+
+    validate = subparsers.add_parser("validate", help="Per-section vs batch validation")
+    validate.add_argument("--measure", default="ipip_neo_60_c")
+    validate.add_argument("--rows", type=int, default=100_000)
+    validate.set_defaults(func=bench_validate)
+
+    args = parser.parse_args()
+    args.func(args)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,9 +1,14 @@
 """Pytest configuration and shared fixtures."""
 
+from collections.abc import Callable
 from pathlib import Path
+from typing import Any
 
 import pytest
 
+from finalform.registry import MeasureRegistry
+from finalform.registry.models import MeasureSpec
+
 
 @pytest.fixture
 def project_root() -> Path:
@@ -39,3 +44,44 @@ def measure_schema_path(schemas_dir: Path) -> Path:
 def binding_schema_path(schemas_dir: Path) -> Path:
     """Return the form binding spec schema path."""
     return schemas_dir / "form_binding_spec.schema.json"
+
+
+@pytest.fixture
+def phq9_spec(measure_registry_path: Path, measure_schema_path: Path) -> MeasureSpec:
+    """Load the PHQ-9 instrument spec."""
+    registry = MeasureRegistry(measure_registry_path, schema_path=measure_schema_path)
+    return registry.get("phq9", "1.0.0")
+
+
+@pytest.fixture
+def random_matrix() -> Callable[..., tuple[Any, Any]]:
+    """Build random item matrices for the batch tests (requires numpy).
+
+    The returned function takes (spec, rows, seed) and gives an N x items
+    matrix of values with a boolean mask marking about a fifth of them
+    missing. Values range over each item's response_map values, widened
+    by spread on either side. Float matrices add one of fractions to
+    every value.
+    """
+    np = pytest.importorskip("numpy")
+
+    def make(
+        spec: MeasureSpec,
+        rows: int,
+        seed: int,
+        dtype: Any = np.int64,
+        *,
+        spread: int = 0,
+        fractions: tuple[float, ...] = (0.0, 0.5),
+    ) -> tuple[Any, Any]:
+        rng = np.random.default_rng(seed)
+        maxima = [max(item.response_map.values()) for item in spec.items]
+        values = np.stack(
+            [rng.integers(-spread, top + spread + 1, rows) for top in maxima], axis=1
+        )
+        if dtype is np.float64:
+            values = values + rng.choice(list(fractions), values.shape)
+        missing = rng.random(values.shape) < 0.2
+        return values, missing
+
+    return make
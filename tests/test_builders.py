@@ -198,6 +198,8 @@ class TestMeasurementEventBuilder:
         assert event.telemetry.final_form_version == "0.1.0"
         assert event.telemetry.measure_spec == "phq9@1.0.0"
         assert event.telemetry.form_binding_spec == "example_intake@1.0.0"
+        assert event.telemetry.form_binding_spec_fingerprint == example_binding.fingerprint
+        assert event.telemetry.measure_spec_fingerprint is None
         assert "Test warning" in event.telemetry.warnings
 
     def test_event_has_item_observations(
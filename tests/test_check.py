@@ -0,0 +1,205 @@
+"""Tests for the whole-registry consistency checker."""
+
+import json
+import shutil
+from pathlib import Path
+
+import pytest
+from typer.testing import CliRunner
+
+from finalform.cli import app
+from finalform.registry.check import CheckReport, check_registry
+
+
+@pytest.fixture
+def registries(
+    tmp_path: Path, measure_registry_path: Path, binding_registry_path: Path
+) -> tuple[Path, Path]:
+    """Copy the repository registries to a scratch directory."""
+    measures = tmp_path / "measure-registry"
+    bindings = tmp_path / "form-binding-registry"
+    shutil.copytree(measure_registry_path, measures)
+    shutil.copytree(binding_registry_path, bindings)
+    return measures, bindings
+
+
+def edit_json(path: Path, edit) -> None:
+    """Apply an in-place edit to a JSON file."""
+    data = json.loads(path.read_text())
+    edit(data)
+    path.write_text(json.dumps(data))
+
+
+def run_check(
+    registries: tuple[Path, Path], measure_schema_path: Path, binding_schema_path: Path
+) -> CheckReport:
+    """Check the scratch registries in-process."""
+    measures, bindings = registries
+    return check_registry(
+        measures,
+        bindings,
+        measure_schema_path=measure_schema_path,
+        binding_schema_path=binding_schema_path,
+        max_workers=1,
+    )
+
+
+class TestCheckRegistry:
+    """Tests for check_registry."""
+
+    def test_repository_registries_pass(
+        self,
+        measure_registry_path: Path,
+        binding_registry_path: Path,
+        measure_schema_path: Path,
+        binding_schema_path: Path,
+    ) -> None:
+        """Test that the shipped registries have no errors."""
+        report = check_registry(
+            measure_registry_path,
+            binding_registry_path,
+            measure_schema_path=measure_schema_path,
+            binding_schema_path=binding_schema_path,
+            chunk_size=4,
+        )
+
+        assert report.ok, [issue.message for issue in report.errors]
+        assert report.measures_checked == len(list(measure_registry_path.glob("measures/*/*.json")))
+        assert report.bindings_checked == len(list(binding_registry_path.glob("bindings/*/*.json")))
+
+    def test_unknown_measure_reference(
+        self,
+        registries: tuple[Path, Path],
+        measure_schema_path: Path,
+        binding_schema_path: Path,
+    ) -> None:
+        """Test that a section pointing at a missing measure version is an error."""
+        _, bindings = registries
+
+        def edit(data: dict) -> None:
+            data["sections"][0]["measure_version"] = "9.9.9"
+
+        edit_json(bindings / "bindings" / "example_intake" / "1-0-0.json", edit)
+        report = run_check(registries, measure_schema_path, binding_schema_path)
+
+        (issue,) = report.errors
+        assert issue.check == "reference"
+        assert issue.spec_id == "example_intake"
+        assert "@9.9.9" in issue.message
+
+    def test_unknown_bound_item(
+        self,
+        registries: tuple[Path, Path],
+        measure_schema_path: Path,
+        binding_schema_path: Path,
+    ) -> None:
+        """Test that binding an item the measure lacks is an error."""
+        _, bindings = registries
+
+        def edit(data: dict) -> None:
+            data["sections"][0]["bindings"][0]["item_id"] = "phq9_item99"
+
+        edit_json(bindings / "bindings" / "example_intake" / "1-0-0.json", edit)
+        report = run_check(registries, measure_schema_path, binding_schema_path)
+
+        (issue,) = report.errors
+        assert "phq9_item99" in issue.message
+
+    def test_band_gap_and_unknown_scale_item(
+        self,
+        registries: tuple[Path, Path],
+        measure_schema_path: Path,
+        binding_schema_path: Path,
+    ) -> None:
+        """Test that interpretation gaps and bad scale items are errors."""
+        measures, _ = registries
+
+        def edit(data: dict) -> None:
+            total = data["scales"][0]
+            total["interpretations"][1]["min"] += 1
+            total["items"].append("phq9_item99")
+
+        edit_json(measures / "measures" / "phq9" / "1-0-0.json", edit)
+        report = run_check(registries, measure_schema_path, binding_schema_path)
+
+        checks = sorted(issue.check for issue in report.errors)
+        assert checks == ["interpretation", "measure"]
+
+    def test_overlapping_bands(
+        self,
+        registries: tuple[Path, Path],
+        measure_schema_path: Path,
+        binding_schema_path: Path,
+    ) -> None:
+        """Test that overlapping interpretation bands are an error."""
+        measures, _ = registries
+
+        def edit(data: dict) -> None:
+            data["scales"][0]["interpretations"][1]["min"] -= 1
+
+        edit_json(measures / "measures" / "gad7" / "1-0-0.json", edit)
+        report = run_check(registries, measure_schema_path, binding_schema_path)
+
+        (issue,) = report.errors
+        assert "overlap" in issue.message
+
+    def test_schema_and_location_errors(
+        self,
+        registries: tuple[Path, Path],
+        measure_schema_path: Path,
+        binding_schema_path: Path,
+    ) -> None:
+        """Test schema failures and specs stored under the wrong version."""
+        measures, bindings = registries
+        (measures / "measures" / "gad7" / "1-0-0.json").write_text(
+            json.dumps({"type": "measure_spec"})
+        )
+        source = bindings / "bindings" / "followup" / "1-0-0.json"
+        shutil.copy(source, source.with_name("2-0-0.json"))
+
+        report = run_check(registries, measure_schema_path, binding_schema_path)
+
+        by_check = {issue.check for issue in report.errors}
+        assert by_check == {"schema", "location", "reference"}
+        location = next(issue for issue in report.errors if issue.check == "location")
+        assert location.version == "2.0.0"
+
+    def test_cli_json_report(
+        self,
+        registries: tuple[Path, Path],
+        project_root: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Test the 'registry check' command's machine-readable output."""
+        measures, bindings = registries
+
+        def edit(data: dict) -> None:
+            data["sections"][0]["measure_version"] = "9.9.9"
+
+        edit_json(bindings / "bindings" / "example_intake" / "1-0-0.json", edit)
+        monkeypatch.chdir(project_root)
+
+        result = CliRunner().invoke(
+            app,
+            [
+                "registry",
+                "check",
+                "--measure-registry",
+                str(measures),
+                "--form-binding-registry",
+                str(bindings),
+                "--workers",
+                "1",
+                "--json",
+            ],
+        )
+
+        assert result.exit_code == 1
+        report = CheckReport.model_validate_json(result.stdout)
+        assert not report.ok
+        assert report.errors[0].spec_id == "example_intake"
+        # The summary is part of the JSON itself
+        data = json.loads(result.stdout)
+        assert data["ok"] is False
+        assert data["error_count"] == len(report.errors) > 0
+        assert data["warning_count"] == len(report.warnings)
@@ -1,15 +1,17 @@
-"""Tests for form input handling (FormInputClient and process_form_submission)."""
+"""Tests for form input handling (FormInputClient and process_form_submission(s))."""
 
 from pathlib import Path
 
 import pytest
 
+from finalform.core.models import ProcessingResult
 from finalform.input import (
     FormInputClient,
     MissingFormIdError,
     MissingItemMapError,
     UnmappedFieldError,
     process_form_submission,
+    process_form_submissions,
 )
 from finalform.registry import MeasureRegistry
 
@@ -37,6 +39,87 @@ def measure_registry(project_root: Path) -> MeasureRegistry:
     )
 
 
+@pytest.fixture
+def canonical_submission() -> dict:
+    """Create a canonical form submission."""
+    return {
+        "form_id": "client_intake_v3",
+        "submission_id": "subm_123",
+        "respondent": {"id": "contact-uuid", "display": "Jane Doe"},
+        "submitted_at": "2025-12-01T12:34:56Z",
+        "items": [
+            {
+                "field_id": "entry.111111",
+                "question_text": "Little interest or pleasure in doing things",
+                "raw_value": "more than half the days",
+            },
+            {
+                "field_id": "entry.222222",
+                "question_text": "Feeling down, depressed, or hopeless",
+                "raw_value": "nearly every day",
+            },
+            {
+                "field_id": "entry.333333",
+                "question_text": "Trouble falling or staying asleep",
+                "raw_value": "several days",
+            },
+            {
+                "field_id": "entry.444444",
+                "question_text": "Feeling tired or having little energy",
+                "raw_value": "several days",
+            },
+            {
+                "field_id": "entry.555555",
+                "question_text": "Poor appetite or overeating",
+                "raw_value": "not at all",
+            },
+            {
+                "field_id": "entry.666666",
+                "question_text": "Feeling bad about yourself",
+                "raw_value": "not at all",
+            },
+            {
+                "field_id": "entry.777777",
+                "question_text": "Trouble concentrating",
+                "raw_value": "several days",
+            },
+            {
+                "field_id": "entry.888888",
+                "question_text": "Moving or speaking slowly",
+                "raw_value": "not at all",
+            },
+            {
+                "field_id": "entry.999999",
+                "question_text": "Thoughts of self-harm",
+                "raw_value": "not at all",
+            },
+            {
+                "field_id": "entry.101010",
+                "question_text": "How difficult have these problems made things",
+                "raw_value": "somewhat difficult",
+            },
+        ],
+        "meta": {"source_system": "google_forms"},
+    }
+
+
+@pytest.fixture
+def phq9_item_map() -> dict[str, str]:
+    """Create PHQ-9 item map."""
+    return {
+        "entry.111111": "phq9_item1",
+        "entry.222222": "phq9_item2",
+        "entry.333333": "phq9_item3",
+        "entry.444444": "phq9_item4",
+        "entry.555555": "phq9_item5",
+        "entry.666666": "phq9_item6",
+        "entry.777777": "phq9_item7",
+        "entry.888888": "phq9_item8",
+        "entry.999999": "phq9_item9",
+        "entry.101010": "phq9_item10",
+    }
+
+
 class TestFormInputClient:
     """Tests for FormInputClient."""
 
@@ -123,85 +206,6 @@ class TestFormInputClient:
 class TestProcessFormSubmission:
     """Tests for process_form_submission."""
 
-    @pytest.fixture
-    def canonical_submission(self) -> dict:
-        """Create a canonical form submission."""
-        return {
-            "form_id": "client_intake_v3",
-            "submission_id": "subm_123",
-            "respondent": {"id": "contact-uuid", "display": "Jane Doe"},
-            "submitted_at": "2025-12-01T12:34:56Z",
-            "items": [
-                {
-                    "field_id": "entry.111111",
-                    "question_text": "Little interest or pleasure in doing things",
-                    "raw_value": "more than half the days",
-                },
-                {
-                    "field_id": "entry.222222",
-                    "question_text": "Feeling down, depressed, or hopeless",
-                    "raw_value": "nearly every day",
-                },
-                {
-                    "field_id": "entry.333333",
-                    "question_text": "Trouble falling or staying asleep",
-                    "raw_value": "several days",
-                },
-                {
-                    "field_id": "entry.444444",
-                    "question_text": "Feeling tired or having little energy",
-                    "raw_value": "several days",
-                },
-                {
-                    "field_id": "entry.555555",
-                    "question_text": "Poor appetite or overeating",
-                    "raw_value": "not at all",
-                },
-                {
-                    "field_id": "entry.666666",
-                    "question_text": "Feeling bad about yourself",
-                    "raw_value": "not at all",
-                },
-                {
-                    "field_id": "entry.777777",
-                    "question_text": "Trouble concentrating",
-                    "raw_value": "several days",
-                },
-                {
-                    "field_id": "entry.888888",
-                    "question_text": "Moving or speaking slowly",
-                    "raw_value": "not at all",
-                },
-                {
-                    "field_id": "entry.999999",
-                    "question_text": "Thoughts of self-harm",
-                    "raw_value": "not at all",
-                },
-                {
-                    "field_id": "entry.101010",
-                    "question_text": "How difficult have these problems made things",
-                    "raw_value": "somewhat difficult",
-                },
-            ],
-            "meta": {"source_system": "google_forms"},
-        }
-
-    @pytest.fixture
-    def phq9_item_map(self) -> dict[str, str]:
-        """Create PHQ-9 item map."""
-        return {
-            "entry.111111": "phq9_item1",
-            "entry.222222": "phq9_item2",
-            "entry.333333": "phq9_item3",
-            "entry.444444": "phq9_item4",
-            "entry.555555": "phq9_item5",
-            "entry.666666": "phq9_item6",
-            "entry.777777": "phq9_item7",
-            "entry.888888": "phq9_item8",
-            "entry.999999": "phq9_item9",
-            "entry.101010": "phq9_item10",
-        }
-
     def test_process_with_item_map_override(
         self,
         canonical_submission: dict,
@@ -462,3 +466,130 @@ class TestProcessFormSubmission:
         assert result.success is True
         # Unmapped field should be noted in warnings
         assert any("entry.EXTRA" in w for w in result.diagnostics.warnings)
+
+    def test_changed_mapping_is_picked_up(
+        self,
+        canonical_submission: dict,
+        phq9_item_map: dict[str, str],
+        form_input_client: FormInputClient,
+        measure_registry: MeasureRegistry,
+    ) -> None:
+        """Test that a binding spec is reused per mapping and rebuilt when it changes."""
+
+        def process() -> ProcessingResult:
+            return process_form_submission(
+                canonical_submission,
+                measure_id="phq9",
+                form_input_client=form_input_client,
+                measure_registry=measure_registry,
+            )
+
+        def item_values(result: ProcessingResult) -> dict[str, float | None]:
+            return {o.code: o.value for o in result.events[0].observations if o.kind == "item"}
+
+        form_input_client.save_item_map("client_intake_v3", "phq9", phq9_item_map)
+        first = process()
+        again = process()
+        swapped = {**phq9_item_map, "entry.111111": "phq9_item2", "entry.222222": "phq9_item1"}
+        form_input_client.save_item_map("client_intake_v3", "phq9", swapped)
+        changed = process()
+
+        fingerprints = [
+            result.events[0].telemetry.form_binding_spec_fingerprint
+            for result in (first, again, changed)
+        ]
+        assert fingerprints[1] == fingerprints[0]
+        assert fingerprints[2] != fingerprints[0]
+        assert item_values(changed)["phq9_item1"] == item_values(first)["phq9_item2"]
+        assert item_values(changed)["phq9_item2"] == item_values(first)["phq9_item1"]
+
+
+class TestProcessFormSubmissions:
+    """Tests for process_form_submissions."""
+
+    def test_matches_single_submission(
+        self,
+        canonical_submission: dict,
+        phq9_item_map: dict[str, str],
+        form_input_client: FormInputClient,
+        measure_registry: MeasureRegistry,
+    ) -> None:
+        """Test that each result matches process_form_submission's."""
+        form_input_client.save_item_map("client_intake_v3", "phq9", phq9_item_map)
+        second = {**canonical_submission, "submission_id": "subm_456"}
+        second["items"] = [
+            {**item, "raw_value": "not at all"} for item in canonical_submission["items"][:9]
+        ]
+        kwargs = {
+            "measure_id": "phq9",
+            "form_input_client": form_input_client,
+            "measure_registry": measure_registry,
+        }
+
+        results = list(process_form_submissions([canonical_submission, second], **kwargs))
+
+        expected = [
+            process_form_submission(submission, **kwargs)
+            for submission in (canonical_submission, second)
+        ]
+        assert [r.form_submission_id for r in results] == ["subm_123", "subm_456"]
+        for result, single in zip(results, expected):
+            assert result.diagnostics == single.diagnostics
+            assert [(o.code, o.value, o.label) for o in result.events[0].observations] == [
+                (o.code, o.value, o.label) for o in single.events[0].observations
+            ]
+
+    def test_resolves_once_per_form(
+        self,
+        canonical_submission: dict,
+        phq9_item_map: dict[str, str],
+        form_input_client: FormInputClient,
+        measure_registry: MeasureRegistry,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Test that the item map is read once per form_id, not per submission."""
+        form_input_client.save_item_map("client_intake_v3", "phq9", phq9_item_map)
+        form_input_client.save_item_map("other_form", "phq9", phq9_item_map)
+        calls: list[tuple[str, str]] = []
+        get_item_map = form_input_client.get_item_map
+
+        def counting_get_item_map(form_id: str, measure_id: str):
+            calls.append((form_id, measure_id))
+            return get_item_map(form_id, measure_id)
+
+        monkeypatch.setattr(form_input_client, "get_item_map", counting_get_item_map)
+        other = {**canonical_submission, "form_id": "other_form"}
+
+        results = list(
+            process_form_submissions(
+                [canonical_submission, other, canonical_submission, other],
+                measure_id="phq9",
+                form_input_client=form_input_client,
+                measure_registry=measure_registry,
+            )
+        )
+
+        assert all(result.success for result in results)
+        assert calls == [("client_intake_v3", "phq9"), ("other_form", "phq9")]
+
+    def test_streams_results(
+        self,
+        canonical_submission: dict,
+        form_input_client: FormInputClient,
+        measure_registry: MeasureRegistry,
+    ) -> None:
+        """Test that submissions are processed as results are consumed."""
+        unmapped = {**canonical_submission, "form_id": "unmapped_form"}
+        form_input_client.save_item_map("client_intake_v3", "phq9", {})
+
+        results = process_form_submissions(
+            iter([canonical_submission, unmapped]),
+            measure_id="phq9",
+            form_input_client=form_input_client,
+            measure_registry=measure_registry,
+            strict=False,
+        )
+
+        assert next(results).form_submission_id == "subm_123"
+        with pytest.raises(MissingItemMapError, match="unmapped_form"):
+            next(results)
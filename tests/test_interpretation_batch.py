@@ -0,0 +1,75 @@
+"""Tests for vectorized batch interpretation."""
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from finalform.interpretation import Interpreter  # noqa: E402
+from finalform.interpretation.batch import band_indexes, label_column  # noqa: E402
+from finalform.interpretation.interpreter import find_band  # noqa: E402
+from finalform.registry.models import MeasureSpec  # noqa: E402
+
+
+def with_bands(spec: MeasureSpec, bands: list[tuple[int, int]]) -> MeasureSpec:
+    """Copy a spec, replacing its first scale's interpretation bands."""
+    data = spec.model_dump()
+    data["scales"][0]["interpretations"] = [
+        {"min": low, "max": high, "label": f"band{n}"} for n, (low, high) in enumerate(bands)
+    ]
+    return MeasureSpec.model_validate(data)
+
+
+class TestBandIndexes:
+    """Tests for band_indexes."""
+
+    @pytest.mark.parametrize(
+        "bands",
+        [
+            [(0, 4), (5, 9), (10, 14), (15, 19), (20, 27)],
+            [(10, 27), (0, 9), (5, 12), (30, 30)],  # unsorted, overlap and gaps
+            [(0, 5000), (100, 200)],  # too wide for the dense table
+        ],
+    )
+    @pytest.mark.parametrize("dtype", [np.int64, np.float64])
+    def test_matches_find_band(self, phq9_spec, bands, dtype) -> None:
+        """Test that every score gets the band find_band gives it."""
+        spec = with_bands(phq9_spec, bands)
+        scale_plan = spec.plan.scales[0]
+        scores = np.arange(-5, 40)
+        if dtype is np.float64:
+            scores = np.concatenate([scores / 3, [np.nan, np.inf, -np.inf, 4999.5]])
+
+        indexes = band_indexes(scale_plan, scores.astype(dtype))
+
+        interpretations = scale_plan.spec.interpretations
+        for score, index in zip(scores.tolist(), indexes.tolist()):
+            band = find_band(scale_plan, score)
+            assert index == (interpretations.index(band) if band is not None else -1)
+
+    def test_no_bands(self, phq9_spec) -> None:
+        """Test that a scale without bands labels nothing."""
+        scale_plan = with_bands(phq9_spec, []).plan.scales[0]
+
+        assert band_indexes(scale_plan, np.array([0, 5])).tolist() == [-1, -1]
+
+
+class TestLabelColumn:
+    """Tests for label_column."""
+
+    def test_matches_get_label(self, phq9_spec) -> None:
+        """Test that labels match Interpreter.get_label."""
+        scores = np.array([0.0, 4.0, 4.5, 12.0, 27.0, 28.0, np.nan])
+
+        labels = label_column(scores, phq9_spec, "phq9_total")
+
+        interpreter = Interpreter()
+        assert labels.tolist() == [
+            None if np.isnan(score) else interpreter.get_label("phq9_total", score, phq9_spec)
+            for score in scores.tolist()
+        ]
+        assert labels[3] == "Moderate"
+
+    def test_unknown_scale_rejected(self, phq9_spec) -> None:
+        """Test that an unknown scale is rejected."""
+        with pytest.raises(ValueError, match="Scale not found"):
+            label_column(np.array([1.0]), phq9_spec, "unknown_scale")
@@ -6,6 +6,7 @@ import pytest
 
 from finalform.mapping import MappedItem, Mapper, MappingResult
 from finalform.registry import BindingRegistry
+from finalform.registry.models import FormBindingSpec
 
 
 @pytest.fixture
@@ -191,6 +192,84 @@ class TestMapper:
 
         assert "entry.extra_field" in result.unmapped_fields
 
+    def test_unmapped_fields_in_form_order(
+        self, mapper: Mapper, example_binding, complete_phq9_response: dict
+    ) -> None:
+        """Test that unmapped fields are reported once each, in form order."""
+        response = complete_phq9_response.copy()
+        response["items"] = [
+            {"field_key": "entry.zzz", "answer": "a"},
+            *response["items"],
+            {"field_key": "entry.aaa", "answer": "b"},
+            {"field_key": "entry.zzz", "answer": "c"},
+        ]
+
+        result = mapper.map(response, example_binding)
+
+        assert result.unmapped_fields == ["entry.zzz", "entry.aaa"]
+
+    def test_map_by_position(self, mapper: Mapper) -> None:
+        """Test position bindings, where the last item at a position wins."""
+        binding = FormBindingSpec.model_validate({
+            "type": "form_binding_spec",
+            "form_id": "f",
+            "binding_id": "b",
+            "version": "1.0.0",
+            "sections": [
+                {
+                    "measure_id": "m1",
+                    "measure_version": "1.0.0",
+                    "bindings": [
+                        {"item_id": "item2", "by": "position", "value": 2},
+                        {"item_id": "item1", "by": "position", "value": 1},
+                    ],
+                }
+            ],
+        })
+        response = {
+            "items": [
+                {"field_key": "q1", "position": 1, "answer": "first"},
+                {"field_key": "q2", "position": 2, "answer": "old"},
+                {"field_key": "q2b", "position": 2, "value": 7},
+            ]
+        }
+
+        result = mapper.map(response, binding)
+
+        (section,) = result.sections
+        assert [(i.item_id, i.raw_answer) for i in section.items] == [
+            ("item2", 7),
+            ("item1", "first"),
+        ]
+        assert result.unmapped_fields == ["q2"]
+
+    def test_map_selected_measures(
+        self, mapper: Mapper, example_binding, complete_phq9_response: dict
+    ) -> None:
+        """Test mapping a subset of measures keeps the other bindings' fields used."""
+        response = complete_phq9_response.copy()
+        response["items"] = response["items"] + [
+            {"field_key": "entry.extra_field", "answer": "extra value"}
+        ]
+
+        result = mapper.map(response, example_binding, measure_ids=["gad7"])
+        full = mapper.map(response, example_binding)
+
+        assert [s.measure_id for s in result.sections] == ["gad7"]
+        assert result.sections[0] == full.sections[1]
+        assert result.unmapped_fields == ["entry.extra_field"]
+
+    def test_iter_sections_is_lazy(
+        self, mapper: Mapper, example_binding, complete_phq9_response: dict
+    ) -> None:
+        """Test iter_sections yields the same sections as map, one at a time."""
+        sections = mapper.iter_sections(complete_phq9_response, example_binding)
+
+        expected = mapper.map(complete_phq9_response, example_binding).sections
+        assert next(sections) == expected[0]
+        assert next(sections) == expected[1]
+        assert next(sections, None) is None
+
     def test_map_section_returns_specific_instrument(
         self, mapper: Mapper, example_binding, complete_phq9_response: dict
     ) -> None:
@@ -1,5 +1,8 @@
 """Tests for the pipeline orchestrator."""
 
+import gc
+import multiprocessing
+from collections.abc import Callable, Iterator
 from pathlib import Path
 
 import pytest
@@ -32,6 +35,20 @@ def pipeline(pipeline_config: PipelineConfig) -> Pipeline:
     return Pipeline(pipeline_config)
 
 
+@pytest.fixture
+def start_method() -> Iterator[Callable[[str], None]]:
+    """Set multiprocessing's default start method for one test."""
+    previous = multiprocessing.get_start_method(allow_none=True)
+
+    def use(method: str) -> None:
+        if method not in multiprocessing.get_all_start_methods():
+            pytest.skip(f"{method} start method not available")
+        multiprocessing.set_start_method(method, force=True)
+
+    yield use
+    multiprocessing.set_start_method(previous, force=True)
+
+
 @pytest.fixture
 def complete_phq9_response() -> dict:
     """A complete PHQ-9 form response (PHQ-9 only, no GAD-7)."""
@@ -169,6 +186,22 @@ class TestPipeline:
         assert total_score.value is not None
         assert total_score.label is not None  # Interpretation label
 
+    def test_process_records_spec_fingerprints(
+        self,
+        pipeline: Pipeline,
+        complete_multi_instrument_response: dict,
+    ) -> None:
+        """Test that telemetry carries the fingerprints of the specs used."""
+        result = pipeline.process(complete_multi_instrument_response)
+
+        for event in result.events:
+            measure = pipeline.measures[event.measure_id]
+            assert event.telemetry.measure_spec_fingerprint == measure.fingerprint
+            assert (
+                event.telemetry.form_binding_spec_fingerprint
+                == pipeline.binding_spec.fingerprint
+            )
+
     def test_process_includes_item_observations(
         self,
         pipeline: Pipeline,
@@ -241,6 +274,111 @@ class TestPipeline:
         assert result1.events[0].measurement_event_id == result2.events[0].measurement_event_id
 
 
+class TestPipelinePreload:
+    """Tests for eager registry preloading in the pipeline."""
+
+    def test_preload_option(self, pipeline_config: PipelineConfig) -> None:
+        """Test that preload=True loads every spec up front."""
+        pipeline = Pipeline(pipeline_config.model_copy(update={"preload": True}))
+
+        assert "phq9@1.0.0" in pipeline.preload_reports["measures"].timings
+        assert "example_intake@1.0.0" in pipeline.preload_reports["bindings"].timings
+        assert ("fscrs", "1.0.0") in pipeline.measure_registry._cache
+
+    def test_no_preload_by_default(self, pipeline: Pipeline) -> None:
+        """Test that registries load lazily by default."""
+        assert pipeline.preload_reports == {}
+        assert ("fscrs", "1.0.0") not in pipeline.measure_registry._cache
+
+
+class TestPipelineParallel:
+    """Tests for multi-process batch processing."""
+
+    def test_process_parallel_matches_sequential(
+        self,
+        pipeline: Pipeline,
+        complete_multi_instrument_response: dict,
+    ) -> None:
+        """Test that worker processes produce the same results, in order."""
+        responses = []
+        for i in range(6):
+            response = dict(complete_multi_instrument_response)
+            response["form_submission_id"] = f"sub_{i}"
+            responses.append(response)
+
+        parallel = pipeline.process_parallel(responses, workers=2, chunksize=2)
+        sequential = pipeline.process_batch(responses)
+
+        assert [r.form_submission_id for r in parallel] == [f"sub_{i}" for i in range(6)]
+        for got, expected in zip(parallel, sequential, strict=True):
+            assert [e.measurement_event_id for e in got.events] == [
+                e.measurement_event_id for e in expected.events
+            ]
+            assert [o.value for e in got.events for o in e.observations] == [
+                o.value for e in expected.events for o in e.observations
+            ]
+
+    def test_process_parallel_unfreezes_parent(
+        self,
+        pipeline: Pipeline,
+        complete_multi_instrument_response: dict,
+    ) -> None:
+        """Test that the parent's garbage collector is restored afterwards."""
+        pipeline.process_parallel([complete_multi_instrument_response], workers=1)
+
+        assert gc.get_freeze_count() == 0
+
+    def test_process_parallel_keeps_caller_freeze(
+        self,
+        pipeline: Pipeline,
+        complete_multi_instrument_response: dict,
+    ) -> None:
+        """Test that objects frozen by the caller stay frozen."""
+        pipeline.freeze()
+        try:
+            frozen = gc.get_freeze_count()
+            pipeline.process_parallel([complete_multi_instrument_response], workers=1)
+
+            assert gc.get_freeze_count() == frozen
+        finally:
+            gc.unfreeze()
+
+    def test_process_parallel_spawn(
+        self,
+        pipeline: Pipeline,
+        complete_multi_instrument_response: dict,
+        start_method: Callable[[str], None],
+    ) -> None:
+        """Test that spawned workers build their own pipeline, with no freeze."""
+        start_method("spawn")
+        pipeline.watch(interval=60)
+        try:
+            parallel = pipeline.process_parallel([complete_multi_instrument_response], workers=1)
+            sequential = pipeline.process_batch([complete_multi_instrument_response])
+        finally:
+            pipeline.close()
+
+        assert gc.get_freeze_count() == 0
+        assert [o.value for e in parallel[0].events for o in e.observations] == [
+            o.value for e in sequential[0].events for o in e.observations
+        ]
+
+    def test_process_parallel_rejects_hot_reloading(
+        self,
+        pipeline: Pipeline,
+        complete_multi_instrument_response: dict,
+        start_method: Callable[[str], None],
+    ) -> None:
+        """Test that forking with a live watcher thread is refused."""
+        start_method("fork")
+        pipeline.watch(interval=60)
+        try:
+            with pytest.raises(RuntimeError, match="hot reloading"):
+                pipeline.process_parallel([complete_multi_instrument_response], workers=1)
+        finally:
+            pipeline.close()
+
+
 class TestPipelineConfig:
     """Tests for PipelineConfig."""
 
@@ -0,0 +1,347 @@
+"""Tests for compiled measure plans."""
+
+import math
+from pathlib import Path
+
+import pytest
+
+from finalform.registry import BindingRegistry, MeasureRegistry
+from finalform.registry.models import FormBindingSpec, MeasureScale, MeasureSpec
+from finalform.registry.plan import compile_bands, compile_binding, compile_measure
+
+
+@pytest.fixture
+def measure_registry(measure_registry_path: Path, measure_schema_path: Path) -> MeasureRegistry:
+    """Create measure registry with schema validation."""
+    return MeasureRegistry(measure_registry_path, schema_path=measure_schema_path)
+
+
+class TestMeasurePlan:
+    """Tests for MeasurePlan compilation."""
+
+    def test_plan_compiled_at_load(self, measure_registry: MeasureRegistry) -> None:
+        """Test that the registry compiles the plan when loading a spec."""
+        spec = measure_registry.get("phq9", "1.0.0")
+
+        assert spec._compiled.plan is not None
+        assert spec.plan is spec.plan
+
+    def test_item_index(self, measure_registry: MeasureRegistry) -> None:
+        """Test item lookup and precomputed response bounds."""
+        plan = measure_registry.get("phq9", "1.0.0").plan
+
+        item = plan.get_item("phq9_item1")
+        assert item is not None
+        assert item.index == 0
+        assert item.min_value == 0
+        assert item.max_value == 3
+        assert item.scale_ids == ("phq9_total",)
+        assert plan.get_item("nonexistent") is None
+        assert "phq9_item10" in plan.item_ids
+
+    def test_item_to_scales_reverse_map(self, measure_registry: MeasureRegistry) -> None:
+        """Test items shared between a total and a subscale."""
+        plan = measure_registry.get("ipip_neo_60_c", "1.0.0").plan
+
+        item = plan.get_item("ipip_neo_60_c_item1")
+        assert item is not None
+        assert item.scale_ids[0] == "ipip_neo_60_c_cons"
+        assert len(item.scale_ids) == 2
+
+    def test_scale_reversed_mask(self, measure_registry: MeasureRegistry) -> None:
+        """Test per-scale reversed-item masks and reverse constant."""
+        spec = measure_registry.get("ipip_neo_60_c", "1.0.0")
+        scale = spec.plan.get_scale("ipip_neo_60_c_cons")
+        assert scale is not None
+
+        reversed_ids = {
+            item_id for item_id, rev in zip(scale.item_ids, scale.reversed_mask) if rev
+        }
+        assert reversed_ids == set(scale.spec.reversed_items)
+        assert scale.reverse_max == 5
+        assert scale.item_indexes == tuple(
+            spec.plan.items_by_id[item_id].index for item_id in scale.item_ids
+        )
+
+    def test_spec_lookups_use_plan(self, measure_registry: MeasureRegistry) -> None:
+        """Test that MeasureSpec.get_item/get_scale return the spec objects."""
+        spec = measure_registry.get("gad7", "1.0.0")
+
+        assert spec.get_item("gad7_item3") is spec.items[2]
+        assert spec.get_scale("gad7_total") is spec.scales[0]
+        assert spec.get_item("nonexistent") is None
+        assert spec.get_scale("nonexistent") is None
+
+    def test_duplicate_ids_resolve_to_first(self) -> None:
+        """Test that duplicate item IDs keep first-match semantics."""
+        spec = MeasureSpec(
+            type="measure_spec",
+            measure_id="dup",
+            version="1.0.0",
+            name="Duplicate",
+            kind="questionnaire",
+            items=[
+                {"item_id": "a", "position": 1, "text": "A", "response_map": {"no": 0}},
+                {"item_id": "a", "position": 2, "text": "A2", "response_map": {"yes": 1}},
+            ],
+            scales=[],
+        )
+        plan = compile_measure(spec)
+
+        assert plan.items_by_id["a"].index == 0
+        assert spec.get_item("a") is spec.items[0]
+
+    def test_response_table_folds_aliases(self) -> None:
+        """Test that the response table holds normalized text and resolved aliases."""
+        spec = MeasureSpec(
+            type="measure_spec",
+            measure_id="table",
+            version="1.0.0",
+            name="Table",
+            kind="questionnaire",
+            items=[
+                {
+                    "item_id": "a",
+                    "position": 1,
+                    "text": "A",
+                    "response_map": {" Never": 0, "Often ": 2, "1": 1},
+                    "aliases": {"Rarely": "never", "often": "sometimes"},
+                },
+            ],
+            scales=[],
+        )
+        item = compile_measure(spec).items[0]
+
+        # An alias to an unknown response shadows the response it names
+        assert item.responses == {"never": 0, "1": 1, "rarely": 0}
+        assert item.numeric_responses == frozenset({"1"})
+        assert (item.min_value, item.max_value) == (0, 2)
+
+    def test_recode_strategies(self) -> None:
+        """Test that each item gets a strategy from its response text."""
+        spec = MeasureSpec(
+            type="measure_spec",
+            measure_id="strategies",
+            version="1.0.0",
+            name="Strategies",
+            kind="questionnaire",
+            items=[
+                {"item_id": "t", "position": 1, "text": "T", "response_map": {"no": 0, "yes": 1}},
+                {
+                    "item_id": "n",
+                    "position": 2,
+                    "text": "N",
+                    "response_map": {"1": 1, "2": 2},
+                    "aliases": {"low": "1"},
+                },
+                {"item_id": "m", "position": 3, "text": "M", "response_map": {"none": 0, "1": 1}},
+            ],
+            scales=[],
+        )
+
+        plan = compile_measure(spec)
+
+        assert [item.strategy for item in plan.items] == ["text", "numeric", "mixed"]
+
+    def test_scale_scoring_constants(self) -> None:
+        """Test reverse counts, repeats and the score factor tables."""
+        items = [
+            {"item_id": item_id, "position": n, "text": item_id, "response_map": {"a": 0, "b": 4}}
+            for n, item_id in enumerate(["x", "y", "z"], start=1)
+        ]
+        spec = MeasureSpec(
+            type="measure_spec",
+            measure_id="scoring",
+            version="1.0.0",
+            name="Scoring",
+            kind="questionnaire",
+            items=items,
+            scales=[
+                {
+                    "scale_id": "doubled",
+                    "name": "Doubled",
+                    "items": ["x", "y", "z", "x"],
+                    "method": "sum_then_double",
+                    "reversed_items": ["y"],
+                    "interpretations": [],
+                },
+                {
+                    "scale_id": "mean",
+                    "name": "Mean",
+                    "items": ["x", "y"],
+                    "method": "average",
+                    "interpretations": [],
+                },
+            ],
+        )
+
+        doubled, mean = compile_measure(spec).scales
+
+        assert doubled.reverse_counts == (0, 1, 0, 0)
+        assert doubled.has_repeats is True
+        assert doubled.score_factors == (0.0, 8.0, 4.0, 8 / 3, 2.0)
+        assert doubled.score_fn(6, 3, doubled.score_factors[3]) == 6 * (4 / 3) * 2
+        assert mean.reverse_counts == (0, 0)
+        assert mean.has_repeats is False
+        assert mean.score_fn(3, 2, mean.score_factors[2]) == 1.5
+
+    @pytest.mark.parametrize(
+        "bands",
+        [
+            [(0, 4), (5, 9), (10, 27)],
+            [(10, 27), (0, 4), (5, 9)],  # unsorted
+            [(0, 10), (5, 15), (20, 20)],  # overlap and gap
+            [(3, 1), (0, 2)],  # min > max never matches
+            [(0, 5000)],  # too wide for the dense table
+            [],
+        ],
+    )
+    def test_band_table_matches_linear_scan(self, bands: list[tuple[int, int]]) -> None:
+        """Test that band lookup gives the first listed band containing a score."""
+        scale = MeasureScale(
+            scale_id="s",
+            name="S",
+            items=[],
+            method="sum",
+            interpretations=[
+                {"min": low, "max": high, "label": str(n)} for n, (low, high) in enumerate(bands)
+            ],
+        )
+        table = compile_bands(scale)
+        scores = [n / 4 for n in range(-8, 121)]
+        scores += [4999.0, 5000.0, 5001.0, float("nan"), float("inf")]
+
+        for score in scores:
+            expected = next(
+                (n for n, (low, high) in enumerate(bands) if low <= score <= high), -1
+            )
+            assert table.find(score) == expected
+            if math.isfinite(score) and score.is_integer():
+                assert table.find(int(score)) == expected
+        assert bool(table.dense) == (bands != [] and bands != [(0, 5000)])
+
+    @pytest.mark.parametrize(
+        ("bands", "overlaps", "gaps"),
+        [
+            ([(0, 4), (5, 9), (10, 27)], (), ()),
+            ([(10, 27), (0, 9), (5, 12), (30, 30)], ((0, 2), (1, 2)), ((28, 29),)),
+            ([(0, 20), (5, 9), (12, 15), (25, 30)], ((0, 1), (0, 2)), ((21, 24),)),
+            ([(3, 1), (0, 2)], (), ()),
+            ([], (), ()),
+        ],
+    )
+    def test_band_table_overlaps_and_gaps(
+        self,
+        bands: list[tuple[int, int]],
+        overlaps: tuple[tuple[int, int], ...],
+        gaps: tuple[tuple[int, int], ...],
+    ) -> None:
+        """Test that compiling bands records overlapping bands and uncovered scores."""
+        scale = MeasureScale(
+            scale_id="s",
+            name="S",
+            items=[],
+            method="sum",
+            interpretations=[
+                {"min": low, "max": high, "label": str(n)} for n, (low, high) in enumerate(bands)
+            ],
+        )
+        table = compile_bands(scale)
+
+        assert table.overlaps == overlaps
+        assert table.gaps == gaps
+
+    def test_plan_does_not_affect_equality(
+        self, measure_registry_path: Path
+    ) -> None:
+        """Test that compiled and uncompiled specs still compare equal."""
+        loaded = MeasureRegistry(measure_registry_path).get("phq9", "1.0.0")
+        fresh = MeasureSpec.model_validate(loaded.model_dump())
+
+        assert fresh._compiled.plan is None
+        assert loaded == fresh
+
+    def test_copies_recompile(self, measure_registry: MeasureRegistry) -> None:
+        """Test that a copy with changed items gets its own plan and fingerprint."""
+        spec = measure_registry.get("phq9", "1.0.0")
+
+        copied = spec.model_copy(update={"items": spec.items[:2]})
+        deep = spec.model_copy(deep=True)
+
+        assert len(copied.plan.items) == 2
+        assert copied.plan is not spec.plan
+        assert copied.fingerprint != spec.fingerprint
+        assert len(spec.plan.items) == 10
+        assert deep._compiled.plan is None
+        assert deep.fingerprint == spec.fingerprint
+
+
+class TestBindingPlan:
+    """Tests for BindingPlan compilation."""
+
+    def test_plan_compiled_at_load(self, binding_registry_path: Path) -> None:
+        """Test that the registry compiles the routing table when loading a spec."""
+        spec = BindingRegistry(binding_registry_path).get("example_intake", "1.0.0")
+
+        assert spec._compiled.plan is not None
+        assert spec.plan is spec.plan
+
+    def test_slots_follow_section_and_binding_order(self, binding_registry_path: Path) -> None:
+        """Test that slots are numbered in section and binding order."""
+        spec = BindingRegistry(binding_registry_path).get("example_intake", "1.0.0")
+        plan = spec.plan
+
+        assert [s.measure_id for s in plan.sections] == ["phq9", "gad7"]
+        phq9, gad7 = plan.sections
+        assert [plan.slot_item_ids[i] for i in phq9.slots] == [
+            b.item_id for b in spec.sections[0].bindings
+        ]
+        assert gad7.slots.start == phq9.slots.stop
+        assert plan.by_field_key["entry.123456001"] == (0,)
+
+    def test_shared_fields_and_positions(self) -> None:
+        """Test that one field can fill several slots, by key or position."""
+        spec = FormBindingSpec.model_validate({
+            "type": "form_binding_spec",
+            "form_id": "f",
+            "binding_id": "b",
+            "version": "1.0.0",
+            "sections": [
+                {
+                    "measure_id": "m1",
+                    "measure_version": "1.0.0",
+                    "bindings": [
+                        {"item_id": "a", "by": "field_key", "value": "q1"},
+                        {"item_id": "b", "by": "position", "value": 2},
+                    ],
+                },
+                {
+                    "measure_id": "m2",
+                    "measure_version": "1.0.0",
+                    "bindings": [{"item_id": "c", "by": "field_key", "value": "q1"}],
+                },
+            ],
+        })
+        plan = compile_binding(spec)
+
+        assert plan.by_field_key == {"q1": (0, 2)}
+        assert plan.by_position == {2: (1,)}
+        assert plan.slot_sections == (0, 0, 1)
+
+    def test_select_restricts_and_renumbers(self, binding_registry_path: Path) -> None:
+        """Test that a selected plan holds only the chosen sections' slots."""
+        plan = BindingRegistry(binding_registry_path).get("example_intake", "1.0.0").plan
+
+        selected = plan.select(["gad7"])
+
+        (gad7,) = selected.sections
+        assert gad7.index == 1
+        assert gad7.slots == range(len(plan.sections[1].slots))
+        assert selected.slot_item_ids == tuple(
+            plan.slot_item_ids[i] for i in plan.sections[1].slots
+        )
+        assert "entry.123456001" not in selected.by_field_key
+        assert selected.by_field_key["entry.789012001"] == (0,)
+        assert plan.select({"gad7"}) is selected
+        assert plan.select(["unknown"]).sections == ()
+
@@ -4,6 +4,7 @@ from pathlib import Path
 
 import pytest
 
+from finalform.builders import MeasurementEventBuilder
 from finalform.core import DomainProcessor, ProcessingStatus
 from finalform.domains.questionnaire import QuestionnaireProcessor
 from finalform.registry import BindingRegistry, MeasureRegistry
@@ -96,6 +97,35 @@ class TestQuestionnaireProcessor:
         assert len(result.events) == 2  # PHQ-9 and GAD-7
         assert result.diagnostics.status == ProcessingStatus.SUCCESS
 
+    def test_process_measure_subset(
+        self,
+        processor: QuestionnaireProcessor,
+        complete_form_response: dict,
+        binding_spec,
+        measures: dict,
+    ) -> None:
+        """Test processing only some of the binding's measures."""
+        result = processor.process(
+            form_response=complete_form_response,
+            binding_spec=binding_spec,
+            measures=measures,
+            deterministic_ids=True,
+            measure_ids=["gad7"],
+        )
+        full = processor.process(
+            form_response=complete_form_response,
+            binding_spec=binding_spec,
+            measures=measures,
+            deterministic_ids=True,
+        )
+
+        assert result.success is True
+        assert [e.measure_id for e in result.events] == ["gad7"]
+        assert [(o.code, o.value) for o in result.events[0].observations] == [
+            (o.code, o.value) for o in full.events[1].observations
+        ]
+        assert result.diagnostics.status == ProcessingStatus.SUCCESS
+
     def test_process_returns_measurement_events(
         self,
         processor: QuestionnaireProcessor,
@@ -171,6 +201,165 @@ class TestQuestionnaireProcessor:
             assert e1.measurement_event_id == e2.measurement_event_id
 
 
+def comparable(result) -> dict:
+    """Dump a ProcessingResult without its processing timestamps."""
+    data = result.model_dump()
+    for event in data["events"]:
+        event["telemetry"]["processed_at"] = None
+    return data
+
+
+def blank_answers(form: dict) -> None:
+    """Blank two GAD-7 answers and drop a PHQ-9 item."""
+    form["items"][11]["answer"] = ""
+    form["items"][12]["answer"] = None
+    del form["items"][3]
+
+
+def out_of_range(form: dict) -> None:
+    """Answer a PHQ-9 item with an out-of-range number."""
+    form["items"][0]["answer"] = 9
+
+
+def unknown_text(form: dict) -> None:
+    """Answer a GAD-7 item with text the measure does not define."""
+    form["items"][10]["answer"] = "sometimes"
+
+
+def extra_fields(form: dict) -> None:
+    """Add fields the binding does not map, and numeric answers."""
+    form["items"][1]["answer"] = 2
+    form["items"][2]["answer"] = "3"
+    form["items"].append({"field_key": "entry.extra", "answer": "x"})
+
+
+class TestProcessingModes:
+    """Tests that every processing mode produces identical results."""
+
+    @pytest.mark.parametrize(
+        "edit", [None, blank_answers, out_of_range, unknown_text, extra_fields]
+    )
+    def test_modes_agree(
+        self,
+        complete_form_response: dict,
+        binding_spec,
+        measures: dict,
+        edit,
+    ) -> None:
+        """Test that all modes give the same events and diagnostics."""
+        if edit is not None:
+            edit(complete_form_response)
+
+        results = [
+            QuestionnaireProcessor(mode=mode).process(
+                form_response=complete_form_response,
+                binding_spec=binding_spec,
+                measures=measures,
+                deterministic_ids=True,
+            )
+            for mode in QuestionnaireProcessor.MODES
+        ]
+
+        fast, fused, staged = (comparable(result) for result in results)
+        assert fast == staged
+        assert fused == staged
+
+    def test_unknown_mode(self) -> None:
+        """Test that an unknown mode is rejected."""
+        with pytest.raises(ValueError, match="Unknown processing mode"):
+            QuestionnaireProcessor(mode="turbo")
+
+
+class TestFailureIsolation:
+    """Tests that a failing measure does not stop the form's other measures."""
+
+    @pytest.mark.parametrize("mode", QuestionnaireProcessor.MODES)
+    def test_unrecodable_answers(
+        self,
+        complete_form_response: dict,
+        binding_spec,
+        measures: dict,
+        mode: str,
+    ) -> None:
+        """Test that unknown answers fail only their measure, item by item."""
+        complete_form_response["items"][10]["answer"] = "sometimes"
+        complete_form_response["items"][12]["answer"] = 9
+
+        result = QuestionnaireProcessor(mode=mode).process(
+            form_response=complete_form_response,
+            binding_spec=binding_spec,
+            measures=measures,
+            deterministic_ids=True,
+        )
+
+        assert [e.measure_id for e in result.events] == ["phq9"]
+        assert result.diagnostics.errors == []
+        phq9, gad7 = result.diagnostics.measures
+        assert phq9.status == ProcessingStatus.SUCCESS
+        assert gad7.status == ProcessingStatus.FAILED
+        assert [(e.stage, e.code, e.item_id) for e in gad7.errors] == [
+            ("recoding", "RECODING_ERROR", "gad7_item1"),
+            ("recoding", "RECODING_ERROR", "gad7_item3"),
+        ]
+
+    @pytest.mark.parametrize("mode", QuestionnaireProcessor.MODES)
+    def test_missing_measure_spec(
+        self,
+        complete_form_response: dict,
+        binding_spec,
+        measures: dict,
+        mode: str,
+    ) -> None:
+        """Test that a measure without a spec fails alone."""
+        result = QuestionnaireProcessor(mode=mode).process(
+            form_response=complete_form_response,
+            binding_spec=binding_spec,
+            measures={"gad7": measures["gad7"]},
+            deterministic_ids=True,
+        )
+
+        assert [e.measure_id for e in result.events] == ["gad7"]
+        phq9 = result.diagnostics.measures[0]
+        assert [(e.code, e.message) for e in phq9.errors] == [
+            ("MEASURE_NOT_FOUND", "Measure spec not found: phq9")
+        ]
+
+    @pytest.mark.parametrize("mode", QuestionnaireProcessor.MODES)
+    def test_unexpected_error_in_one_measure(
+        self,
+        complete_form_response: dict,
+        binding_spec,
+        measures: dict,
+        mode: str,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Test that an error while building one measure is reported on it."""
+
+        def fail_for_phq9(method):
+            def wrapper(*args, **kwargs):
+                if kwargs["measure"].measure_id == "phq9":
+                    raise RuntimeError("boom")
+                return method(*args, **kwargs)
+
+            return wrapper
+
+        for name in ("build", "build_from_values"):
+            method = getattr(MeasurementEventBuilder, name)
+            monkeypatch.setattr(MeasurementEventBuilder, name, fail_for_phq9(method))
+
+        result = QuestionnaireProcessor(mode=mode).process(
+            form_response=complete_form_response,
+            binding_spec=binding_spec,
+            measures=measures,
+            deterministic_ids=True,
+        )
+
+        assert [e.measure_id for e in result.events] == ["gad7"]
+        assert result.diagnostics.errors == []
+        phq9 = result.diagnostics.measures[0]
+        assert [(e.code, e.message) for e in phq9.errors] == [("PIPELINE_ERROR", "boom")]
+
+
 class TestValidateMeasure:
     """Tests for measure validation."""
 
@@ -5,8 +5,15 @@ from pathlib import Path
 import pytest
 
 from finalform.mapping import MappedItem, MappedSection, MappingResult
-from finalform.recoding import RecodedItem, Recoder, RecodingError, RecodingResult
+from finalform.recoding import (
+    RecodedItem,
+    RecodeMemo,
+    Recoder,
+    RecodingError,
+    RecodingResult,
+)
 from finalform.registry import MeasureRegistry
+from finalform.registry.models import MeasureSpec
 
 
 @pytest.fixture
@@ -373,6 +380,195 @@ class TestRecoder:
         assert "not found" in str(exc_info.value).lower()
 
 
+def answer_section(*answers) -> MappedSection:
+    """A PHQ-9 section answering phq9_item1 once per answer."""
+    return MappedSection(
+        measure_id="phq9",
+        measure_version="1.0.0",
+        items=[
+            MappedItem(
+                measure_id="phq9",
+                measure_version="1.0.0",
+                item_id="phq9_item1",
+                raw_answer=answer,
+            )
+            for answer in answers
+        ],
+    )
+
+
+class TestRecodeMemo:
+    """Tests for memoized recoding."""
+
+    def test_repeated_answers_hit_memo(self, recoder: Recoder, phq9_spec) -> None:
+        """Test that repeated answers are served from the memo."""
+        section = answer_section("several days", "several days", 1, 1.0, None)
+
+        first = recoder.recode_section(section, phq9_spec)
+        second = recoder.recode_section(section, phq9_spec)
+
+        assert first == second
+        assert [item.value for item in first.items] == [1, 1, 1, 1.0, None]
+        assert type(first.items[3].value) is float
+        stats = recoder.memo.stats()
+        # Missing answers bypass the memo; 1 and 1.0 are separate entries
+        assert (stats.misses, stats.hits, stats.entries) == (3, 5, 3)
+        assert stats.hit_rate == pytest.approx(5 / 8)
+
+    def test_errors_are_memoized(self, recoder: Recoder, phq9_spec) -> None:
+        """Test that a memoized error is raised again with the same message."""
+        section = answer_section("wrong")
+
+        with pytest.raises(RecodingError) as first:
+            recoder.recode_section(section, phq9_spec)
+        with pytest.raises(RecodingError) as second:
+            recoder.recode_section(section, phq9_spec)
+
+        assert str(first.value) == str(second.value)
+        assert recoder.memo.stats().hits == 1
+
+    def test_nan_bypasses_memo(self, recoder: Recoder, phq9_spec) -> None:
+        """Test that NaN answers are recoded without filling the memo."""
+        item_plan = phq9_spec.plan.items_by_id["phq9_item1"]
+
+        outcomes = [
+            recoder.recode_outcome(float("nan"), item_plan, phq9_spec.fingerprint)
+            for _ in range(3)
+        ]
+
+        assert all(value is None and "out of range" in error for value, error in outcomes)
+        assert len(recoder.memo) == 0
+
+    def test_memo_keyed_by_fingerprint(self, recoder: Recoder, phq9_spec) -> None:
+        """Test that a changed spec does not reuse outcomes for the old one."""
+        data = phq9_spec.model_dump()
+        data["items"][0]["response_map"]["several days"] = 3
+        changed = type(phq9_spec).model_validate(data)
+
+        recoder.recode_section(answer_section("several days"), phq9_spec)
+        result = recoder.recode_section(answer_section("several days"), changed)
+
+        assert result.items[0].value == 3
+        assert recoder.memo.stats().hits == 0
+
+    def test_memo_is_bounded(self) -> None:
+        """Test that the oldest outcome is evicted when the memo is full."""
+        memo = RecodeMemo(max_entries=2)
+        for key in ("a", "b", "c"):
+            memo.put(("fp", "item", str, key), (1, None))
+
+        assert len(memo) == 2
+        assert memo.get(("fp", "item", str, "a")) is None
+        assert memo.stats().evictions == 1
+
+    def test_memo_can_be_disabled(self, phq9_spec) -> None:
+        """Test that Recoder(memo_size=None) recodes without a memo."""
+        recoder = Recoder(memo_size=None)
+
+        result = recoder.recode_section(answer_section("several days"), phq9_spec)
+
+        assert recoder.memo is None
+        assert result.items[0].value == 1
+
+
+class TestRecodeOutcomes:
+    """Tests for recoding that reports failures instead of raising."""
+
+    def test_failures_reported_per_item(self, recoder: Recoder, phq9_spec) -> None:
+        """Test that every failing item is reported, with the raised message."""
+        item_ids = ["phq9_item1", "phq9_item2", "phq9_item99", "phq9_item3"]
+        answers = ["several days", "wrong", "not at all", None]
+
+        values, failures = recoder.recode_outcomes(item_ids, answers, phq9_spec)
+
+        assert values == [1, None, None, None]
+        assert [item_id for item_id, _ in failures] == ["phq9_item2", "phq9_item99"]
+        with pytest.raises(RecodingError) as raised:
+            recoder.recode_values(item_ids[:2], answers[:2], phq9_spec)
+        assert failures[0][1] == str(raised.value)
+        assert "Item not found" in failures[1][1]
+
+    def test_memoized_failure_not_raised(self, recoder: Recoder, phq9_spec) -> None:
+        """Test that a remembered failure is returned as an outcome."""
+        item_plan = phq9_spec.plan.get_item("phq9_item1")
+
+        first = recoder.recode_outcome("wrong", item_plan, phq9_spec.fingerprint)
+        second = recoder.recode_outcome("wrong", item_plan, phq9_spec.fingerprint)
+
+        assert first == second
+        assert first[0] is None and "Unknown response 'wrong'" in first[1]
+        assert recoder.memo.stats().hits == 1
+
+
+class TestRecodeStrategy:
+    """Tests that every recode strategy gives the same results."""
+
+    @pytest.fixture
+    def spec(self) -> MeasureSpec:
+        """A measure with one text, one numeric and one mixed item."""
+        return MeasureSpec(
+            type="measure_spec",
+            measure_id="strategies",
+            version="1.0.0",
+            name="Strategies",
+            kind="questionnaire",
+            items=[
+                {"item_id": "t", "position": 1, "text": "T", "response_map": {"no": 0, "yes": 3}},
+                {
+                    "item_id": "n",
+                    "position": 2,
+                    "text": "N",
+                    "response_map": {"0": 0, "3": 3},
+                    "aliases": {"high": "3"},
+                },
+                {"item_id": "m", "position": 3, "text": "M", "response_map": {"2": 0, "yes": 3}},
+            ],
+            scales=[],
+        )
+
+    @pytest.mark.parametrize(
+        ("item_id", "answer", "expected"),
+        [
+            ("t", " Yes", 3),
+            ("t", "2", 2),
+            ("t", "1.5", 1.5),
+            ("n", "3", 3),
+            ("n", "High", 3),
+            ("m", "yes", 3),
+            # Numeric parsing wins over a response with the same text
+            ("m", "2", 2),
+        ],
+    )
+    def test_recode(self, spec: MeasureSpec, item_id: str, answer: str, expected) -> None:
+        """Test text, numeric and alias answers for each strategy."""
+        result = Recoder(memo_size=None).recode_section(answer_section_for(item_id, answer), spec)
+
+        assert result.items[0].value == expected
+        assert type(result.items[0].value) is type(expected)
+
+    @pytest.mark.parametrize("item_id", ["t", "n", "m"])
+    def test_unknown_answer(self, spec: MeasureSpec, item_id: str) -> None:
+        """Test that unknown text fails the same way for each strategy."""
+        with pytest.raises(RecodingError, match="Unknown response 'maybe'"):
+            Recoder().recode_section(answer_section_for(item_id, "maybe"), spec)
+
+
+def answer_section_for(item_id: str, answer) -> MappedSection:
+    """A one-item section of the 'strategies' measure."""
+    return MappedSection(
+        measure_id="strategies",
+        measure_version="1.0.0",
+        items=[
+            MappedItem(
+                measure_id="strategies",
+                measure_version="1.0.0",
+                item_id=item_id,
+                raw_answer=answer,
+            )
+        ],
+    )
+
+
 class TestRecodedItem:
     """Tests for RecodedItem model."""
 
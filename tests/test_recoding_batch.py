@@ -0,0 +1,96 @@
+"""Tests for column-oriented batch recoding."""
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from finalform.mapping import MappedItem, MappedSection  # noqa: E402
+from finalform.recoding import Recoder, RecodingError  # noqa: E402
+from finalform.recoding.batch import factorize, recode_column  # noqa: E402
+
+
+def recode_items(answers: list, spec, item_id: str) -> list:
+    """Recode answers one RecodedItem at a time."""
+    section = MappedSection(
+        measure_id=spec.measure_id,
+        measure_version=spec.version,
+        items=[
+            MappedItem(
+                measure_id=spec.measure_id,
+                measure_version=spec.version,
+                item_id=item_id,
+                raw_answer=answer,
+            )
+            for answer in answers
+        ],
+    )
+    return Recoder().recode_section(section, spec).items
+
+
+class TestFactorize:
+    """Tests for factorize."""
+
+    def test_distinct_by_type_and_value(self) -> None:
+        """Test that equal answers of different types get different codes."""
+        uniques, codes = factorize(["a", 1, "a", 1.0, True, 1, ["x"]])
+
+        assert uniques == ["a", 1, 1.0, True, ["x"]]
+        assert codes.tolist() == [0, 1, 0, 2, 3, 1, 4]
+
+
+class TestRecodeColumn:
+    """Tests for recode_column."""
+
+    def test_matches_item_recoding(self, phq9_spec) -> None:
+        """Test that column values match recoding one item at a time."""
+        answers = ["several days", " Not at all ", None, "", 3, "2", "several days"] * 50
+
+        column = recode_column(answers, phq9_spec, "phq9_item1")
+        items = recode_items(answers, phq9_spec, "phq9_item1")
+
+        assert column.values.dtype == np.int64
+        assert len(column) == len(answers)
+        assert column.missing.tolist() == [item.missing for item in items]
+        assert column.values.tolist() == [item.value or 0 for item in items]
+
+    def test_float_answers_give_float_column(self, phq9_spec) -> None:
+        """Test that a float answer makes the column float64."""
+        column = recode_column([1.5, "several days", None], phq9_spec, "phq9_item1")
+
+        assert column.values.dtype == np.float64
+        assert column.values.tolist() == [1.5, 1.0, 0.0]
+        assert column.missing.tolist() == [False, False, True]
+
+    def test_first_error_matches_item_recoding(self, phq9_spec) -> None:
+        """Test that the first bad row raises the same error as Recoder."""
+        answers = ["several days", 9, "nonsense", 9]
+
+        with pytest.raises(RecodingError) as column_error:
+            recode_column(answers, phq9_spec, "phq9_item1")
+        with pytest.raises(RecodingError) as item_error:
+            recode_items(answers, phq9_spec, "phq9_item1")
+
+        assert str(column_error.value) == str(item_error.value)
+
+    def test_unknown_item(self, phq9_spec) -> None:
+        """Test that an unknown item raises RecodingError."""
+        with pytest.raises(RecodingError, match="Item not found"):
+            recode_column(["several days"], phq9_spec, "nonexistent")
+
+    def test_uses_recoder_memo(self, phq9_spec) -> None:
+        """Test that distinct answers are recoded once through the memo."""
+        recoder = Recoder()
+        answers = ["several days", "not at all"] * 1000
+
+        recode_column(answers, phq9_spec, "phq9_item1", recoder=recoder)
+        recode_column(answers, phq9_spec, "phq9_item1", recoder=recoder)
+
+        stats = recoder.memo.stats()
+        assert (stats.misses, stats.hits) == (2, 2)
+
+    def test_empty_column(self, phq9_spec) -> None:
+        """Test that an empty column gives empty arrays."""
+        column = recode_column([], phq9_spec, "phq9_item1")
+
+        assert len(column) == 0
+        assert column.missing.dtype == bool
@@ -1,12 +1,20 @@
 """Tests for registry modules."""
 
+import json
+import shutil
 from pathlib import Path
 
 import pytest
 
 from finalform.registry import BindingRegistry, MeasureRegistry
 from finalform.registry.bindings import BindingNotFoundError
-from finalform.registry.measures import MeasureNotFoundError
+from finalform.registry.cache import SpecCache
+from finalform.registry.fingerprint import combine_fingerprints
+from finalform.registry.measures import MeasureNotFoundError, MeasureValidationError
+from finalform.registry.models import MeasureSpec
+from finalform.registry.preload import PreloadError
+from finalform.registry.schema import get_validator, schema_errors
+from finalform.registry.versions import parse_version
 
 
 class TestMeasureRegistry:
@@ -208,3 +216,311 @@ class TestBindingRegistry:
         spec = registry.get_latest("example_intake")
         assert spec.binding_id == "example_intake"
         assert spec.version == "1.0.0"
+
+
+class TestValidatorCache:
+    """Tests for the shared compiled schema validator cache."""
+
+    def test_validator_built_once(self, measure_schema_path: Path) -> None:
+        """Test that the same schema file yields the same validator."""
+        assert get_validator(measure_schema_path) is get_validator(measure_schema_path)
+
+    def test_registries_share_validator(
+        self, measure_registry_path: Path, measure_schema_path: Path
+    ) -> None:
+        """Test that registries reuse the cached validator."""
+        first = MeasureRegistry(measure_registry_path, schema_path=measure_schema_path)
+        second = MeasureRegistry(measure_registry_path, schema_path=measure_schema_path)
+        assert first._validator is second._validator
+
+    def test_edited_schema_gets_new_validator(self, tmp_path: Path) -> None:
+        """Test that the cache is keyed by schema content."""
+        schema_file = tmp_path / "schema.json"
+        schema_file.write_text(json.dumps({"type": "object"}))
+        before = get_validator(schema_file)
+
+        schema_file.write_text(json.dumps({"type": "array"}))
+        after = get_validator(schema_file)
+
+        assert before is not after
+        assert schema_errors(after, {}) == ["$: {} is not of type 'array'"]
+
+    def test_reports_all_errors(
+        self,
+        tmp_path: Path,
+        measure_registry_path: Path,
+        measure_schema_path: Path,
+    ) -> None:
+        """Test that a spec with several problems reports all of them."""
+        shutil.copytree(measure_registry_path, tmp_path / "registry")
+        spec_file = tmp_path / "registry" / "measures" / "phq9" / "1-0-0.json"
+        data = json.loads(spec_file.read_text())
+        del data["name"]
+        data["kind"] = "not_a_kind"
+        spec_file.write_text(json.dumps(data))
+
+        errors = schema_errors(get_validator(measure_schema_path), data)
+        assert len(errors) >= 2
+
+        registry = MeasureRegistry(tmp_path / "registry", schema_path=measure_schema_path)
+        with pytest.raises(MeasureValidationError) as exc_info:
+            registry.get("phq9", "1.0.0")
+        for error in errors:
+            assert error in str(exc_info.value)
+
+
+class TestVersionIndex:
+    """Tests for the semver-aware version index."""
+
+    @pytest.fixture
+    def versioned_registry(self, tmp_path: Path, measure_registry_path: Path) -> Path:
+        """A registry where phq9 has 1.0.0, 1.9.0 and 1.10.0."""
+        registry = tmp_path / "registry"
+        shutil.copytree(measure_registry_path, registry)
+        phq9_dir = registry / "measures" / "phq9"
+        for version in ("1.9.0", "1.10.0"):
+            data = json.loads((phq9_dir / "1-0-0.json").read_text())
+            data["version"] = version
+            (phq9_dir / (version.replace(".", "-") + ".json")).write_text(json.dumps(data))
+        return registry
+
+    def test_parse_version_order(self) -> None:
+        """Test semver precedence of parsed versions."""
+        ordered = ["not-semver", "1.0.0-rc.1", "1.0.0", "1.2.0", "1.9.0", "1.10.0", "2.0.0"]
+        assert sorted(reversed(ordered), key=parse_version) == ordered
+
+    def test_parse_version_ignores_build_metadata(self) -> None:
+        """Test that build metadata does not affect precedence."""
+        assert parse_version("1.0.0+build") == parse_version("1.0.0")
+        assert parse_version("1.0.0-rc.1+build.5") == parse_version("1.0.0-rc.1")
+        assert parse_version("1.0.0+build") > parse_version("1.0.0-rc.1")
+
+    def test_parse_version_splits_prerelease_on_dots(self) -> None:
+        """Test that hyphens are part of a pre-release identifier."""
+        # "rc-1" is one alphanumeric identifier, so it sorts after numeric "1"
+        assert parse_version("1.0.0-1.2") < parse_version("1.0.0-rc-1")
+        assert parse_version("1.0.0-rc-1") != parse_version("1.0.0-rc.1")
+        assert parse_version("1.0.0-alpha-2") < parse_version("1.0.0-alpha-b")
+
+    def test_latest_is_semver_correct(self, versioned_registry: Path) -> None:
+        """Test that 1.10.0 is newer than 1.9.0."""
+        registry = MeasureRegistry(versioned_registry)
+
+        assert registry.list_versions("phq9") == ["1.0.0", "1.9.0", "1.10.0"]
+        assert registry.get_latest("phq9").version == "1.10.0"
+
+    def test_index_is_cached_until_refresh(self, versioned_registry: Path) -> None:
+        """Test that new versions are only visible after refresh()."""
+        registry = MeasureRegistry(versioned_registry)
+        assert registry.get_latest("phq9").version == "1.10.0"
+
+        phq9_dir = versioned_registry / "measures" / "phq9"
+        data = json.loads((phq9_dir / "1-0-0.json").read_text())
+        data["version"] = "2.0.0"
+        (phq9_dir / "2-0-0.json").write_text(json.dumps(data))
+
+        assert registry.get_latest("phq9").version == "1.10.0"
+        registry.refresh()
+        assert registry.get_latest("phq9").version == "2.0.0"
+
+    def test_invalidate_rebuilds_lazily(self, versioned_registry: Path) -> None:
+        """Test that invalidate() drops removed versions on next use."""
+        registry = MeasureRegistry(versioned_registry)
+        assert "1.10.0" in registry.list_versions("phq9")
+
+        (versioned_registry / "measures" / "phq9" / "1-10-0.json").unlink()
+        registry.version_index.invalidate()
+
+        assert registry.list_versions("phq9") == ["1.0.0", "1.9.0"]
+
+    def test_unknown_spec_has_no_versions(self, binding_registry_path: Path) -> None:
+        """Test listing versions of an unknown binding."""
+        registry = BindingRegistry(binding_registry_path)
+
+        assert registry.list_versions("nonexistent") == []
+        with pytest.raises(BindingNotFoundError):
+            registry.get_latest("nonexistent")
+
+
+class TestPreload:
+    """Tests for eager parallel preloading."""
+
+    def test_preload_all_measures(
+        self, measure_registry_path: Path, measure_schema_path: Path
+    ) -> None:
+        """Test that preload loads every spec and reports timings."""
+        registry = MeasureRegistry(measure_registry_path, schema_path=measure_schema_path)
+        report = registry.preload(max_workers=4)
+
+        spec_files = list(measure_registry_path.glob("measures/*/*.json"))
+        assert report.count == len(spec_files)
+        assert "phq9@1.0.0" in report.timings
+        assert all(seconds >= 0 for seconds in report.timings.values())
+        assert ("phq9", "1.0.0") in registry._cache
+
+    def test_preload_bindings(
+        self, binding_registry_path: Path, binding_schema_path: Path
+    ) -> None:
+        """Test preloading the binding registry."""
+        registry = BindingRegistry(binding_registry_path, schema_path=binding_schema_path)
+        report = registry.preload()
+
+        assert "intake_01@1.0.0" in report.timings
+
+    def test_preload_aggregates_errors(
+        self,
+        tmp_path: Path,
+        measure_registry_path: Path,
+        measure_schema_path: Path,
+    ) -> None:
+        """Test that preload failures are raised together."""
+        shutil.copytree(measure_registry_path, tmp_path / "registry")
+        for measure_id in ("phq9", "gad7"):
+            spec_file = tmp_path / "registry" / "measures" / measure_id / "1-0-0.json"
+            spec_file.write_text(json.dumps({"type": "measure_spec"}))
+
+        registry = MeasureRegistry(tmp_path / "registry", schema_path=measure_schema_path)
+        with pytest.raises(PreloadError) as exc_info:
+            registry.preload(max_workers=1)
+
+        assert exc_info.value.errors
+        assert all("1.0.0" in error for error in exc_info.value.errors)
+
+
+class TestSpecFingerprint:
+    """Tests for content-addressed spec fingerprints."""
+
+    def test_fingerprint_is_stable(self, measure_registry_path: Path) -> None:
+        """Test that separately loaded copies of a spec share a fingerprint."""
+        first = MeasureRegistry(measure_registry_path).get("phq9", "1.0.0")
+        second = MeasureRegistry(measure_registry_path).get("phq9", "1.0.0")
+
+        assert len(first.fingerprint) == 64
+        assert first.fingerprint == second.fingerprint
+        assert first._compiled.fingerprint is not None
+
+    def test_fingerprint_ignores_formatting(
+        self, tmp_path: Path, measure_registry_path: Path
+    ) -> None:
+        """Test that reformatting a spec file does not change its fingerprint."""
+        shutil.copytree(measure_registry_path, tmp_path / "registry")
+        spec_file = tmp_path / "registry" / "measures" / "phq9" / "1-0-0.json"
+        original = MeasureRegistry(tmp_path / "registry").get("phq9", "1.0.0").fingerprint
+
+        data = json.loads(spec_file.read_text())
+        spec_file.write_text(json.dumps(dict(reversed(data.items()))))
+        assert MeasureRegistry(tmp_path / "registry").get("phq9", "1.0.0").fingerprint == original
+
+    def test_fingerprint_changes_with_content(
+        self, tmp_path: Path, binding_registry_path: Path
+    ) -> None:
+        """Test that an in-place edit changes the fingerprint."""
+        shutil.copytree(binding_registry_path, tmp_path / "registry")
+        spec_file = tmp_path / "registry" / "bindings" / "example_intake" / "1-0-0.json"
+        original = BindingRegistry(tmp_path / "registry").get("example_intake", "1.0.0")
+
+        data = json.loads(spec_file.read_text())
+        data["sections"][0]["bindings"][0]["value"] = "entry.999"
+        spec_file.write_text(json.dumps(data))
+        edited = BindingRegistry(tmp_path / "registry").get("example_intake", "1.0.0")
+
+        assert edited.version == original.version
+        assert edited.fingerprint != original.fingerprint
+
+    def test_combine_fingerprints(self) -> None:
+        """Test that composite keys are order-sensitive and unambiguous."""
+        assert combine_fingerprints("a", "b") == combine_fingerprints("a", "b")
+        assert combine_fingerprints("a", "b") != combine_fingerprints("b", "a")
+        assert combine_fingerprints("ab", "c") != combine_fingerprints("a", "bc")
+
+
+class TestSpecCache:
+    """Tests for the bounded LRU spec cache."""
+
+    @pytest.fixture
+    def specs(self, measure_registry_path: Path) -> dict[str, MeasureSpec]:
+        """A few measure specs to cache."""
+        registry = MeasureRegistry(measure_registry_path)
+        return {
+            measure_id: registry.get(measure_id, "1.0.0")
+            for measure_id in ("phq9", "gad7", "fscrs")
+        }
+
+    def test_unbounded_by_default(self, specs: dict[str, MeasureSpec]) -> None:
+        """Test that nothing is evicted without a capacity."""
+        cache: SpecCache[MeasureSpec] = SpecCache()
+        for measure_id, spec in specs.items():
+            cache.put((measure_id, "1.0.0"), spec)
+
+        assert len(cache) == 3
+        assert cache.stats().evictions == 0
+
+    def test_evicts_least_recently_used(self, specs: dict[str, MeasureSpec]) -> None:
+        """Test that the least recently used spec is evicted first."""
+        cache: SpecCache[MeasureSpec] = SpecCache(max_entries=2)
+        cache.put(("phq9", "1.0.0"), specs["phq9"])
+        cache.put(("gad7", "1.0.0"), specs["gad7"])
+        assert cache.get(("phq9", "1.0.0")) is specs["phq9"]
+
+        cache.put(("fscrs", "1.0.0"), specs["fscrs"])
+
+        assert ("phq9", "1.0.0") in cache
+        assert ("gad7", "1.0.0") not in cache
+        assert ("fscrs", "1.0.0") in cache
+
+    def test_pinned_specs_are_not_evicted(self, specs: dict[str, MeasureSpec]) -> None:
+        """Test that pinned specs survive eviction."""
+        cache: SpecCache[MeasureSpec] = SpecCache(max_entries=1)
+        cache.pin(("phq9", "1.0.0"))
+        cache.put(("phq9", "1.0.0"), specs["phq9"])
+        cache.put(("gad7", "1.0.0"), specs["gad7"])
+
+        assert ("phq9", "1.0.0") in cache
+        assert ("gad7", "1.0.0") not in cache
+
+        cache.unpin(("phq9", "1.0.0"))
+        cache.put(("fscrs", "1.0.0"), specs["fscrs"])
+        assert ("phq9", "1.0.0") not in cache
+
+    def test_byte_capacity(self, specs: dict[str, MeasureSpec]) -> None:
+        """Test that the estimated byte size stays within the limit."""
+        sizes = {measure_id: len(spec.model_dump_json()) for measure_id, spec in specs.items()}
+        limit = sum(sizes.values()) - 1
+        cache: SpecCache[MeasureSpec] = SpecCache(max_bytes=limit)
+        for measure_id, spec in specs.items():
+            cache.put((measure_id, "1.0.0"), spec)
+
+        stats = cache.stats()
+        assert ("phq9", "1.0.0") not in cache
+        assert stats.estimated_bytes == sizes["gad7"] + sizes["fscrs"]
+        assert stats.evictions == 1
+
+    def test_stats_counters(self, specs: dict[str, MeasureSpec]) -> None:
+        """Test hit and miss counting."""
+        cache: SpecCache[MeasureSpec] = SpecCache()
+        assert cache.get(("phq9", "1.0.0")) is None
+        cache.put(("phq9", "1.0.0"), specs["phq9"])
+        cache.get(("phq9", "1.0.0"))
+        cache.get(("phq9", "1.0.0"))
+
+        stats = cache.stats()
+        assert (stats.hits, stats.misses) == (2, 1)
+        assert stats.hit_rate == pytest.approx(2 / 3)
+
+    def test_invalid_capacity(self) -> None:
+        """Test that a capacity below one is rejected."""
+        with pytest.raises(ValueError, match="max_entries"):
+            SpecCache(max_entries=0)
+
+    def test_registry_cache_is_bounded(self, measure_registry_path: Path) -> None:
+        """Test that a registry with a capacity keeps at most that many specs."""
+        registry = MeasureRegistry(measure_registry_path, cache_size=2)
+        pinned = registry.pin("phq9", "1.0.0")
+        for measure_id in ("gad7", "fscrs", "phlms_10"):
+            registry.get(measure_id, "1.0.0")
+
+        assert len(registry._cache) == 2
+        assert registry.get("phq9", "1.0.0") is pinned
+        stats = registry.cache_stats()
+        assert stats.evictions == 2
+        assert stats.pinned == 1
@@ -0,0 +1,130 @@
+"""Tests for vectorized batch scoring."""
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from finalform.recoding.batch import recode_column  # noqa: E402
+from finalform.registry.models import MeasureSpec  # noqa: E402
+from finalform.scoring import ScoringEngine  # noqa: E402
+from finalform.scoring.batch import BatchScoringEngine, item_matrix  # noqa: E402
+
+
+def with_scale(spec: MeasureSpec, **changes) -> MeasureSpec:
+    """Copy a spec, changing its first scale."""
+    data = spec.model_dump()
+    data["scales"][0].update(changes)
+    return MeasureSpec.model_validate(data)
+
+
+def assert_matches_scalar(spec: MeasureSpec, values, missing) -> None:
+    """Assert every row scores exactly as the scalar engine scores it."""
+    columns = BatchScoringEngine().score(values, missing, spec)
+    engine = ScoringEngine()
+    for row in range(len(values)):
+        item_values = {
+            item.item_id: values[row, index].item()
+            for index, item in enumerate(spec.items)
+            if not missing[row, index]
+        }
+        expected = engine.score_values(item_values, spec)
+        assert [column.outcome(row) for column in columns] == expected
+
+
+class TestBatchScoringEngine:
+    """Tests for BatchScoringEngine."""
+
+    def test_matches_scalar_engine(self, phq9_spec, random_matrix) -> None:
+        """Test that scores, proration and errors match the scalar engine."""
+        values, missing = random_matrix(phq9_spec, 300, seed=0)
+
+        assert_matches_scalar(phq9_spec, values, missing)
+
+    @pytest.mark.parametrize("dtype", [np.int8, np.int16, np.uint8, np.float32])
+    def test_narrow_dtypes(self, phq9_spec, random_matrix, dtype) -> None:
+        """Test that narrow inputs are summed without overflowing."""
+        # Twelve copies of every item sum to about 130 on average, past
+        # int8's 127
+        spec = with_scale(
+            phq9_spec,
+            items=phq9_spec.scales[0].items * 12,
+            reversed_items=["phq9_item2"],
+            missing_allowed=108,
+        )
+        values, missing = random_matrix(spec, 300, seed=3)
+        values = values.astype(dtype)
+
+        assert_matches_scalar(spec, values, missing)
+
+    @pytest.mark.parametrize("method", ["sum", "average", "sum_then_double"])
+    @pytest.mark.parametrize("strategy", ["fail", "skip", "prorate"])
+    def test_methods_and_strategies(
+        self, phq9_spec, random_matrix, method: str, strategy: str
+    ) -> None:
+        """Test every method and missing strategy, with float values."""
+        spec = with_scale(
+            phq9_spec,
+            method=method,
+            missing_strategy=strategy,
+            missing_allowed=3,
+            reversed_items=["phq9_item2", "phq9_item5"],
+        )
+        values, missing = random_matrix(
+            spec, 300, seed=1, dtype=np.float64, fractions=(0.0, 0.1, 1 / 3)
+        )
+
+        assert_matches_scalar(spec, values, missing)
+
+    def test_repeated_and_unknown_scale_items(self, phq9_spec, random_matrix) -> None:
+        """Test scales listing an item twice, or an item the measure lacks."""
+        items = phq9_spec.scales[0].items
+        spec = with_scale(
+            phq9_spec,
+            items=[*items, items[0], "phq9_item99"],
+            reversed_items=[items[0], items[1], items[1]],
+            missing_allowed=4,
+        )
+        values, missing = random_matrix(spec, 300, seed=2)
+
+        assert_matches_scalar(spec, values, missing)
+
+    def test_error_messages(self, phq9_spec) -> None:
+        """Test the too-many-missing and no-values errors."""
+        spec = with_scale(phq9_spec, missing_allowed=9)
+        values = np.zeros((2, len(spec.items)), dtype=np.int64)
+        missing = np.zeros(values.shape, dtype=bool)
+        missing[0] = True
+        missing[1, :2] = True
+
+        lenient = BatchScoringEngine().score(values, missing, spec)[0]
+        strict = BatchScoringEngine().score(values, missing, phq9_spec)[0]
+
+        assert lenient.error(0) == "No values available for scoring"
+        assert lenient.error(1) is None
+        assert strict.error(0) == "Too many missing items: 9 missing, 1 allowed"
+        assert strict.error(1) == "Too many missing items: 2 missing, 1 allowed"
+
+    def test_wrong_shape_rejected(self, phq9_spec) -> None:
+        """Test that a matrix without one column per item is rejected."""
+        values = np.zeros((3, 2), dtype=np.int64)
+
+        with pytest.raises(ValueError, match="must both have shape"):
+            BatchScoringEngine().score(values, values == 0, phq9_spec)
+
+
+class TestItemMatrix:
+    """Tests for item_matrix."""
+
+    def test_stacks_recoded_columns(self, phq9_spec) -> None:
+        """Test that recoded columns feed the batch engine."""
+        answers = ["several days", None, "nearly every day", "not at all"]
+        columns = [
+            recode_column(answers, phq9_spec, f"phq9_item{number}") for number in range(1, 9)
+        ]
+
+        values, missing = item_matrix(columns, phq9_spec)
+
+        assert values.shape == (4, len(phq9_spec.items))
+        assert missing[:, 8].all()  # phq9_item9 has no column
+        assert values[:, 0].tolist() == [1, 0, 3, 0]
+        assert_matches_scalar(phq9_spec, values, missing)
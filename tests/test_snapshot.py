@@ -0,0 +1,189 @@
+"""Tests for precompiled registry snapshots."""
+
+import gc
+import json
+import os
+import shutil
+from pathlib import Path
+
+import pytest
+
+from finalform.registry import BindingRegistry, MeasureRegistry
+from finalform.registry.models import MeasureSpec
+from finalform.registry.snapshot import (
+    SnapshotError,
+    StaleSnapshotError,
+    compile_snapshot,
+    load_snapshot,
+    write_snapshot,
+)
+
+
+@pytest.fixture
+def registries(
+    tmp_path: Path, measure_registry_path: Path, binding_registry_path: Path
+) -> tuple[Path, Path]:
+    """Copy the repository registries to a scratch directory."""
+    measures = tmp_path / "measure-registry"
+    bindings = tmp_path / "form-binding-registry"
+    shutil.copytree(measure_registry_path, measures)
+    shutil.copytree(binding_registry_path, bindings)
+    return measures, bindings
+
+
+@pytest.fixture
+def snapshot_path(
+    tmp_path: Path,
+    registries: tuple[Path, Path],
+    measure_schema_path: Path,
+    binding_schema_path: Path,
+) -> Path:
+    """Compile and write a snapshot of the scratch registries."""
+    measures, bindings = registries
+    snapshot = compile_snapshot(
+        measures,
+        bindings,
+        measure_schema_path=measure_schema_path,
+        binding_schema_path=binding_schema_path,
+    )
+    path = tmp_path / "registry.snapshot"
+    write_snapshot(snapshot, path)
+    return path
+
+
+class TestRegistrySnapshot:
+    """Tests for compiling and loading registry snapshots."""
+
+    def test_snapshot_contains_all_specs(
+        self, snapshot_path: Path, registries: tuple[Path, Path]
+    ) -> None:
+        """Test that every spec file is captured in the snapshot."""
+        measures, bindings = registries
+        snapshot = load_snapshot(snapshot_path)
+
+        assert len(snapshot.measure_files) == len(list(measures.glob("measures/*/*.json")))
+        assert len(snapshot.binding_files) == len(list(bindings.glob("bindings/*/*.json")))
+        assert ("phq9", "1.0.0") in snapshot.measures()
+        assert ("intake_01", "1.0.0") in snapshot.bindings()
+
+    def test_registry_serves_specs_from_snapshot(
+        self,
+        snapshot_path: Path,
+        registries: tuple[Path, Path],
+        measure_schema_path: Path,
+    ) -> None:
+        """Test that snapshot specs match specs loaded from disk."""
+        measures, _ = registries
+        from_snapshot = MeasureRegistry(
+            measures, schema_path=measure_schema_path, snapshot=snapshot_path
+        )
+        from_disk = MeasureRegistry(measures, schema_path=measure_schema_path)
+
+        spec = from_snapshot.get("phq9", "1.0.0")
+        assert spec == from_disk.get("phq9", "1.0.0")
+        assert spec._compiled.plan is not None
+
+    def test_cache_size_bounds_snapshot_specs(
+        self, snapshot_path: Path, registries: tuple[Path, Path]
+    ) -> None:
+        """Test that only cached specs stay in memory when serving a snapshot."""
+        measures, _ = registries
+        snapshot = load_snapshot(snapshot_path)
+        keys = list(snapshot.measures())
+        assert len(keys) > 2
+        assert snapshot.specs == {}
+
+        def live_specs() -> int:
+            gc.collect()
+            return sum(isinstance(obj, MeasureSpec) for obj in gc.get_objects())
+
+        before = live_specs()
+        registry = MeasureRegistry(measures, snapshot=snapshot, cache_size=2)
+        for measure_id, version in keys:
+            registry.get(measure_id, version)
+
+        assert live_specs() - before == 2
+        assert registry.cache_stats().evictions == len(keys) - 2
+        # An evicted spec is read from the snapshot file again
+        first = registry.get(*keys[0])
+        assert first == MeasureRegistry(measures).get(*keys[0])
+
+    def test_binding_registry_uses_snapshot(
+        self, snapshot_path: Path, registries: tuple[Path, Path]
+    ) -> None:
+        """Test that the binding registry accepts the same snapshot."""
+        _, bindings = registries
+        registry = BindingRegistry(bindings, snapshot=snapshot_path)
+
+        assert registry.get("intake_01", "1.0.0").binding_id == "intake_01"
+
+    def test_edited_spec_is_stale(
+        self, snapshot_path: Path, registries: tuple[Path, Path]
+    ) -> None:
+        """Test that editing a spec in place invalidates the snapshot."""
+        measures, _ = registries
+        spec_file = measures / "measures" / "phq9" / "1-0-0.json"
+        data = json.loads(spec_file.read_text())
+        data["name"] = "Edited"
+        spec_file.write_text(json.dumps(data))
+
+        with pytest.raises(StaleSnapshotError, match="phq9/1-0-0.json changed"):
+            MeasureRegistry(measures, snapshot=snapshot_path)
+
+    def test_added_spec_is_stale(
+        self, snapshot_path: Path, registries: tuple[Path, Path]
+    ) -> None:
+        """Test that adding a spec version invalidates the snapshot."""
+        _, bindings = registries
+        source = bindings / "bindings" / "intake_01" / "1-0-0.json"
+        shutil.copy(source, source.with_name("1-1-0.json"))
+
+        with pytest.raises(StaleSnapshotError, match="added"):
+            BindingRegistry(bindings, snapshot=snapshot_path)
+
+    def test_removed_spec_is_stale(
+        self, snapshot_path: Path, registries: tuple[Path, Path]
+    ) -> None:
+        """Test that removing a spec invalidates the snapshot."""
+        measures, _ = registries
+        (measures / "measures" / "gad7" / "1-0-0.json").unlink()
+
+        with pytest.raises(StaleSnapshotError, match="removed"):
+            MeasureRegistry(measures, snapshot=snapshot_path)
+
+    def test_touched_spec_is_not_stale(
+        self, snapshot_path: Path, registries: tuple[Path, Path]
+    ) -> None:
+        """Test that a metadata-only change falls back to the content hash."""
+        measures, _ = registries
+        spec_file = measures / "measures" / "phq9" / "1-0-0.json"
+        os.utime(spec_file, ns=(0, 0))
+
+        registry = MeasureRegistry(measures, snapshot=snapshot_path)
+        assert registry.get("phq9", "1.0.0").measure_id == "phq9"
+
+    def test_different_schema_is_stale(
+        self, snapshot_path: Path, registries: tuple[Path, Path], tmp_path: Path
+    ) -> None:
+        """Test that a snapshot validated with another schema is rejected."""
+        measures, _ = registries
+        other_schema = tmp_path / "other.schema.json"
+        other_schema.write_text(json.dumps({"type": "object"}))
+
+        with pytest.raises(StaleSnapshotError, match="schema"):
+            MeasureRegistry(measures, schema_path=other_schema, snapshot=snapshot_path)
+
+    def test_missing_snapshot_file(self, registries: tuple[Path, Path], tmp_path: Path) -> None:
+        """Test that a missing snapshot file raises SnapshotError."""
+        measures, _ = registries
+
+        with pytest.raises(SnapshotError, match="not found"):
+            MeasureRegistry(measures, snapshot=tmp_path / "missing.snapshot")
+
+    def test_corrupt_snapshot_file(self, tmp_path: Path) -> None:
+        """Test that a file that is not a snapshot is rejected."""
+        path = tmp_path / "corrupt.snapshot"
+        path.write_bytes(b"not a pickle")
+
+        with pytest.raises(SnapshotError):
+            load_snapshot(path)
@@ -240,6 +240,44 @@ class TestValidator:
         assert result.valid is False
         assert any("unknown scale" in e.lower() for e in result.errors)
 
+    @pytest.mark.parametrize("measure_id", ["phq9", "fscrs", "msi"])
+    def test_validate_all_scales(
+        self,
+        validator: Validator,
+        measure_registry_path: Path,
+        measure_schema_path: Path,
+        measure_id: str,
+    ) -> None:
+        """Test that validate_all_scales matches validate_for_scale per scale."""
+        registry = MeasureRegistry(measure_registry_path, schema_path=measure_schema_path)
+        spec = registry.get_latest(measure_id)
+        # Cycle through present, out-of-range, missing and absent items
+        items = [
+            RecodedItem(
+                measure_id=measure_id,
+                measure_version=spec.version,
+                item_id=item.item_id,
+                value=[1, 99, None][n % 4],
+                raw_answer=None,
+                missing=n % 4 == 2,
+            )
+            for n, item in enumerate(spec.items)
+            if n % 4 != 3
+        ]
+        section = RecodedSection(
+            measure_id=measure_id, measure_version=spec.version, items=items
+        )
+
+        results = validator.validate_all_scales(section, spec)
+
+        assert list(results) == [scale.scale_id for scale in spec.scales]
+        for scale in spec.scales:
+            assert results[scale.scale_id] == validator.validate_for_scale(
+                section, spec, scale.scale_id
+            )
+        assert any(result.out_of_range_items for result in results.values())
+        assert any(result.missing_items for result in results.values())
+
     def test_validation_result_properties(self) -> None:
         """Test ValidationResult properties."""
         result = ValidationResult(
@@ -0,0 +1,78 @@
+"""Tests for vectorized batch validation."""
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from finalform.recoding import RecodedItem, RecodedSection  # noqa: E402
+from finalform.registry.models import MeasureSpec  # noqa: E402
+from finalform.validation import Validator  # noqa: E402
+from finalform.validation.batch import BatchValidator  # noqa: E402
+
+
+def assert_matches_scalar(spec: MeasureSpec, values, missing) -> None:
+    """Assert every row validates exactly as Validator validates it."""
+    columns = BatchValidator().validate(values, missing, spec)
+    validator = Validator()
+    for row in range(len(values)):
+        section = RecodedSection(
+            measure_id=spec.measure_id,
+            measure_version=spec.version,
+            items=[
+                RecodedItem(
+                    measure_id=spec.measure_id,
+                    measure_version=spec.version,
+                    item_id=item.item_id,
+                    value=None if missing[row, index] else values[row, index].item(),
+                    raw_answer=None,
+                    missing=bool(missing[row, index]),
+                )
+                for index, item in enumerate(spec.items)
+            ],
+        )
+        expected = validator.validate(section, spec)
+        assert columns.result(row) == expected
+        assert columns.missing_count[row] == expected.missing_count
+
+
+class TestBatchValidator:
+    """Tests for BatchValidator."""
+
+    @pytest.mark.parametrize("dtype", [np.int64, np.float64])
+    def test_matches_validator(self, phq9_spec, random_matrix, dtype) -> None:
+        """Test that ranges, missing items and errors match Validator."""
+        # spread=1 puts some values just out of range
+        values, missing = random_matrix(phq9_spec, 300, seed=0, dtype=dtype, spread=1)
+
+        assert_matches_scalar(phq9_spec, values, missing)
+
+    def test_repeated_item(self, phq9_spec, random_matrix) -> None:
+        """Test a measure listing an item twice."""
+        data = phq9_spec.model_dump()
+        data["items"].append(data["items"][0])
+        spec = MeasureSpec.model_validate(data)
+        values, missing = random_matrix(spec, 300, seed=1, spread=1)
+
+        assert_matches_scalar(spec, values, missing)
+
+    def test_masks(self, phq9_spec) -> None:
+        """Test the out-of-range mask and validity."""
+        values = np.zeros((2, len(phq9_spec.items)), dtype=np.int64)
+        missing = np.zeros(values.shape, dtype=bool)
+        values[0, 0] = 4
+        values[1, 1] = 9
+        missing[1, 1] = True
+
+        columns = BatchValidator().validate(values, missing, phq9_spec)
+
+        assert columns.out_of_range[0].tolist() == [True] + [False] * 9
+        assert not columns.out_of_range[1].any()
+        assert columns.valid.tolist() == [False, True]
+        assert columns.completeness.tolist() == [1.0, 0.9]
+
+    def test_wrong_shape_rejected(self, phq9_spec) -> None:
+        """Test that a matrix without one column per item is rejected."""
+        values = np.zeros((3, 2), dtype=np.int64)
+
+        with pytest.raises(ValueError, match="must both have shape"):
+            BatchValidator().validate(values, values == 0, phq9_spec)
@@ -0,0 +1,195 @@
+"""Tests for hot reloading of registries."""
+
+import json
+import os
+import shutil
+from pathlib import Path
+
+import pytest
+
+from finalform.pipeline import Pipeline, PipelineConfig
+from finalform.registry import BindingRegistry, MeasureRegistry, RegistryWatcher, ReloadEvent
+from finalform.registry.measures import MeasureNotFoundError
+from finalform.registry.models import MeasureSpec
+
+
+@pytest.fixture
+def registries(
+    tmp_path: Path, measure_registry_path: Path, binding_registry_path: Path
+) -> tuple[Path, Path]:
+    """Copy the repository registries to a scratch directory."""
+    measures = tmp_path / "measure-registry"
+    bindings = tmp_path / "form-binding-registry"
+    shutil.copytree(measure_registry_path, measures)
+    shutil.copytree(binding_registry_path, bindings)
+    return measures, bindings
+
+
+def edit_spec(path: Path, **changes: object) -> None:
+    """Rewrite a spec file with top-level fields changed and a new mtime."""
+    data = json.loads(path.read_text())
+    data.update(changes)
+    mtime_ns = path.stat().st_mtime_ns + 1_000_000_000
+    path.write_text(json.dumps(data))
+    os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+class TestRegistryWatcher:
+    """Tests for RegistryWatcher."""
+
+    def test_first_poll_has_no_events(self, registries: tuple[Path, Path]) -> None:
+        """Test that the first poll only records the current state."""
+        measures, bindings = registries
+        watcher = RegistryWatcher(MeasureRegistry(measures), BindingRegistry(bindings))
+
+        assert watcher.poll() == []
+        assert watcher.poll() == []
+
+    def test_changed_spec_is_swapped_in(
+        self, registries: tuple[Path, Path], measure_schema_path: Path
+    ) -> None:
+        """Test that an edited spec replaces the cached one."""
+        measures, _ = registries
+        registry = MeasureRegistry(measures, schema_path=measure_schema_path)
+        old_spec = registry.get("phq9", "1.0.0")
+        watcher = RegistryWatcher(registry)
+        watcher.poll()
+
+        spec_file = measures / "measures" / "phq9" / "1-0-0.json"
+        edit_spec(spec_file, name="Edited PHQ-9")
+        events = watcher.poll()
+
+        assert events == [ReloadEvent("measure", "changed", "phq9", "1.0.0", spec_file)]
+        new_spec = registry.get("phq9", "1.0.0")
+        assert new_spec.name == "Edited PHQ-9"
+        assert new_spec._compiled.plan is not None
+        assert old_spec.name != "Edited PHQ-9"
+
+    def test_invalid_spec_keeps_previous(
+        self, registries: tuple[Path, Path], measure_schema_path: Path
+    ) -> None:
+        """Test that a spec that fails to reload keeps its old version and is retried."""
+        measures, _ = registries
+        registry = MeasureRegistry(measures, schema_path=measure_schema_path)
+        registry.get("phq9", "1.0.0")
+        watcher = RegistryWatcher(registry)
+        watcher.poll()
+
+        spec_file = measures / "measures" / "phq9" / "1-0-0.json"
+        items = json.loads(spec_file.read_text())["items"]
+        edit_spec(spec_file, items="not a list")
+        (event,) = watcher.poll()
+
+        assert event.change == "changed"
+        assert event.error is not None
+        assert "reload failed" in str(event)
+        assert registry.get("phq9", "1.0.0").name == "Patient Health Questionnaire-9"
+
+        edit_spec(spec_file, items=items, name="Fixed")
+        (event,) = watcher.poll()
+        assert event.error is None
+        assert registry.get("phq9", "1.0.0").name == "Fixed"
+
+    def test_added_version_updates_latest(self, registries: tuple[Path, Path]) -> None:
+        """Test that publishing a version is picked up by get_latest."""
+        measures, _ = registries
+        registry = MeasureRegistry(measures)
+        assert registry.get_latest("gad7").version == "1.0.0"
+        watcher = RegistryWatcher(registry)
+        watcher.poll()
+
+        source = measures / "measures" / "gad7" / "1-0-0.json"
+        target = source.with_name("1-1-0.json")
+        shutil.copy(source, target)
+        edit_spec(target, version="1.1.0")
+
+        (event,) = watcher.poll()
+        assert event.change == "added"
+        assert event.version == "1.1.0"
+        assert registry.get_latest("gad7").version == "1.1.0"
+
+    def test_removed_spec_is_evicted(self, registries: tuple[Path, Path]) -> None:
+        """Test that a deleted spec is no longer served."""
+        measures, _ = registries
+        registry = MeasureRegistry(measures)
+        registry.get("gad7", "1.0.0")
+        watcher = RegistryWatcher(registry)
+        watcher.poll()
+
+        (measures / "measures" / "gad7" / "1-0-0.json").unlink()
+        (event,) = watcher.poll()
+
+        assert event.change == "removed"
+        with pytest.raises(MeasureNotFoundError):
+            registry.get("gad7", "1.0.0")
+
+    def test_reload_during_load_is_not_cached(
+        self, registries: tuple[Path, Path], monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that a spec loaded across a reload is returned but not cached."""
+        measures, _ = registries
+        registry = MeasureRegistry(measures)
+        spec_file = measures / "measures" / "phq9" / "1-0-0.json"
+        load = registry._load
+
+        def load_then_reload(measure_id: str, version: str) -> MeasureSpec:
+            spec = load(measure_id, version)
+            # The file changes and is reloaded before get() caches its result
+            edit_spec(spec_file, name="Edited PHQ-9")
+            registry.reload_specs([(measure_id, version)])
+            return spec
+
+        monkeypatch.setattr(registry, "_load", load_then_reload)
+        stale = registry.get("phq9", "1.0.0")
+        monkeypatch.undo()
+
+        assert stale.name != "Edited PHQ-9"
+        assert ("phq9", "1.0.0") not in registry._cache
+        assert registry.get("phq9", "1.0.0").name == "Edited PHQ-9"
+
+    def test_subscribers_receive_events(self, registries: tuple[Path, Path]) -> None:
+        """Test that subscribers are called with each batch of events."""
+        _, bindings = registries
+        watcher = RegistryWatcher(BindingRegistry(bindings))
+        received: list[list[ReloadEvent]] = []
+        watcher.subscribe(received.append)
+        watcher.poll()
+
+        edit_spec(bindings / "bindings" / "intake_01" / "1-0-0.json", description="Edited")
+        watcher.poll()
+
+        assert len(received) == 1
+        assert received[0][0].registry == "binding"
+
+
+class TestPipelineReload:
+    """Tests for Pipeline hot reloading."""
+
+    def test_pipeline_resolves_reloaded_specs(
+        self,
+        registries: tuple[Path, Path],
+        measure_schema_path: Path,
+        binding_schema_path: Path,
+    ) -> None:
+        """Test that the pipeline swaps in specs reloaded by its watcher."""
+        measures, bindings = registries
+        pipeline = Pipeline(
+            PipelineConfig(
+                measure_registry_path=measures,
+                binding_registry_path=bindings,
+                binding_id="example_intake",
+                binding_version="1.0.0",
+                measure_schema_path=measure_schema_path,
+                binding_schema_path=binding_schema_path,
+            )
+        )
+        watcher = pipeline.watch(interval=3600)
+        try:
+            edit_spec(measures / "measures" / "phq9" / "1-0-0.json", name="Edited PHQ-9")
+            watcher.poll()
+
+            assert pipeline.measures["phq9"].name == "Edited PHQ-9"
+        finally:
+            pipeline.close()
+
+        assert pipeline.watcher is None